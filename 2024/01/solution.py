@@ -1,44 +1,37 @@
+from __future__ import annotations
+
 import typing as t
-from pathlib import Path
-from collections import defaultdict
-
-
-def parse(inputString: str):
-    def parseLine(line: str) -> t.Tuple[int, int]:
-        res = list(map(int, line.split()))
-        return res
-
-    return list(
-        zip(*[parseLine(line) for line in inputString.split("\n") if line.strip()])
-    )
-
-
-def solve1(input: str) -> int:
-    list1, list2 = parse(input)
-    list1 = sorted(list1)
-    list2 = sorted(list2)
-    return sum(abs(a - b) for a, b in zip(list1, list2))
-
-
-def solve2(input: str) -> int:
-    list1, list2 = parse(input)
-    counts = defaultdict(int)
-    for number in list2:
-        counts[number] += 1
-    return sum(number * counts[number] for number in list1)
-
-
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    print(
-        f'Solution 1 (test):{solve1((solutionDirectory / "data-01-test.txt").read_text())}'
-    )
-    print(
-        f'Solution 1:       {solve1((solutionDirectory / "data-01.txt").read_text())}'
-    )
-    print(
-        f'Solution 2 (test):{solve2((solutionDirectory / "data-01-test.txt").read_text())}'
-    )
-    print(
-        f'Solution 2:       {solve2((solutionDirectory / "data-01.txt").read_text())}'
-    )
+
+from aoc.inputs import Input
+from aoc.ints import extractRows
+from aoc.lazy import lazyImport
+
+np = lazyImport("numpy")
+
+# parse gets a memory-mapped Input (see aoc.inputs)
+STREAMING = True
+
+
+def parse(source: Input) -> t.Tuple[np.ndarray, np.ndarray]:
+    return tuple(extractRows(source.view()).matrix(2).T)
+
+
+def solve1(model) -> int:
+    list1, list2 = model
+    return int(np.abs(np.sort(list1) - np.sort(list2)).sum())
+
+
+def solve2(model) -> int:
+    list1, list2 = model
+    numbers, counts = np.unique(list2, return_counts=True)
+    # Position of each left number among the right ones, and whether it is there
+    idx = np.minimum(np.searchsorted(numbers, list1), len(numbers) - 1)
+    found = numbers[idx] == list1
+    return int((list1 * np.where(found, counts[idx], 0)).sum())
+
+
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "data-01-test.txt": (None, None),
+    "data-01.txt": (None, None),
+}
@@ -1,14 +1,20 @@
 import typing as t
-from pathlib import Path
 
+from aoc.inputs import Input
+from aoc.ints import extractRows
+from aoc.trace import getTracer
 
-def parse(inputString: str) -> t.List[t.Tuple[int, ...]]:
-    lines = inputString.split("\n")
+trace = getTracer("2024/02")
 
-    def lineToLevel(line: str) -> t.Tuple[int]:
-        return tuple(list(map(int, line.split())))
+# parse gets a memory-mapped Input (see aoc.inputs)
+STREAMING = True
 
-    return list(map(lineToLevel, lines))
+
+def parse(source: Input) -> t.List[t.List[int]]:
+    return extractRows(source.view()).rows()
+
+
+VALIDITY = ["invalid", "valid"]
 
 
 def calculate_diffs(ints: t.Iterable[int]) -> t.Iterable[int]:
@@ -19,8 +25,7 @@ def calculate_diffs(ints: t.Iterable[int]) -> t.Iterable[int]:
         prev = curr
 
 
-def solve1(input: str) -> int:
-    levels = parse(input)
+def solve1(levels: t.List[t.Tuple[int, ...]]) -> int:
 
     def validate_level(level: t.Tuple[int, ...]) -> bool:
         prev = None
@@ -37,14 +42,13 @@ def solve1(input: str) -> int:
     total = 0
     for idx, level in enumerate(levels):
         res = validate_level(level)
-        print(f"line {idx+1}: {['invalid', 'valid'][res]} ({level})")
+        trace.debug("line %d: %s (%s)", idx + 1, VALIDITY[res], level)
         total += res
 
     return total
 
 
-def solve2(input: str) -> int:
-    levels = parse(input)
+def solve2(levels: t.List[t.Tuple[int, ...]]) -> int:
 
     def validate_level(level: t.Tuple[int, ...]) -> t.Tuple[bool, int]:
         prev = None
@@ -61,14 +65,14 @@ def solve2(input: str) -> int:
     total = 0
     for lineNr, level in enumerate(levels):
         res, idx = validate_level(level)
-        print(f"line {lineNr+1}: {['invalid', 'valid'][res]} ({idx}) ({level})")
+        trace.debug("line %d: %s (%d) (%s)", lineNr + 1, VALIDITY[res], idx, level)
         if res:
             total += res
             continue
         for idx in range(len(level)):
             _level = [val for _idx, val in enumerate(level) if _idx != idx]
             _res, _ = validate_level(_level)
-            print(f" line {lineNr+1}:{idx}: {['invalid', 'valid'][_res]} ({_level})")
+            trace.debug(" line %d:%d: %s (%s)", lineNr + 1, idx, VALIDITY[_res], _level)
             if _res:
                 total += 1
                 break
@@ -76,23 +80,8 @@ def solve2(input: str) -> int:
     return total
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
-
-
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
-
-    # run(solve1, testString, 2)
-    # run(solve1, dataString)
-    run(solve2, testString, 4)
-    run(solve2, dataString, 363)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (2, 4),
+    "data.txt": (None, 363),
+}
@@ -1,19 +1,25 @@
 import typing as t
-from pathlib import Path
 import re
 
+from aoc.inputs import Input
+from aoc.trace import getTracer
 
-def parse(inputString: str):
-    regex = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
-    matches = regex.findall(inputString)
-    return [(int(a), int(b)) for a, b in matches]
+trace = getTracer("2024/03")
 
+# parse gets a memory-mapped Input (see aoc.inputs)
+STREAMING = True
 
-def parse2(inputString: str):
-    regex = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+
+Instruction = t.Tuple[int, int, bool]
+
+INSTRUCTIONS = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+
+
+def parse(source: Input) -> t.List[Instruction]:
+    """Every mul(a,b) together with whether do()/don't() left it enabled."""
     enabled = True
-    matches = regex.findall(inputString)
-    data: t.List[t.Tuple[int, int]] = list()
+    matches = INSTRUCTIONS.findall(source.view())
+    data: t.List[Instruction] = list()
     for f1, f2, do, dont in matches:
         if do:
             enabled = True
@@ -21,46 +27,24 @@ def parse2(inputString: str):
         if dont:
             enabled = False
             continue
-        if enabled:
-            data.append((int(f1), int(f2)))
+        data.append((int(f1), int(f2), enabled))
 
     return data
 
 
-def solve1(input: str) -> int:
-    print(input)
-    data = parse(input)
-    print(data)
-    return sum(a * b for a, b in data)
-
-
-def solve2(input: str) -> int:
-    print(input)
-    data = parse2(input)
-    print(data)
-    return sum(a * b for a, b in data)
-
+def solve1(data: t.List[Instruction]) -> int:
+    trace.debug("%s", data)
+    return sum(a * b for a, b, _ in data)
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
 
+def solve2(data: t.List[Instruction]) -> int:
+    trace.debug("%s", data)
+    return sum(a * b for a, b, enabled in data if enabled)
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
-    testString2 = (
-        "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
-    )
 
-    # run(solve1, testString, 161)
-    # run(solve1, dataString)
-    run(solve2, testString2, 48)
-    run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (161, None),
+    "test2.txt": (None, 48),
+    "data.txt": (None, None),
+}
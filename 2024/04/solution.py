@@ -1,33 +1,38 @@
+from __future__ import annotations
+
 import typing as t
-from pathlib import Path
 
-import numpy as np
+from aoc.grid import OUTSIDE, loadArray
+from aoc.lazy import lazyImport
+from aoc.trace import DEBUG, getTracer
+
+np = lazyImport("numpy")
+
+trace = getTracer("2024/04")
 
 
-def parse(inputString: str):
-    return inputString.split("\n")
+def parse(inputString: str) -> np.ndarray:
+    return loadArray(inputString)
 
 
 directions = [
-    np.array(coord)
-    for coord in [
-        (-1, +1),
-        (-1, +0),
-        (-1, -1),
-        (+0, +1),
-        (-0, -1),
-        (+1, +1),
-        (+1, +0),
-        (+1, -1),
-    ]
+    (-1, +1),
+    (-1, +0),
+    (-1, -1),
+    (+0, +1),
+    (-0, -1),
+    (+1, +1),
+    (+1, +0),
+    (+1, -1),
 ]
 
 
 def getWordAtCordInDirection(data, rowIdx, colIdx, direction) -> t.Optional[str]:
-    charIdx = np.array([rowIdx, colIdx])
+    startRow, startCol = rowIdx, colIdx
+    rowStep, colStep = direction
     word = ""
     for charNr in range(4):
-        rowIdx, colIdx = charIdx + direction * charNr
+        rowIdx, colIdx = startRow + rowStep * charNr, startCol + colStep * charNr
         if rowIdx < 0 or rowIdx >= len(data):
             return None
         row = data[rowIdx]
@@ -79,9 +84,14 @@ def evaluateWordAtCoord(data, rowIdx, colIdx) -> int:
     return total
 
 
-def solve1(input: str) -> int:
-    data = parse(input)
-    print(data)
+def asLines(grid: np.ndarray) -> t.List[str]:
+    """The map rows as strings, for the cell-by-cell search."""
+    return [row.tobytes().decode("latin-1") for row in grid]
+
+
+def solve1(grid: np.ndarray) -> int:
+    data = asLines(grid)
+    trace.debug("%s", data)
     count = 0
     for rowIdx in range(len(data)):
         for colIdx in range(len(data[rowIdx])):
@@ -100,13 +110,13 @@ def evaluateXAtCoord(data, rowIdx, colIdx) -> int:
         return 0
     if word2 != "MAS" and word2 != "SAM":
         return 0
-    print(f"Found X-MAS at {rowIdx}, {colIdx}")
+    trace.debug("Found X-MAS at %d, %d", rowIdx, colIdx)
     return 1
 
 
-def solve2(input: str) -> int:
-    data = parse(input)
-    print(data)
+def solve2(grid: np.ndarray) -> int:
+    data = asLines(grid)
+    trace.debug("%s", data)
     count = 0
     for rowIdx in range(1, len(data) - 1):
         for colIdx in range(1, len(data[rowIdx]) - 1):
@@ -115,23 +125,57 @@ def solve2(input: str) -> int:
     return count
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
+# === Mask search =========================================================
+
+# Compares whole shifted copies of the map with each letter of the word at
+# once instead of visiting cells one by one.
+
+
+def shifted(padded: np.ndarray, pad: int, rowStep: int, colStep: int) -> np.ndarray:
+    """View of ``padded`` where [row, col] holds the cell ``steps`` away from it."""
+    height, width = padded.shape[0] - 2 * pad, padded.shape[1] - 2 * pad
+    rowStart, colStart = pad + rowStep, pad + colStep
+    return padded[rowStart : rowStart + height, colStart : colStart + width]
+
+
+def wordMask(data: np.ndarray, word: str, direction: t.Tuple[int, int]) -> np.ndarray:
+    """True where ``word`` starts and runs on in ``direction``."""
+    pad = len(word)
+    padded = np.pad(data, pad, constant_values=OUTSIDE)
+    rowStep, colStep = direction
+    mask = np.ones(data.shape, dtype=bool)
+    for charNr, char in enumerate(word.encode()):
+        mask &= shifted(padded, pad, rowStep * charNr, colStep * charNr) == char
+    return mask
+
+
+def solve1Masks(data: np.ndarray) -> int:
+    trace.debug("%s", data)
+    return sum(int(wordMask(data, "XMAS", direction).sum()) for direction in directions)
+
+
+def solve2Masks(data: np.ndarray) -> int:
+    trace.debug("%s", data)
+    # Each diagonal of the X reads MAS or SAM through the centre
+    diagonals = [
+        wordMask(data, "MAS", (+1, +1)) | wordMask(data, "SAM", (+1, +1)),
+        wordMask(data, "MAS", (-1, +1)) | wordMask(data, "SAM", (-1, +1)),
+    ]
+    # Line the masks up on the centre "A": start cells are one step back
+    padded = [np.pad(mask, 1) for mask in diagonals]
+    found = shifted(padded[0], 1, -1, -1) & shifted(padded[1], 1, +1, -1)
+    if trace.enabled(DEBUG):
+        for rowIdx, colIdx in np.argwhere(found):
+            trace.debug("Found X-MAS at %d, %d", rowIdx, colIdx)
+    return int(found.sum())
+
 
+# Faster solvers checked against solve1/solve2 by `python -m aoc diff`
+ENGINES = {"masks": {1: solve1Masks, 2: solve2Masks}}
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
 
-    # run(solve1, testString, expected=18)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=9)
-    run(solve2, dataString, expected=1976)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (18, 9),
+    "data.txt": (None, None),
+}
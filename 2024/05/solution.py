@@ -1,21 +1,17 @@
 import typing as t
-from pathlib import Path
 from collections import defaultdict
 
+from aoc.ints import extractRows
+from aoc.trace import getTracer
 
-def parse(inputString: str):
-    orderingStr, contentStr = inputString.split("\n\n")
+trace = getTracer("2024/05")
 
-    def parseOrdering(s: str) -> t.Tuple[int, int]:
-        a, b = s.strip().split("|")
-        return int(a), int(b)
 
-    def parseContent(s: str) -> t.List[int]:
-        return list(map(int, s.split(",")))
+def parse(inputString: str):
+    orderingStr, contentStr = inputString.split("\n\n")
 
-    orderings = list(map(parseOrdering, orderingStr.strip().split("\n")))
-    # print(orderings)
-    contents = list(map(parseContent, contentStr.strip().split("\n")))
+    orderings = extractRows(orderingStr.strip()).matrix(2).tolist()
+    contents = extractRows(contentStr.strip()).rows()
 
     leading = defaultdict(list)
     trailing = defaultdict(list)
@@ -24,7 +20,7 @@ def parse(inputString: str):
         trailing[first].append(second)
         leading[second].append(first)
 
-    return contents, leading, trailing
+    return contents, dict(leading), dict(trailing)
 
 
 def validateContent(
@@ -35,30 +31,30 @@ def validateContent(
     for idx, number in enumerate(content):
         leadingNumbers = content[:idx]
         for leadingNumber in leadingNumbers:
-            if leadingNumber in trailing[number]:
-                print(f"{leadingNumber} came before {number}")
+            if leadingNumber in trailing.get(number, ()):
+                trace.debug("%d came before %d", leadingNumber, number)
                 return False
 
         trailingNumbers = content[idx + 1 :]
         for trailingNumber in trailingNumbers:
-            if trailingNumber in leading[number]:
-                print(f"{trailingNumber} came after {number}")
+            if trailingNumber in leading.get(number, ()):
+                trace.debug("%d came after %d", trailingNumber, number)
                 return False
     return True
 
 
-def solve1(input: str) -> int:
-    contents, leading, trailing = parse(input)
+def solve1(model) -> int:
+    contents, leading, trailing = model
     total = 0
     for idx, content in enumerate(contents):
         valid = validateContent(content, leading, trailing)
         if not valid:
-            print(f"Row {idx} is not valid: {content}")
+            trace.debug("Row %d is not valid: %s", idx, content)
             continue
-        print(f"Row {idx} is valid: {content}")
+        trace.debug("Row %d is valid: %s", idx, content)
         middleIndex = len(content) // 2
         middleNumber = content[middleIndex]
-        print(f"Middle number: {middleNumber}")
+        trace.debug("Middle number: %d", middleNumber)
         total += content[middleIndex]
     return total
 
@@ -71,15 +67,15 @@ def reorderContent(
     numberToIndex = defaultdict(int)
 
     for number in content:
-        order = sum(1 for num in content if num in leading[number])
+        order = sum(1 for num in content if num in leading.get(number, ()))
         numberToIndex[order] = number
 
     middleIndex = len(content) // 2
     return numberToIndex[middleIndex]
 
 
-def solve2(input: str) -> int:
-    contents, leading, trailing = parse(input)
+def solve2(model) -> int:
+    contents, leading, trailing = model
     total = 0
     for idx, content in enumerate(contents):
         valid = validateContent(content, leading, trailing)
@@ -90,23 +86,8 @@ def solve2(input: str) -> int:
     return total
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
-
-
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
-
-    # run(solve1, testString, expected=143)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=123)
-    run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (143, 123),
+    "data.txt": (None, None),
+}
@@ -1,189 +1,178 @@
-from collections import defaultdict
-import pydantic
 import typing as t
-from pathlib import Path
+from dataclasses import dataclass
 
+from aoc.grid import OUTSIDE, UP, Grid
+from aoc.progress import track
+from aoc.render import Frames, gridCanvas, interior, text
+from aoc.trace import DEBUG, getTracer
 
-class Position(t.NamedTuple):
-    row: int
-    col: int
+trace = getTracer("2024/06")
 
-    def __add__(self, other: "Position") -> "Position":
-        return Position(self.row + other.row, self.col + other.col)
+OBSTICLE = ord("#")
 
-    def __repr__(self):
-        return f"P({self.row}, {self.col})"
 
+@dataclass
+class Model:
+    grid: Grid
+    startingPosition: int
 
-DIRECTIONS = [
-    Position(-1, 0),
-    Position(0, 1),
-    Position(1, 0),
-    Position(0, -1),
-]
-DIRECTION_2_INDEX = {direction: idx for idx, direction in enumerate(DIRECTIONS)}
-DIRECTION_NAMES = ["Up", "Right", "Down", "Left"]
-DIRECTION_2_NAME = {
-    direction: DIRECTION_NAMES[idx] for idx, direction in enumerate(DIRECTIONS)
-}
-
-
-def setCharAt(string: str, pos: int, char: str):
-    return string[:pos] + char + string[pos + 1 :]
-
+    def isOccupied(self, pos: int) -> bool:
+        return self.grid[pos] == OBSTICLE
 
-class Model(pydantic.BaseModel):
-    height: int
-    width: int
-    startingPosition: Position
-    obsticles: t.Set[Position]
-
-    def withinBounds(self, pos: Position):
-        return (
-            pos.row >= 0
-            and pos.col >= 0
-            and pos.row < self.height
-            and pos.col < self.width
-        )
-
-    def modelCopyWithStart(self, start: Position) -> "Model":
-        return Model(
-            height=self.height,
-            width=self.width,
-            startingPosition=start,
-            obsticles=self.obsticles.copy(),
+    def asString(
+        self,
+        position: t.Optional[int] = None,
+        extraObsticles: t.Optional[t.Set[int]] = None,
+    ) -> str:
+        position = self.startingPosition if position is None else position
+        return text(
+            self.grid.draw(
+                (list(extraObsticles or ()), "O"),
+                ([self.startingPosition], "."),
+                ([position], "^"),
+            )
         )
 
-    def isOccupied(self, pos: Position):
-        return pos in self.obsticles
 
-    def print(
-        self,
-        position: t.Optional[Position] = None,
-        extraObsticles: t.Optional[t.Set[Position]] = None,
-    ):
-        _map = ["." * self.width for _ in range(self.height)]
-        position = position or self.startingPosition
-        _map[position.row] = setCharAt(_map[position.row], position.col, "^")
-        for obsticle in self.obsticles:
-            _map[obsticle.row] = setCharAt(_map[obsticle.row], obsticle.col, "#")
-        for obsticle in extraObsticles or set():
-            _map[obsticle.row] = setCharAt(_map[obsticle.row], obsticle.col, "O")
-
-        print("\n".join(_map))
+def parse(inputString: str) -> Model:
+    grid = Grid.fromString(inputString)
+    return Model(grid=grid, startingPosition=grid.find("^"))
 
 
-def parse(inputString: str) -> Model:
-    lines = inputString.split("\n")
-    model = Model(
-        height=len(lines),
-        width=len(lines[0]),
-        startingPosition=Position(-1, -1),
-        obsticles=set(),
-    )
-    for rowIdx, line in enumerate(lines):
-        for colIdx, char in enumerate(line):
-            if char == "#":
-                model.obsticles.add(Position(rowIdx, colIdx))
-            if char == "^":
-                model.startingPosition = Position(rowIdx, colIdx)
-
-    return model
-
-
-def solve1(input: str) -> int:
-    model = parse(input)
+def solve1(model: Model) -> int:
+    cells, directions = model.grid.cells, model.grid.directions
     pos = model.startingPosition
-    directionIdx = 0
-    visited: t.Set[Position] = set()
-    while model.withinBounds(pos):
-        visited.add(pos)
-        step = DIRECTIONS[directionIdx]
-        nextPos = pos + step
-        if not model.isOccupied(nextPos):
+    directionIdx = UP
+    visited = bytearray(len(cells))
+    while cells[pos] != OUTSIDE:
+        visited[pos] = 1
+        nextPos = pos + directions[directionIdx]
+        if cells[nextPos] != OBSTICLE:
             pos = nextPos
             continue
-        directionIdx = (directionIdx + 1) % len(DIRECTIONS)
-
-    return len(visited)
-
-
-def walkPath(model: Model, startDirection: Position):
-    visitedWithDirections: t.Dict[Position, t.Set[int]] = defaultdict(set)
-    pos = model.startingPosition
-    directionIdx = DIRECTION_2_INDEX[startDirection]
-
-    while model.withinBounds(pos):
-        step = DIRECTIONS[directionIdx]
-        if step in visitedWithDirections[pos]:
-            return pos, step
-        visitedWithDirections[pos].add(step)
-
-        nextPos = pos + step
-        if not model.isOccupied(nextPos):
+        directionIdx = (directionIdx + 1) % 4
+
+    return sum(visited)
+
+
+def walkPath(
+    model: Model,
+    start: int,
+    startDirection: int,
+    extraObsticle: t.Optional[int] = None,
+) -> t.Optional[t.Tuple[int, int]]:
+    """Walk until the guard leaves the map (None) or loops: (position, direction).
+
+    The extra obsticle is checked on the side so the shared model is never
+    copied or modified per candidate.
+    """
+    cells, directions = model.grid.cells, model.grid.directions
+    # One bit per direction the guard has left a cell in
+    visitedWithDirections = bytearray(len(cells))
+    pos = start
+    directionIdx = startDirection
+
+    while cells[pos] != OUTSIDE:
+        bit = 1 << directionIdx
+        if visitedWithDirections[pos] & bit:
+            return pos, directionIdx
+        visitedWithDirections[pos] |= bit
+
+        nextPos = pos + directions[directionIdx]
+        if nextPos != extraObsticle and cells[nextPos] != OBSTICLE:
             pos = nextPos
             continue
-        directionIdx = (directionIdx + 1) % len(DIRECTIONS)
+        directionIdx = (directionIdx + 1) % 4
     return None
 
 
-def solve2(input: str) -> int:
-    model = parse(input)
+def solve2(model: Model) -> int:
+    cells, directions = model.grid.cells, model.grid.directions
     pos = model.startingPosition
-    directionIdx = 0
-    visitedWithDirections: t.Dict[Position, t.List[int]] = defaultdict(list)
-
-    newObsticles: t.Set[Position] = set()
+    directionIdx = UP
+    visited = bytearray(len(cells))
 
-    while model.withinBounds(pos):
-        step = DIRECTIONS[directionIdx]
+    newObsticles: t.Set[int] = set()
+    progress = track("2024/06 part 2", unit="walks")
 
-        nextPosition = pos + step
+    while cells[pos] != OUTSIDE:
+        nextPosition = pos + directions[directionIdx]
 
         if (
-            not model.isOccupied(nextPosition)
+            cells[nextPosition] != OBSTICLE
+            and cells[nextPosition] != OUTSIDE
             and nextPosition not in newObsticles
-            and not visitedWithDirections[nextPosition]
+            and not visited[nextPosition]
         ):
-            # Original model already has obsticle
-
-            modelCopy = model.modelCopyWithStart(pos)
-            modelCopy.obsticles.add(nextPosition)
-            res = walkPath(model=modelCopy, startDirection=step)
+            res = walkPath(
+                model=model,
+                start=pos,
+                startDirection=directionIdx,
+                extraObsticle=nextPosition,
+            )
             if res is not None:
                 newObsticles.add(nextPosition)
+            progress.advance()
 
-        visitedWithDirections[pos].append(step)
+        visited[pos] = 1
 
-        if not model.isOccupied(nextPosition):
+        if cells[nextPosition] != OBSTICLE:
             pos = nextPosition
             continue
-        directionIdx = (directionIdx + 1) % len(DIRECTIONS)
+        directionIdx = (directionIdx + 1) % 4
 
+    progress.finish()
     if model.startingPosition in newObsticles:
         newObsticles.remove(model.startingPosition)
-    model.print(extraObsticles=newObsticles)
+    if trace.enabled(DEBUG):
+        trace.debug(model.asString(extraObsticles=newObsticles))
 
     return len(newObsticles)
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
+ARROWS = [ord(arrow) for arrow in "^>v<"]
+
+
+def frames(model: Model, part: int = 1) -> Frames:
+    """The guard's walk, one frame per step, leaving X on visited cells.
 
+    For part 2 the obsticles that would make the guard loop show up as O
+    as they are found, like in solve2.
+    """
+    grid = model.grid
+    cells, directions = grid.cells, grid.directions
+    canvas = gridCanvas(grid)
+    flat, view = canvas.reshape(-1), interior(grid, canvas)
+    pos, directionIdx = model.startingPosition, UP
+    visited, loopObsticles = bytearray(len(cells)), bytearray(len(cells))
+    step = 0
+    while cells[pos] != OUTSIDE:
+        flat[pos] = ARROWS[directionIdx]
+        yield step, view
+        flat[pos] = ord("O") if loopObsticles[pos] else ord("X")
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
+        nextPos = pos + directions[directionIdx]
+        if (
+            part == 2
+            and cells[nextPos] not in (OBSTICLE, OUTSIDE)
+            and not visited[nextPos]
+            and nextPos != model.startingPosition
+            and not loopObsticles[nextPos]
+            and walkPath(model, pos, directionIdx, nextPos) is not None
+        ):
+            loopObsticles[nextPos] = 1
+            flat[nextPos] = ord("O")
+        visited[pos] = 1
+        step += 1
 
-    # run(solve1, testString, expected=41)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=6)
-    run(solve2, dataString)
+        if cells[nextPos] != OBSTICLE:
+            pos = nextPos
+            continue
+        directionIdx = (directionIdx + 1) % 4
+
+
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (41, 6),
+    "data.txt": (None, None),
+}
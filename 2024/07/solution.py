@@ -1,10 +1,19 @@
 import typing as t
-from pathlib import Path
 from dataclasses import dataclass, field
 import itertools as it
 
+from aoc.inputs import Input
+from aoc.ints import extractRows
+from aoc.progress import track
+from aoc.trace import DEBUG, getTracer
 
-@dataclass
+trace = getTracer("2024/07")
+
+# parse gets a memory-mapped Input (see aoc.inputs)
+STREAMING = True
+
+
+@dataclass(slots=True)
 class Operator:
     name: str
     sign: str
@@ -14,7 +23,7 @@ class Operator:
         return self.sign
 
 
-@dataclass
+@dataclass(slots=True)
 class Eq:
     total: int = 0
     operands: t.List[int] = field(default_factory=list)
@@ -23,21 +32,17 @@ class Eq:
     def nOperands(self) -> int:
         return len(self.operands)
 
-    def print(self, operators: t.List[Operator]):
+    def asString(self, operators: t.List[Operator]) -> str:
         assert len(operators) == self.nOperands - 1
         operandsString = str(self.operands[0])
         for operator, operand in zip(operators, self.operands[1:]):
             operandsString = operandsString + f" {operator.sign} {operand}"
-        print(f"  {self.total} = {operandsString}")
+        return f"  {self.total} = {operandsString}"
 
 
-def parse(inputString: str):
-    data: t.List[Eq] = list()
-    for line in inputString.splitlines():
-        totalStr, operandStr = line.split(": ")
-        operands = list(map(int, operandStr.strip().split(" ")))
-        data.append(Eq(total=int(totalStr), operands=operands))
-    return data
+def parse(source: Input) -> t.List[Eq]:
+    rows = extractRows(source.view()).rows()
+    return [Eq(total=row[0], operands=row[1:]) for row in rows]
 
 
 def solve(
@@ -57,26 +62,30 @@ def solve(
     return result
 
 
-def solve1(input: str) -> int:
-    data = parse(input)
+def solve1(data: t.List[Eq]) -> int:
     total = 0
 
     operatorSet = [
         Operator("add", "+", lambda a, b: a + b),
         Operator("mul", "x", lambda a, b: a * b),
     ]
+    # Progress counts operator combinations, the unit of work in ``solve``
+    combinations = [len(operatorSet) ** (eq.nOperands - 1) for eq in data]
+    progress = track("2024/07 part 1", total=sum(combinations), unit="combos")
     for idx, eq in enumerate(data):
         solutions = solve(eq, operatorSet=operatorSet)
+        progress.advance(combinations[idx])
         if solutions:
-            print(f"Found {len(solutions)} for eq {idx+1}")
-            for solution in solutions:
-                eq.print(solution)
+            trace.debug("Found %d for eq %d", len(solutions), idx + 1)
+            if trace.enabled(DEBUG):
+                for solution in solutions:
+                    trace.debug(eq.asString(solution))
             total += eq.total
+    progress.finish()
     return total
 
 
-def solve2(input: str) -> int:
-    data = parse(input)
+def solve2(data: t.List[Eq]) -> int:
     total = 0
 
     operatorSet = [
@@ -84,33 +93,73 @@ def solve2(input: str) -> int:
         Operator("mul", "x", lambda a, b: a * b),
         Operator("con", "||", lambda a, b: int(str(a) + str(b))),
     ]
+    # Progress counts operator combinations, the unit of work in ``solve``
+    combinations = [len(operatorSet) ** (eq.nOperands - 1) for eq in data]
+    progress = track("2024/07 part 2", total=sum(combinations), unit="combos")
     for idx, eq in enumerate(data):
         solutions = solve(eq, operatorSet=operatorSet)
+        progress.advance(combinations[idx])
         if solutions:
-            print(f"Found {len(solutions)} for eq {idx+1}")
-            for solution in solutions:
-                eq.print(solution)
+            trace.debug("Found %d for eq %d", len(solutions), idx + 1)
+            if trace.enabled(DEBUG):
+                for solution in solutions:
+                    trace.debug(eq.asString(solution))
             total += eq.total
+    progress.finish()
     return total
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
+# === Backward search =====================================================
+
+# Works from the total back to the first operand: the last operator can only
+# have been a multiplication if the operand divides the total, a concatenation
+# if the total ends in the operand's digits, and an addition if the total is at
+# least the operand. Nearly every branch dies at once instead of trying all
+# operator combinations.
+
+
+def reachable(total: int, operands: t.List[int], count: int, concat: bool) -> bool:
+    """Whether the first ``count`` operands can make ``total``."""
+    last = operands[count - 1]
+    if count == 1:
+        return total == last
+    if last == 0:
+        # Multiplying by 0 makes 0 out of anything
+        if total == 0:
+            return True
+    elif total % last == 0 and reachable(total // last, operands, count - 1, concat):
+        return True
+    if concat:
+        digits, totalDigits = str(last), str(total)
+        if len(totalDigits) > len(digits) and totalDigits.endswith(digits):
+            prefix = int(totalDigits[: -len(digits)])
+            if reachable(prefix, operands, count - 1, concat):
+                return True
+    return total >= last and reachable(total - last, operands, count - 1, concat)
+
+
+def calibration(data: t.List[Eq], concat: bool) -> int:
+    return sum(
+        eq.total
+        for eq in data
+        if eq.operands and reachable(eq.total, eq.operands, eq.nOperands, concat)
+    )
+
+
+def solve1Backward(data: t.List[Eq]) -> int:
+    return calibration(data, concat=False)
+
+
+def solve2Backward(data: t.List[Eq]) -> int:
+    return calibration(data, concat=True)
+
 
+# Faster solvers checked against solve1/solve2 by `python -m aoc diff`
+ENGINES = {"backward": {1: solve1Backward, 2: solve2Backward}}
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
 
-    # run(solve1, testString, expected=3749)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=11387)
-    run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (3749, 11387),
+    "data.txt": (None, None),
+}
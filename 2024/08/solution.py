@@ -1,129 +1,97 @@
+from __future__ import annotations
+
 from collections import defaultdict
 import itertools
 import typing as t
-from dataclasses import dataclass, field
-from pathlib import Path
+from dataclasses import dataclass
 
-from coord import Coord
+from aoc.grid import Grid
+from aoc.lazy import lazyImport
+from aoc.render import text
+from aoc.trace import DEBUG, getTracer
 
+np = lazyImport("numpy")
 
-@dataclass
+trace = getTracer("2024/08")
+
+
+@dataclass(slots=True)
 class Antenna:
     sign: str
-    coord: Coord
+    row: int
+    col: int
 
     def __repr__(self):
-        return f"{self.sign} at: ({self.coord.row}, {self.coord.col})"
+        return f"{self.sign} at: ({self.row}, {self.col})"
 
 
 @dataclass
 class Model:
-    height: int
-    width: int
-    antennas: t.List[Antenna] = field(default_factory=list)
+    grid: Grid
+    antennas: t.List[Antenna]
 
     def __repr__(self):
-        chars = [["." for _ in range(self.width)] for _ in range(self.height)]
-        for antenna in self.antennas:
-            chars[antenna.coord.row][antenna.coord.col] = antenna.sign
-        return "\n".join(["".join(line) for line in chars])
+        return str(self.grid)
 
-    def asStringWithNodes(self, nodes: t.Collection[Coord]) -> str:
-        chars = [["." for _ in range(self.width)] for _ in range(self.height)]
-        for node in nodes:
-            chars[node.row][node.col] = "#"
-        for antenna in self.antennas:
-            chars[antenna.coord.row][antenna.coord.col] = antenna.sign
-        return "\n".join(["".join(line) for line in chars])
+    def asStringWithNodes(self, nodes: t.Collection[int]) -> str:
+        nodes = np.fromiter(nodes, dtype=np.intp, count=len(nodes))
+        cells = np.frombuffer(self.grid.cells, dtype=np.uint8)
+        return text(self.grid.draw((nodes[cells[nodes] == ord(".")], "#")))
 
 
 def parse(inputString: str):
-    lines = inputString.splitlines()
-    height = len(lines)
-    width = len(lines[0])
-    data = Model(height, width)
-    for rowIdx, line in enumerate(lines):
-        for colIdx, char in enumerate(line):
-            if char == ".":
-                continue
-            data.antennas.append(Antenna(char, Coord(rowIdx, colIdx)))
-    return data
-
-
-def solve1(input: str) -> int:
-    model = parse(input)
-
-    antennasBySign: t.Dict[str, t.List[Antenna]] = defaultdict(list)
-    [antennasBySign[a.sign].append(a) for a in model.antennas]
-
-    antinodes: t.Set[Coord] = set()
-
-    for sign, antennas in antennasBySign.items():
-        print(f"Calculating nodes for {sign} ({len(antennas)})")
-        for firstAntenna, secondAntenna in itertools.permutations(antennas, 2):
-            c1, c2 = firstAntenna.coord, secondAntenna.coord
-            node = 2 * c2 - c1
-            if node.row < 0 or node.col < 0:
-                continue
-            if node.row >= model.height or node.col >= model.width:
-                continue
-            antinodes.add(node)
+    grid = Grid.fromString(inputString)
+    antennas = [
+        Antenna(sign, *grid.position(index))
+        for sign, indices in grid.locate().items()
+        for index in indices.tolist()
+    ]
+    return Model(grid, antennas)
 
-    return len(antinodes)
 
+def antennasBySign(model: Model) -> t.Dict[str, t.List[Antenna]]:
+    bySign: t.Dict[str, t.List[Antenna]] = defaultdict(list)
+    for antenna in model.antennas:
+        bySign[antenna.sign].append(antenna)
+    return bySign
 
-def solve2(input: str) -> int:
-    model = parse(input)
 
-    antennasBySign: t.Dict[str, t.List[Antenna]] = defaultdict(list)
-    [antennasBySign[a.sign].append(a) for a in model.antennas]
+def solve1(model: Model) -> int:
+    grid = model.grid
+    antinodes: t.Set[int] = set()
 
-    antinodes: t.Set[Coord] = set()
+    for sign, antennas in antennasBySign(model).items():
+        trace.debug("Calculating nodes for %s (%d)", sign, len(antennas))
+        for first, second in itertools.permutations(antennas, 2):
+            row, col = 2 * second.row - first.row, 2 * second.col - first.col
+            if grid.contains(row, col):
+                antinodes.add(grid.index(row, col))
 
-    for sign, antennas in antennasBySign.items():
-        print(f"Calculating nodes for {sign} ({len(antennas)})")
-        for firstAntenna, secondAntenna in itertools.permutations(antennas, 2):
-            c1, c2 = firstAntenna.coord, secondAntenna.coord
-            print(f"Evaulating: {firstAntenna}, {secondAntenna}")
+    return len(antinodes)
 
-            delta = c1 - c2
-            node = c1
 
-            def withinBounds(node: Coord) -> bool:
-                return (
-                    node.row >= 0
-                    and node.col >= 0
-                    and node.row < model.height
-                    and node.col < model.width
-                )
+def solve2(model: Model) -> int:
+    grid = model.grid
+    antinodes: t.Set[int] = set()
 
-            while withinBounds(node):
-                antinodes.add(node)
-                node = node + delta
+    for sign, antennas in antennasBySign(model).items():
+        trace.debug("Calculating nodes for %s (%d)", sign, len(antennas))
+        for first, second in itertools.permutations(antennas, 2):
+            trace.debug("Evaulating: %s, %s", first, second)
 
-            antinodes.add(c1)
+            deltaRow, deltaCol = first.row - second.row, first.col - second.col
+            row, col = first.row, first.col
+            while grid.contains(row, col):
+                antinodes.add(grid.index(row, col))
+                row, col = row + deltaRow, col + deltaCol
 
-    print(model.asStringWithNodes(antinodes))
+    if trace.enabled(DEBUG):
+        trace.debug(model.asStringWithNodes(antinodes))
     return len(antinodes)
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
-
-
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
-
-    # run(solve1, testString, expected=14)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=34)
-    run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (14, 34),
+    "data.txt": (None, None),
+}
@@ -1,9 +1,13 @@
+import heapq
 import typing as t
-from pathlib import Path
 from dataclasses import dataclass, field
 
+from aoc.trace import getTracer
 
-@dataclass
+trace = getTracer("2024/09")
+
+
+@dataclass(slots=True)
 class Block:
     startIndex: int
     length: int
@@ -65,18 +69,17 @@ def parse(inputString: str) -> Model:
             model.fileBlocks.append(block)
         else:
             model.freeBlocks.append(block)
-    print(model.freeBlocks)
-    print(model.fileBlocks)
+    trace.debug("%s", model.freeBlocks)
+    trace.debug("%s", model.fileBlocks)
     assert len(model.fileBlocks) - 1 == len(model.freeBlocks)
     return model
 
 
-def solve1(input: str) -> int:
-    model = parse(input)
+def solve1(model: Model) -> int:
 
     intList = model.asIntList()
 
-    print(model)
+    trace.debug("%s", model)
 
     sourcePointer = len(intList) - 1
     targetPointer = 0
@@ -105,8 +108,35 @@ def solve1(input: str) -> int:
     return hash
 
 
-def solve2(input: str) -> int:
-    model = parse(input)
+def span(start: int, length: int) -> int:
+    """Sum of the positions start, ..., start + length - 1."""
+    return length * (2 * start + length - 1) // 2
+
+
+def solve1Checksum(model: Model) -> int:
+    # The same compaction as solve1, a run of blocks at a time: each file run
+    # adds id * (sum of its positions) without building the disk
+    remaining = [block.length for block in model.fileBlocks]
+    last = len(remaining) - 1
+    position = checksum = 0
+    for fileId, free in enumerate(model.freeBlocks + [Block(0, 0)]):
+        if fileId > last:
+            break
+        checksum += fileId * span(position, remaining[fileId])
+        position += remaining[fileId]
+        room = free.length
+        while room and last > fileId:
+            moved = min(room, remaining[last])
+            checksum += last * span(position, moved)
+            position += moved
+            room -= moved
+            remaining[last] -= moved
+            if remaining[last] == 0:
+                last -= 1
+    return checksum
+
+
+def solve2(model: Model) -> int:
 
     intList = model.asIntList()
     freeBlocks = [Block(b.startIndex, b.length) for b in model.freeBlocks]
@@ -151,23 +181,39 @@ def solve2(input: str) -> int:
     return hash
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
-
+def solve2Heaps(model: Model) -> int:
+    # The same moves as solve2 without scanning the free list: the free spans
+    # are kept as one heap of start positions per length (a digit, so 0..9),
+    # and a file takes the leftmost span among the lengths it fits in
+    free: t.List[t.List[int]] = [[] for _ in range(10)]
+    for block in model.freeBlocks:
+        if block.length:
+            # freeBlocks are in disk order, so each list is already a heap
+            free[block.length].append(block.startIndex)
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = "2333133121414131402"
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
-
-    # run(solve1, testString, expected=1928)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=2858)
-    run(solve2, dataString)
+    checksum = 0
+    for block in reversed(model.fileBlocks):
+        target: t.Optional[int] = None
+        for length in range(block.length, len(free)):
+            starts = free[length]
+            if starts and starts[0] < block.startIndex:
+                if target is None or starts[0] < free[target][0]:
+                    target = length
+        start = block.startIndex
+        if target is not None:
+            start = heapq.heappop(free[target])
+            if target > block.length:
+                heapq.heappush(free[target - block.length], start + block.length)
+        checksum += block.id * span(start, block.length)
+    return checksum
+
+
+# Faster solvers checked against solve1/solve2 by `python -m aoc diff`
+ENGINES = {"checksum": {1: solve1Checksum, 2: solve2Heaps}}
+
+
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (1928, 2858),
+    "data.txt": (None, None),
+}
@@ -1,73 +1,45 @@
-import typing as t
-from pathlib import Path
-from dataclasses import dataclass
-
-
-class Coord(t.NamedTuple):
-    row: int
-    col: int
+from __future__ import annotations
 
+import typing as t
 
-@dataclass
-class Model:
-    elevations: t.List[t.List[int]]
+from aoc.grid import Grid
+from aoc.lazy import lazyImport
+from aoc.memo import memoize
+from aoc.search import Step, bfs, countPaths
+from aoc.trace import getTracer
 
-    def coords(self):
-        for row in range(len(self.elevations)):
-            for col in range(len(self.elevations[0])):
-                yield Coord(row, col)
+np = lazyImport("numpy")
 
-    def neighbours(self, coord: Coord):
-        candidates = [
-            Coord(coord.row - 1, coord.col),
-            Coord(coord.row, coord.col + 1),
-            Coord(coord.row + 1, coord.col),
-            Coord(coord.row, coord.col - 1),
-        ]
-        return [candidate for candidate in candidates if self.withinBounds(candidate)]
+trace = getTracer("2024/10")
 
-    def withinBounds(self, coord: Coord) -> bool:
-        nRows, nCols = len(self.elevations), len(self.elevations[0])
-        return (
-            coord.row >= 0
-            and coord.col >= 0
-            and coord.row < nRows
-            and coord.col < nCols
-        )
+Model = Grid
 
 
 def parse(inputString: str) -> Model:
-    return Model(
-        elevations=[[int(char) for char in line] for line in inputString.splitlines()]
-    )
+    return Grid.fromString(inputString)
 
 
-def findStarts(model: Model) -> t.List[Coord]:
-    res: t.List[Coord] = list()
-    for coord in model.coords():
-        if model.elevations[coord.row][coord.col] == 0:
-            res.append(coord)
-    return res
+def findStarts(model: Model) -> t.List[int]:
+    return model.findAll("0")
 
 
-def getNeighboursWithHeight(model: Model, coord: Coord, height: int) -> t.Set[Coord]:
-    return set(
-        [n for n in model.neighbours(coord) if model.elevations[n.row][n.col] == height]
-    )
+def getNeighboursWithHeight(model: Model, coord: int, height: int) -> t.Set[int]:
+    # Heights are digits, so the padding never matches one
+    char = ord("0") + height
+    return set([n for n in model.neighbours(coord) if model[n] == char])
 
 
-def solve1(input: str) -> int:
-    model = parse(input)
+def solve1(model: Model) -> int:
     startPositions = findStarts(model)
-    print(model)
-    print(startPositions)
+    trace.debug("%s", model)
+    trace.debug("%s", [model.position(start) for start in startPositions])
 
     totalTrails = 0
     for start in startPositions:
         currentElevation = 0
-        currentPositions: t.Set[Coord] = set([start])
+        currentPositions: t.Set[int] = set([start])
         while currentPositions and currentElevation < 9:
-            nextPositions: t.Set[Coord] = set()
+            nextPositions: t.Set[int] = set()
             for position in currentPositions:
                 nextPositions |= getNeighboursWithHeight(
                     model, position, currentElevation + 1
@@ -80,47 +52,78 @@ def solve1(input: str) -> int:
     return totalTrails
 
 
-def trailsLeadingUp(model: Model, start: Coord, elevation: int) -> int:
+# Trails from a cell only depend on the cell (its height is the elevation), so
+# starts that share a slope share the work. The model is left out of the key,
+# so each solve clears the memo first.
+@memoize("2024/10 trails", key=lambda model, start, elevation: start)
+def trailsLeadingUp(model: Model, start: int, elevation: int) -> int:
     if elevation == 9:
         return 1
     score = 0
     for nextPosition in getNeighboursWithHeight(model, start, elevation + 1):
-        score += trailsLeadingUp(model, nextPosition, elevation=elevation + 1)
+        score += trailsLeadingUp(model, nextPosition, elevation + 1)
     return score
 
 
-def solve2(input: str) -> int:
-    model = parse(input)
+def solve2(model: Model) -> int:
     startPositions = findStarts(model)
-    print(model)
-    print(startPositions)
+    trace.debug("%s", model)
+    trace.debug("%s", [model.position(start) for start in startPositions])
 
+    trailsLeadingUp.memo.clear()
     totalRatings = 0
     for start in startPositions:
-        rating = trailsLeadingUp(model, start=start, elevation=0)
-        print(f"{start}: {rating}")
+        rating = trailsLeadingUp(model, start, 0)
+        trace.debug("%s: %d", model.position(start), rating)
         totalRatings += rating
 
     return totalRatings
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
+# === Shared search =======================================================
+
+# The same counts from aoc.search: a bfs per trailhead for part 1, and path
+# counts over the DAG of climbing steps for all trailheads at once for part 2.
+
+
+def climbs(model: Model) -> Step:
+    """Steps that go up by exactly one; the padding never matches a digit."""
+    cells = model.cells
+    return lambda src, dst: cells[dst] == cells[src] + 1
+
+
+def solve1Search(model: Model) -> int:
+    startPositions = findStarts(model)
+    trace.debug("%s", model)
+    trace.debug("%s", [model.position(start) for start in startPositions])
+
+    heights = np.frombuffer(model.cells, dtype=np.uint8)
+    step = climbs(model)
+    totalTrails = 0
+    for start in startPositions:
+        reached = bfs(model, [start], step).order
+        totalTrails += int(np.count_nonzero(heights[reached] == ord("9")))
+
+    return totalTrails
+
+
+def solve2Search(model: Model) -> int:
+    startPositions = findStarts(model)
+    trace.debug("%s", model)
+    trace.debug("%s", [model.position(start) for start in startPositions])
+
+    # Every trail is a path in the DAG of climbing steps, counted for all
+    # trailheads at once
+    counts = countPaths(model, startPositions, climbs(model))
+    return int(counts[model.findAll("9")].sum())
+
 
+# Faster solvers checked against solve1/solve2 by `python -m aoc diff`
+ENGINES = {"search": {1: solve1Search, 2: solve2Search}}
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
 
-    # run(solve1, testString, expected=36)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=81)
-    run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (36, 81),
+    "data.txt": (None, None),
+}
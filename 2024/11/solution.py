@@ -1,28 +1,36 @@
 import math
-from collections import defaultdict
 import typing as t
-from pathlib import Path
+
+from aoc.memo import memoize
+from aoc.progress import track
+from aoc.trace import getTracer
+
+trace = getTracer("2024/11")
 
 
 def parse(inputString: str) -> t.List[int]:
     return [int(cmp) for cmp in inputString.split(" ")]
 
 
-def solve1(input: str, iterations: t.Optional[int]) -> int:
-    cache: Cache = defaultdict(int)
-    iterations = 25
-    model = parse(input)
-    print(model)
+def totalStones(model: t.List[int], blinks: int, name: str) -> int:
+    memo = stonesAfterBlinks.memo
+    hits, misses = memo.hits, memo.misses
+    trace.debug("%s", model)
+    progress = track(name, total=len(model), unit="stones")
     res = 0
     for value in model:
-        stones = stonesAfterBlinks(value, iterations, cache)
-        print(f"{value}: {stones}")
+        stones = stonesAfterBlinks(value, blinks)
+        trace.debug("%d: %d", value, stones)
         res += stones
-    print(f"Cache size: {len(cache)}")
+        progress.hits, progress.misses = memo.hits - hits, memo.misses - misses
+        progress.advance()
+    progress.finish()
+    trace.info("Cache size: %d", len(memo))
     return res
 
 
-Cache = t.Dict[t.Tuple[int, int], int]
+def solve1(model: t.List[int]) -> int:
+    return totalStones(model, 25, "2024/11 part 1")
 
 
 def splitNumber(val: int) -> t.Optional[t.Tuple[int, int]]:
@@ -33,69 +41,35 @@ def splitNumber(val: int) -> t.Optional[t.Tuple[int, int]]:
     return val // denom, val % denom
 
 
-def stonesAfterBlinks(value: int, blinks: int, cache: t.Optional[Cache] = None) -> int:
-    if cache and (value, blinks) in cache:
-        return cache[value, blinks]
-
+# Stone counts only depend on (value, blinks), so the memo serves both parts
+# and every input solved in the same process, and is worth keeping on disk.
+# Recursion is at most 75 deep, so plain calls beat aoc.memo's explicit stack.
+@memoize("2024/11 stones", maxSize=1 << 20, persist=True)
+def stonesAfterBlinks(value: int, blinks: int) -> int:
     if blinks == 0:
         return 1
 
     if value == 0:
-        res = stonesAfterBlinks(1, blinks - 1, cache)
-        cache[1, blinks - 1] = res
-        return res
+        return stonesAfterBlinks(1, blinks - 1)
 
     if evenParts := splitNumber(value):
-        first = stonesAfterBlinks(evenParts[0], blinks - 1, cache)
-        cache[evenParts[0], blinks - 1] = first
-        second = stonesAfterBlinks(evenParts[1], blinks - 1, cache)
-        cache[evenParts[1], blinks - 1] = second
-        return first + second
-
-    res = stonesAfterBlinks(value * 2024, blinks - 1, cache)
-    cache[value * 2024, blinks - 1] = res
-    return res
+        first = stonesAfterBlinks(evenParts[0], blinks - 1)
+        return first + stonesAfterBlinks(evenParts[1], blinks - 1)
 
+    return stonesAfterBlinks(value * 2024, blinks - 1)
 
-def solve2(input: str, opt) -> int:
-    cache: Cache = defaultdict(int)
-    iterations = 75
-    model = parse(input)
-    print(model)
-    res = 0
-    for value in model:
-        stones = stonesAfterBlinks(value, iterations, cache)
-        print(f"{value}: {stones}")
-        res += stones
-    print(f"Cache size: {len(cache)}")
-    return res
 
+def solve2(model: t.List[int]) -> int:
+    return totalStones(model, 75, "2024/11 part 2")
 
-def run(
-    func: t.Callable[[str, t.Optional[int]], int],
-    data: str,
-    expected: t.Optional[int] = None,
-    extra: t.Optional[int] = None,
-):
-    res = func(data, extra)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
 
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (55312, None),
+    "data.txt": (None, None),
+}
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = "125 17"
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
 
+if __name__ == "__main__":
     assert splitNumber(1213) == (12, 13), f"12,13 was {splitNumber(1213)}"
     assert splitNumber(9) is None
-
-    # run(solve1, testString, expected=55312)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=None)
-    run(solve2, dataString)
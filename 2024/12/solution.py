@@ -1,128 +1,96 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from itertools import product
 import typing as t
-from pathlib import Path
-
-from coord import Coord
-
-
-@dataclass
-class Model:
-    patches: t.List[str]
 
-    @property
-    def height(self) -> int:
-        return len(self.patches)
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
+from aoc.lazy import lazyImport
+from aoc.search import components
+from aoc.trace import DEBUG, getTracer
 
-    @property
-    def width(self) -> int:
-        return len(self.patches[0])
+np = lazyImport("numpy")
 
-    def withinBounds(self, coord: Coord) -> bool:
-        return (
-            coord.row >= 0
-            and coord.col >= 0
-            and coord.row < self.height
-            and coord.col < self.width
-        )
+trace = getTracer("2024/12")
 
-    def __getitem__(self, key: Coord) -> str:
-        return self.patches[key.row][key.col]
+Model = Grid
 
 
 @dataclass
 class Region:
     letter: str
-    plots: t.Set[Coord] = field(default_factory=set)
+    plots: t.Set[int] = field(default_factory=set)
 
 
 def parse(inputString: str) -> Model:
-    return Model(patches=inputString.splitlines())
-
-
-DIRECTIONS = [Coord(1, 0), Coord(0, 1), Coord(-1, 0), Coord(0, -1)]
-
+    return Grid.fromString(inputString)
 
-def getNeighbours(
-    coord: Coord, outOf: t.Optional[t.Collection[Coord]] = None
-) -> t.Set[Coord]:
-    neighbours = set([coord + direction for direction in DIRECTIONS])
-    if not outOf:
-        return neighbours
-    return set([n for n in neighbours if n in outOf])
 
-
-def floodFill(coord: Coord, model: Model) -> Region:
-    region = Region(letter=model[coord])
+def floodFill(coord: int, model: Model) -> Region:
+    region = Region(letter=model.char(coord))
+    letter = model[coord]
     region.plots.add(coord)
 
-    candidates = getNeighbours(coord)
+    candidates = model.neighbours(coord)
     while candidates:
-        nextCandidates: t.Set[Coord] = set()
+        nextCandidates: t.List[int] = list()
 
         for candidate in candidates:
-            if candidate in region.plots:
-                continue
-            if not model.withinBounds(candidate):
-                continue
-            if model[candidate] != region.letter:
+            # The padding never matches a letter, so no bounds checks needed
+            if model[candidate] != letter or candidate in region.plots:
                 continue
 
             region.plots.add(candidate)
-            nextCandidates |= getNeighbours(candidate)
+            nextCandidates += model.neighbours(candidate)
         candidates = nextCandidates
     return region
 
 
-def regionCost(region: Region) -> int:
+def regionCost(region: Region, model: Model) -> int:
     perimiter = 0
     for plot in region.plots:
-        perimiter += sum(1 for n in getNeighbours(plot) if n not in region.plots)
+        perimiter += sum(1 for n in model.neighbours(plot) if n not in region.plots)
     return perimiter * len(region.plots)
 
 
-def clusterAdjacent(plots: t.Set[Coord]) -> t.List[t.Set[Coord]]:
-    clusters: t.List[t.Set[Coord]] = list()
-    handled: t.Set[Coord] = set()
+def clusterAdjacent(plots: t.Set[int], model: Model) -> t.List[t.Set[int]]:
+    clusters: t.List[t.Set[int]] = list()
+    handled: t.Set[int] = set()
     for plot in plots:
         if plot in handled:
             continue
-        cluster: t.Set[Coord] = set([plot])
-        candidates: t.Set[Coord] = getNeighbours(plot, outOf=plots)
+        cluster: t.Set[int] = set([plot])
+        candidates = [n for n in model.neighbours(plot) if n in plots]
         while candidates:
-            nextCandidates: t.Set[Coord] = set()
+            nextCandidates: t.List[int] = list()
             for candidate in candidates:
                 if candidate in cluster:
                     continue
-                if candidate not in plots:
-                    continue
                 cluster.add(candidate)
-                nextCandidates |= getNeighbours(candidate, outOf=plots)
+                nextCandidates += [n for n in model.neighbours(candidate) if n in plots]
             candidates = nextCandidates
         clusters.append(cluster)
         handled |= cluster
     return clusters
 
 
-def regionCost2(region: Region) -> int:
+def regionCost2(region: Region, model: Model) -> int:
     totalSides = 0
-    for direction in DIRECTIONS:
+    for direction in model.directions:
         perimiterCandidates = [inlier + direction for inlier in region.plots]
         perimiterPlots = set([c for c in perimiterCandidates if c not in region.plots])
-        clusters = clusterAdjacent(perimiterPlots)
+        clusters = clusterAdjacent(perimiterPlots, model)
         assert sum(len(c) for c in clusters) == len(perimiterPlots)
         totalSides += len(clusters)
 
     cost = totalSides * len(region.plots)
-    print(f"{region.letter}: {len(region.plots)} X {totalSides} = {cost}")
+    trace.debug("%s: %d X %d = %d", region.letter, len(region.plots), totalSides, cost)
     return cost
 
 
 def segment(model: Model) -> t.List[Region]:
-    visited: t.Set[Coord] = set()
+    visited: t.Set[int] = set()
     regions: t.List[Region] = list()
-    for row, col in product(range(model.height), range(model.width)):
-        coord = Coord(row, col)
+    for coord in model.indices():
         if coord in visited:
             continue
         region = floodFill(coord, model)
@@ -131,56 +99,110 @@ def segment(model: Model) -> t.List[Region]:
     return regions
 
 
-def solve1(input: str) -> int:
-    model = parse(input)
+def solve1(model: Model) -> int:
     # print(model)
     regions = segment(model)
     totalCost = 0
     for region in regions:
-        cost = regionCost(region)
+        cost = regionCost(region, model)
         # print(region, cost)
         totalCost += cost
     return totalCost
 
 
-def solve2(input: str) -> int:
-    model = parse(input)
+def solve2(model: Model) -> int:
     # print(model)
     regions = segment(model)
     totalCost = 0
     for region in regions:
-        cost = regionCost2(region)
+        cost = regionCost2(region, model)
         # print(region, cost)
         totalCost += cost
     return totalCost
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
+# === Labelled regions ====================================================
+
+# Regions labelled once with aoc.search.components; perimeters and sides
+# (counted as corners) come from masks over the labels instead of sets.
+
+
+class Regions(t.NamedTuple):
+    labels: np.ndarray
+    count: int
+    # Region label of each plot in the map, and the plots in the same order
+    plotLabels: np.ndarray
+    plots: np.ndarray
+
+    def areas(self) -> np.ndarray:
+        return np.bincount(self.plotLabels, minlength=self.count)
+
+    def same(self, offset: int) -> np.ndarray:
+        """For every plot, whether the plot ``offset`` away is in its region."""
+        return self.labels[self.plots + offset] == self.plotLabels
+
+    def perCount(self, mask: np.ndarray) -> np.ndarray:
+        return np.bincount(self.plotLabels[mask], minlength=self.count)
+
+
+def labelRegions(model: Model) -> Regions:
+    labels, count = components(model)
+    plots = np.flatnonzero(labels >= 0)
+    return Regions(labels, count, labels[plots], plots)
+
+
+def perimeters(regions: Regions, model: Model) -> np.ndarray:
+    return sum(regions.perCount(~regions.same(offset)) for offset in model.directions)
+
+
+def sides(regions: Regions, model: Model) -> np.ndarray:
+    """A region has as many sides as corners; each plot counts the corners it has.
+
+    Looking at two neighbouring directions (up and right, ...) a plot has an
+    outer corner there when neither neighbour is in its region, and an inner
+    corner when both are but the diagonal plot between them is not.
+    """
+    directions = model.directions
+    total = np.zeros(regions.count, dtype=np.int64)
+    for first, second in [(UP, RIGHT), (RIGHT, DOWN), (DOWN, LEFT), (LEFT, UP)]:
+        a = regions.same(directions[first])
+        b = regions.same(directions[second])
+        diagonal = regions.same(directions[first] + directions[second])
+        total += regions.perCount((~a & ~b) | (a & b & ~diagonal))
+    return total
+
+
+def traceRegions(regions: Regions, model: Model, counts: np.ndarray, what: str):
+    if not trace.enabled(DEBUG):
         return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
+    firstPlots = np.full(regions.count, -1)
+    firstPlots[regions.plotLabels[::-1]] = regions.plots[::-1]
+    for label, (plot, area) in enumerate(zip(firstPlots, regions.areas())):
+        trace.debug("%s: %d X %d %s", model.char(int(plot)), area, counts[label], what)
+
+
+def solve1Labels(model: Model) -> int:
+    regions = labelRegions(model)
+    fences = perimeters(regions, model)
+    traceRegions(regions, model, fences, "fences")
+    return int((regions.areas() * fences).sum())
 
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString1 = solutionDirectory.joinpath("test1.txt").read_text()
-    testString2 = solutionDirectory.joinpath("test2.txt").read_text()
-    testString3 = solutionDirectory.joinpath("test3.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
+def solve2Labels(model: Model) -> int:
+    regions = labelRegions(model)
+    counts = sides(regions, model)
+    traceRegions(regions, model, counts, "sides")
+    return int((regions.areas() * counts).sum())
 
-    # run(solve1, testString1, expected=140)
-    # run(solve1, testString2, expected=772)
-    # run(solve1, testString3, expected=1930)
 
-    # run(solve1, dataString)
+# Faster solvers checked against solve1/solve2 by `python -m aoc diff`
+ENGINES = {"labels": {1: solve1Labels, 2: solve2Labels}}
 
-    # run(solve2, testString1, expected=80)
-    # run(solve2, testString2, expected=436)
-    # run(solve2, testString3, expected=1206)
 
-    run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test1.txt": (140, 80),
+    "test2.txt": (772, 436),
+    "test3.txt": (1930, 1206),
+    "data.txt": (None, None),
+}
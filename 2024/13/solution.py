@@ -1,51 +1,46 @@
-import re
+from __future__ import annotations
+
 import typing as t
-from pathlib import Path
-from dataclasses import dataclass
 
+from aoc.inputs import Input
+from aoc.ints import extractIntegers
+from aoc.lazy import lazyImport
+
+np = lazyImport("numpy")
 
-class Vector(t.NamedTuple):
-    x: int
-    y: int
+# parse gets a memory-mapped Input (see aoc.inputs)
+STREAMING = True
 
-    def __add__(self, other: int) -> "Vector":
-        return Vector(self.x + other, self.y + other)
 
+class Machines(t.NamedTuple):
+    """One int64 column per number, a row per claw machine."""
 
-@dataclass
-class Case:
-    A: Vector
-    B: Vector
-    P: Vector
+    ax: np.ndarray
+    ay: np.ndarray
+    bx: np.ndarray
+    by: np.ndarray
+    px: np.ndarray
+    py: np.ndarray
 
     def __repr__(self):
-        return str(
-            f"Button A: X{self.A.x}, Y{self.A.y}\n"
-            f"Button B: X{self.B.x}, Y{self.B.y}\n"
-            f"Prize: X={self.P.x}, Y={self.P.y}"
+        return "\n\n".join(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={px}, Y={py}"
+            for ax, ay, bx, by, px, py in zip(*(column.tolist() for column in self))
         )
 
+    def movePrizes(self, diff: int) -> "Machines":
+        return self._replace(px=self.px + diff, py=self.py + diff)
 
-def parse(inputString: str) -> t.List[Case]:
-    pattern = re.compile(
-        r"Button A: X(.\d+), Y(.\d+)\nButton B: X(.\d+), Y(.\d+)\nPrize: X=(\d+), Y=(\d+)"
-    )
-
-    cases: t.List[Case] = list()
-    for match in pattern.finditer(inputString):
-        aX, aY, bX, bY, rX, rY = match.groups()
-        cases.append(
-            Case(
-                Vector(int(aX), int(aY)),
-                Vector(int(bX), int(bY)),
-                Vector(int(rX), int(rY)),
-            )
-        )
 
-    return cases
+def parse(source: Input) -> Machines:
+    # Button A: X+94, Y+34 / Button B: X+22, Y+67 / Prize: X=8400, Y=5400
+    numbers = extractIntegers(source.view()).reshape(-1, 6)
+    return Machines(*np.ascontiguousarray(numbers.T))
 
 
-def solveCase(c: Case) -> int:
+def solveCase(ax: int, ay: int, bx: int, by: int, px: int, py: int) -> int:
     # p * a_x + q * b_x = r_x
     # p * a_y + q * b_y = r_y
 
@@ -59,52 +54,69 @@ def solveCase(c: Case) -> int:
     # q ( a_x * b_y - a_y * b_x) = a_x * r_y - a_y * r_x
     # q = a_x * r_y - a_y * r_x / ( a_x * b_y - a_y * b_x)
 
-    q = (c.A.x * c.P.y - c.A.y * c.P.x) / (c.A.x * c.B.y - c.A.y * c.B.x)
-    p = (c.P.x - q * c.B.x) / c.A.x
+    # In integers: float division loses the remainder once the prizes are
+    # moved out to 10**13
+    q, qRest = divmod(ax * py - ay * px, ax * by - ay * bx)
+    p, pRest = divmod(px - q * bx, ax)
 
-    if q != int(q) or p != int(p):
+    if qRest or pRest or p < 0 or q < 0:
         return 0
 
-    return int(p) * 3 + int(q) * 1
+    return p * 3 + q * 1
+
 
+def cases(model: Machines) -> t.Iterator[t.Tuple[int, ...]]:
+    """The six numbers of each machine as Python ints."""
+    return zip(*(column.tolist() for column in model))
 
-def solve1(input: str) -> int:
-    model = parse(input)
+
+def solve1(model: Machines) -> int:
     totalTokens = 0
-    for case in model:
-        totalTokens += solveCase(case)
+    for case in cases(model):
+        totalTokens += solveCase(*case)
     return totalTokens
 
 
-def solve2(input: str) -> int:
-    oldModel = parse(input)
+def solve2(oldModel: Machines) -> int:
     diff = 10000000000000
-    model = [Case(case.A, case.B, case.P + diff) for case in oldModel]
+    model = oldModel.movePrizes(diff)
 
     totalTokens = 0
-    for case in model:
-        # print(case)
-        totalTokens += solveCase(case)
+    for case in cases(model):
+        totalTokens += solveCase(*case)
     return totalTokens
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
+# === Columns =============================================================
+
+# The same equations for every machine at once, in integers: a prize is won
+# when both divisions are exact.
+
+
+def tokens(m: Machines) -> int:
+    # The products stay far below 2**63 for part 2
+    det = m.ax * m.by - m.ay * m.bx
+    solvable = det != 0
+    q, qRest = np.divmod(m.ax * m.py - m.ay * m.px, np.where(solvable, det, 1))
+    p, pRest = np.divmod(m.px - q * m.bx, m.ax)
+    won = solvable & (qRest == 0) & (pRest == 0) & (p >= 0) & (q >= 0)
+    return int((p * 3 + q)[won].sum())
+
+
+def solve1Columns(model: Machines) -> int:
+    return tokens(model)
+
+
+def solve2Columns(model: Machines) -> int:
+    return tokens(model.movePrizes(10000000000000))
+
 
+# Faster solvers checked against solve1/solve2 by `python -m aoc diff`
+ENGINES = {"columns": {1: solve1Columns, 2: solve2Columns}}
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
 
-    run(solve1, testString, expected=480)
-    run(solve1, dataString, expected=37901)
-    run(solve2, testString, expected=None)
-    run(solve2, dataString, expected=77407675412647)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (480, None),
+    "data.txt": (37901, 77407675412647),
+}
@@ -1,24 +1,26 @@
-import re
-import typing as t
-from dataclasses import dataclass, field
-from pathlib import Path
-
-import numpy as np
-import numpy.typing as npt
+from __future__ import annotations
 
+import typing as t
+from dataclasses import dataclass
 
-# === Utility and constants ===================================================
+from aoc.inputs import Input
+from aoc.ints import extractRows
+from aoc.lazy import lazyImport
+from aoc.render import Frames, heatmap, text
+from aoc.trace import getTracer
 
-Vector = t.Annotated[npt.NDArray[np.int32], (2,)]
+np = lazyImport("numpy")
 
+trace = getTracer("2024/14")
 
-@dataclass
-class Robot:
-    pos: Vector
-    vel: Vector
+# parse gets a memory-mapped Input (see aoc.inputs)
+STREAMING = True
 
-    def __repr__(self):
-        return f"p={self.pos[0]},{self.pos[1]} v={self.vel[0]},{self.vel[1]}"
+# Width and height of the rooms. The input does not say which one it is, so
+# the test files (test*.txt) get the small one and everything else, generated
+# and scaled inputs included, the real one.
+TEST_SIZE = (11, 7)
+ROOM_SIZE = (101, 103)
 
 
 # === Model ================================================================
@@ -26,35 +28,32 @@ class Robot:
 
 @dataclass
 class Stage:
-    size: Vector
-    robots: t.List[Robot] = field(default_factory=list)
+    """Robots as columns: row ``i`` of both arrays is robot ``i``."""
 
-    def step(self, n: int) -> "Stage":
-        stage = Stage(self.size)
+    size: np.ndarray  # (2,): width, height
+    positions: np.ndarray  # (robots, 2): x, y
+    velocities: np.ndarray  # (robots, 2)
 
-        for robot in self.robots:
-            newPos = robot.pos + robot.vel * n
-            newPos %= self.size
-            stage.robots.append(Robot(newPos, robot.vel))
-        return stage
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def step(self, n: int) -> "Stage":
+        positions = (self.positions + self.velocities * n) % self.size
+        return Stage(self.size, positions, self.velocities)
 
     def __repr__(self):
-        intMap = [[0 for _ in range(self.size[0])] for _ in range(self.size[1])]
-        for robot in self.robots:
-            x, y = robot.pos
-            intMap[y][x] += 1
-        strMap = [[str(min(9, v)) if v else " " for v in intRow] for intRow in intMap]
-        return "\n".join(["".join(row) for row in strMap])
+        width, height = self.size.tolist()
+        x, y = self.positions.T
+        return text(heatmap(height, width, y * width + x))
 
     def securityFactor(self) -> int:
-        midPoint = self.size // 2
-        preFactor = [r.pos - midPoint for r in self.robots]
+        offsets = self.positions - self.size // 2
 
         result = 1
         quadrants = [(1, 1), (1, -1), (-1, -1), (-1, 1)]
         for quadrant in quadrants:
-            quadResult = sum(all(pos * quadrant > (0, 0)) for pos in preFactor)
-            print(f"{quadrant}: {quadResult}")
+            quadResult = int((offsets * quadrant > 0).all(axis=1).sum())
+            trace.debug("%s: %d", quadrant, quadResult)
             result *= quadResult
         return result
 
@@ -62,36 +61,113 @@ class Stage:
 # === Parsing ==============================================================
 
 
-def parse(inputString: str, size: Vector = None) -> Stage:
+def parse(source: Input, size: t.Optional[np.ndarray] = None) -> Stage:
+    # p=0,4 v=3,-3
+    numbers = extractRows(source.view()).matrix(4)
+    positions = np.ascontiguousarray(numbers[:, :2])
+    velocities = np.ascontiguousarray(numbers[:, 2:])
+
     if size is None:
-        size = np.array([11, 7])
-    stage = Stage(size=size)
-    for match in re.finditer(r"p=(\d+),(\d+) v=(-?\d+),(-?\d+)", inputString):
-        p_x, p_y, v_x, v_y = match.groups()
-        robot = Robot(np.array([int(p_x), int(p_y)]), np.array([int(v_x), int(v_y)]))
-        stage.robots.append(robot)
+        size = np.array(roomSize(source))
+    return Stage(size, positions, velocities)
 
-    return stage
+
+def roomSize(source: Input) -> t.Tuple[int, int]:
+    name = source.path.name if source.path is not None else ""
+    return TEST_SIZE if name.startswith("test") else ROOM_SIZE
 
 
 # === Solving ===============================================================
 
 
-def solve1(input: str) -> int:
-    # stage = parse(input, np.array([11, 7]))
-    stage = parse(input, np.array([101, 103]))
-    print(stage)
+def solve1(stage: Stage) -> int:
+    trace.debug("%s", stage)
     stage = stage.step(100)
-    print(stage)
+    trace.debug("%s", stage)
     score = stage.securityFactor()
 
     return score
 
 
-def solve2(_input: str) -> int:
+# Robots in one unbroken row that count as a drawn line (the picture's frame)
+PICTURE_RUN = 10
+
+
+def showsPicture(stage: Stage, positions: np.ndarray) -> bool:
+    width, height = stage.size.tolist()
+    occupied = np.zeros((height, width), dtype=bool)
+    occupied[positions[:, 1], positions[:, 0]] = True
+    if width < PICTURE_RUN:
+        return False
+    windows = np.lib.stride_tricks.sliding_window_view(occupied, PICTURE_RUN, axis=1)
+    return bool(windows.all(axis=2).any())
+
+
+def solve2(stage: Stage) -> t.Optional[int]:
+    """The first step at which the robots draw a picture, if they ever do.
+
+    A heuristic standing in for looking at the map (see ``explore``): the
+    picture is taken to be a step where no two robots share a cell and some
+    row holds a line of PICTURE_RUN robots. Random robots (as generated) never
+    line up like that, and then there is no answer.
+    """
+    if len(stage) < PICTURE_RUN:
+        return None
+    positions, velocities = stage.positions, stage.velocities
+    period = int(np.lcm(*stage.size))
+    for n in range(period):
+        moved = (positions + velocities * n) % stage.size
+        x, y = moved.T
+        if len(np.unique(x * stage.size[1] + y)) != len(stage):
+            continue
+        if showsPicture(stage, moved):
+            return n
+    return None
+
+
+def leastSpread(coordinates: np.ndarray, velocities: np.ndarray, period: int) -> int:
+    """The step in ``range(period)`` at which the coordinates vary least."""
+    steps = np.arange(period)[:, None]
+    moved = (coordinates + velocities * steps) % period
+    return int(moved.var(axis=1).argmin())
+
+
+def solve2Spread(stage: Stage) -> t.Optional[int]:
+    # The robots bunch up to draw the picture. Their x repeat every width steps
+    # and their y every height steps, so the step where x and the step where y
+    # spread least are found apart (width + height steps instead of width *
+    # height) and joined by the Chinese remainder theorem. solve2's test then
+    # says whether that step is the picture.
+    width, height = stage.size.tolist()
+    if np.gcd(width, height) != 1 or len(stage) < PICTURE_RUN:
+        return solve2(stage)
+    (x, y), (dx, dy) = stage.positions.T, stage.velocities.T
+    stepX, stepY = leastSpread(x, dx, width), leastSpread(y, dy, height)
+    n = stepX + width * ((stepY - stepX) * pow(width, -1, height) % height)
+    moved = stage.step(n).positions
+    if len(np.unique(moved[:, 0] * height + moved[:, 1])) != len(stage):
+        return None
+    return n if showsPicture(stage, moved) else None
+
+
+def frames(stage: Stage, part: int = 1) -> Frames:
+    """Robot counts per cell after 0, 1, 2, ... seconds."""
+    width, height = stage.size.tolist()
+    positions, velocities = stage.positions.copy(), stage.velocities
+    x, y = positions.T
+    n = 0
+    while True:
+        yield n, heatmap(height, width, y * width + x)
+        positions += velocities
+        positions %= stage.size
+        n += 1
+
+
+def explore(_input: str):
+    """Step through the stage interactively to look for the picture by eye."""
     import os
 
-    stage = parse(_input, np.array([101, 103]))
+    stage = parse(Input.fromString(_input), np.array(ROOM_SIZE))
     delta = 1
     try:
         n = 0
@@ -109,26 +185,14 @@ def solve2(_input: str) -> int:
                     print(f"{res} is not an integer")
     except KeyboardInterrupt:
         pass
-    return 0
-
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
 
+# Faster solvers checked against solve1/solve2 by `python -m aoc diff`
+ENGINES = {"spread": {2: solve2Spread}}
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
 
-    # run(solve1, testString, expected=None)
-    # run(solve1, dataString, expected=221142636)
-    # run(solve2, testString, expected=None)
-    run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (12, None),
+    "data.txt": (221142636, None),
+}
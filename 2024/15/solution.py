@@ -1,31 +1,28 @@
-import itertools
+from __future__ import annotations
+
 import typing as t
-from pathlib import Path
 from dataclasses import dataclass, field
 
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
+from aoc.lazy import lazyImport
+from aoc.render import Frames, Indices, gridCanvas, interior, paint, text
+from aoc.shared import CopyOnWrite
 
-# === Utility and constants ===================================================
-
-
-class Coord(t.NamedTuple):
-    row: int
-    col: int
-
-    def __add__(self, other: "Coord") -> "Coord":
-        return Coord(self.row + other.row, self.col + other.col)
+np = lazyImport("numpy")
 
+# === Utility and constants ===================================================
 
-Direction = Coord
-UP = Direction(-1, 0)
-DOWN = Direction(+1, 0)
-LEFT = Direction(0, -1)
-RIGHT = Direction(0, +1)
+# Directions are indices into ``Grid.directions``, so they hold for both the
+# narrow and the widened map
+Direction = int
 
 SymbolToDirection = {"<": LEFT, "^": UP, ">": RIGHT, "v": DOWN}
 DirectionToSymbol = {
     direction: symbol for symbol, direction in SymbolToDirection.items()
 }
 
+WALL = ord("#")
+
 
 def directionsToString(directions: t.List[Direction]):
     strings = [DirectionToSymbol[direction] for direction in directions]
@@ -37,152 +34,122 @@ def directionsToString(directions: t.List[Direction]):
 
 @dataclass
 class Stage:
-    nCols: int
-    nRows: int
-    robot: Coord
-    boxes: t.Set[Coord] = field(default_factory=set)
-    walls: t.Set[Coord] = field(default_factory=set)
+    """Walls live in the grid; the robot and boxes are cell indices."""
+
+    grid: Grid
+    robot: int
+    boxes: t.Set[int] = field(default_factory=set)
 
     @classmethod
     def parseStage1(cls, rawMap: str) -> "Stage":
-        rawLines = rawMap.splitlines()
-        nRows, nCols = len(rawLines), len(rawLines[0])
-
-        robot: Coord
-        boxes: t.Set[Coord] = set()
-        walls: t.Set[Coord] = set()
+        grid = Grid.fromString(rawMap)
+        located = grid.locate("@O")
+        robot, boxes = located["@"], located.get("O", np.zeros(0, dtype=int))
+        # Only walls stay in the grid
+        cells = grid.array().reshape(-1)
+        cells[robot] = cells[boxes] = ord(".")
+        return Stage(grid=grid, robot=int(robot[0]), boxes=set(boxes.tolist()))
+
+    def widened(self) -> "Stage":
+        """Stage for part 2, where everything except the robot is twice as wide."""
+        grid = Grid.fromArray(np.repeat(self.grid.interior(), 2, axis=1))
+
+        def widen(index: int) -> int:
+            row, col = self.grid.position(index)
+            return grid.index(row, col * 2)
 
-        for row, line in enumerate(rawLines):
-            for col, char in enumerate(line):
-                coord = Coord(row, col)
-                if char == "@":
-                    robot = coord
-                elif char == "#":
-                    walls.add(coord)
-                elif char == "O":
-                    boxes.add(coord)
-
-        return Stage(nRows=nRows, nCols=nCols, robot=robot, boxes=boxes, walls=walls)
+        return Stage(
+            grid=grid,
+            robot=widen(self.robot),
+            boxes={widen(box) for box in self.boxes},
+        )
 
-    @classmethod
-    def parseStage2(cls, rawMap: str) -> "Stage":
-        rawLines = rawMap.splitlines()
-        nRows, nCols = len(rawLines), len(rawLines[0]) * 2
-
-        robot: Coord
-        boxes: t.Set[Coord] = set()
-        walls: t.Set[Coord] = set()
-
-        for row, line in enumerate(rawLines):
-            for col, char in enumerate(line):
-                if char == "@":
-                    robot = Coord(row, col * 2)
-                elif char == "#":
-                    walls.add(Coord(row, col * 2))
-                    walls.add(Coord(row, col * 2 + 1))
-                elif char == "O":
-                    boxes.add(Coord(row, col * 2))
-
-        return Stage(nRows=nRows, nCols=nCols, robot=robot, boxes=boxes, walls=walls)
-
-    def stepStage1(self, direction: Direction) -> "Stage":
-        positionToCheck = self.robot + direction
-        affectedBoxes: t.Set[Coord] = set()
+    def copy(self) -> "Stage":
+        # The grid is never written while stepping
+        return Stage(grid=self.grid, robot=self.robot, boxes=set(self.boxes))
+
+    def moveBoxes(self, affectedBoxes: t.Set[int], offset: int):
+        self.boxes -= affectedBoxes
+        self.boxes |= {box + offset for box in affectedBoxes}
+        self.robot += offset
+
+    def stepStage1(self, direction: Direction) -> t.Optional[t.Set[int]]:
+        """Move the robot; returns the boxes it pushed, None when it is blocked."""
+        offset = self.grid.directions[direction]
+        cells = self.grid.cells
+        positionToCheck = self.robot + offset
+        affectedBoxes: t.Set[int] = set()
         while True:
-            if positionToCheck in self.walls:
-                return self
+            if cells[positionToCheck] == WALL:
+                return None
 
             if positionToCheck not in self.boxes:
                 break
 
             affectedBoxes.add(positionToCheck)
-            positionToCheck = positionToCheck + direction
-
-        newBoxes = [
-            box + direction if box in affectedBoxes else box for box in self.boxes
-        ]
+            positionToCheck = positionToCheck + offset
 
-        return Stage(
-            nRows=self.nRows,
-            nCols=self.nCols,
-            robot=self.robot + direction,
-            boxes=newBoxes,
-            walls=self.walls,
-        )
+        self.moveBoxes(affectedBoxes, offset)
+        return affectedBoxes
 
-    def stepStage2(self, direction: Direction) -> "Stage":
-        positionsToCheck: t.List[Coord] = [self.robot + direction]
-        affectedBoxes: t.Set[Coord] = set()
+    def stepStage2(self, direction: Direction) -> t.Optional[t.Set[int]]:
+        offset = self.grid.directions[direction]
+        cells = self.grid.cells
+        positionsToCheck: t.List[int] = [self.robot + offset]
+        affectedBoxes: t.Set[int] = set()
 
         while positionsToCheck:
-            nextPositions: t.List[Coord] = list()
+            nextPositions: t.List[int] = list()
             for position in positionsToCheck:
-                if position in self.walls:
-                    return self  # Wall, no movement
+                if cells[position] == WALL:
+                    return None  # Wall, no movement
 
                 if position in self.boxes:
-                    leftPos, rightPos = position, position + RIGHT
-                    if leftPos in affectedBoxes:
-                        continue
-                    nextPositions.append(leftPos + direction)
-                    nextPositions.append(rightPos + direction)
-                    affectedBoxes.add(leftPos)
-
-                elif (position + LEFT) in self.boxes:
-                    leftPos, rightPos = position + LEFT, position
-                    if leftPos in affectedBoxes:
-                        continue
-                    nextPositions.append(leftPos + direction)
-                    nextPositions.append(rightPos + direction)
-                    affectedBoxes.add(leftPos)
+                    leftPos = position
+                elif (position - 1) in self.boxes:
+                    leftPos = position - 1
+                else:
+                    continue
+                if leftPos in affectedBoxes:
+                    continue
+                nextPositions.append(leftPos + offset)
+                nextPositions.append(leftPos + 1 + offset)
+                affectedBoxes.add(leftPos)
 
             positionsToCheck = nextPositions
 
-        newBoxes = [
-            box + direction if box in affectedBoxes else box for box in self.boxes
-        ]
-
-        return self.__class__(
-            nRows=self.nRows,
-            nCols=self.nCols,
-            robot=self.robot + direction,
-            boxes=newBoxes,
-            walls=self.walls,
-        )
+        self.moveBoxes(affectedBoxes, offset)
+        return affectedBoxes
 
     def gpsScore(self) -> int:
-        return sum(box.row * 100 + box.col for box in self.boxes)
+        positions = map(self.grid.position, self.boxes)
+        return sum(row * 100 + col for row, col in positions)
+
+    def layers(
+        self, stage: t.Literal["stage1", "stage2"] = "stage1"
+    ) -> t.List[t.Tuple[Indices, str]]:
+        boxes = np.fromiter(self.boxes, dtype=np.intp, count=len(self.boxes))
+        if stage == "stage1":
+            return [(boxes, "O"), ([self.robot], "@")]
+        return [(boxes, "["), (boxes + 1, "]"), ([self.robot], "@")]
 
     def modelToString(self, stage: t.Literal["stage1", "stage2"] = "stage1") -> str:
-        result = [["." for _ in range(self.nCols)] for _ in range(self.nRows)]
-        for row, col in self.boxes:
-            if stage == "stage1":
-                result[row][col] = "O"
-            elif stage == "stage2":
-                result[row][col] = "["
-                result[row][col + 1] = "]"
-        for row, col in self.walls:
-            result[row][col] = "#"
-        result[self.robot.row][self.robot.col] = "@"
-        return "\n".join(["".join(row) for row in result])
+        return text(self.grid.draw(*self.layers(stage)))
 
 
 # === Parsing ==============================================================
 
+Parsed = t.Tuple[Stage, t.List[Direction]]
+
 
-def parse(
-    inputString: str, stage: t.Literal["stage1", "stage2"] = "stage1"
-) -> t.Tuple["Stage", t.List[Direction]]:
+def parse(inputString: str) -> Parsed:
     rawMap, rawInstructions = inputString.split("\n\n")
 
-    stage = (
-        Stage.parseStage1(rawMap) if stage == "stage1" else Stage.parseStage2(rawMap)
-    )
+    stage = Stage.parseStage1(rawMap)
 
-    instructions: t.List[Direction] = list()
-    for char in rawInstructions.replace("\n", ""):
-        instruction = SymbolToDirection.get(char)
-        instructions.append(instruction)
+    instructions: t.List[Direction] = [
+        SymbolToDirection[char] for char in rawInstructions.replace("\n", "")
+    ]
 
     return stage, instructions
 
@@ -190,45 +157,62 @@ def parse(
 # === Solving ===============================================================
 
 
-def solve1(input: str) -> int:
-    model, instructions = parse(input, "stage1")
-    # print(model.modelToString("stage1"))
+def copyModel(parsed: Parsed) -> Parsed:
+    stage, instructions = parsed
+    return stage.copy(), instructions
+
+
+def solve1(view: CopyOnWrite[Parsed]) -> int:
+    model, instructions = view.write()
     for instruction in instructions:
-        model = model.stepStage1(instruction)
-        # print(f"Direction: {DirectionToSymbol[instruction]}\n" + str(model))
-        # print(model.modelToString("stage1"))
+        model.stepStage1(instruction)
     return model.gpsScore()
 
 
-def solve2(input: str) -> int:
-    model, instructions = parse(input, "stage2")
-    # print(model.modelToString("stage2"))
+def solve2(parsed: Parsed) -> int:
+    model, instructions = parsed
+    model = model.widened()
     for instruction in instructions:
-        model = model.stepStage2(instruction)
-        # print(f"Direction: {DirectionToSymbol[instruction]}\n" + str(model))
-        # print(model.modelToString("stage2"))
+        model.stepStage2(instruction)
     return model.gpsScore()
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
-
-
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    smallTestString = solutionDirectory.joinpath("small_test.txt").read_text()
-    largeTestString = solutionDirectory.joinpath("large_test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
-
-    run(solve1, smallTestString, expected=2028)
-    run(solve1, largeTestString, expected=10092)
-    run(solve1, dataString, expected=10092)
-    run(solve2, largeTestString, expected=9021)
-    run(solve2, dataString, expected=1463160)
+def frames(parsed: Parsed, part: int = 1) -> Frames:
+    """The warehouse after each move of the robot.
+
+    One canvas is kept, and only the cells of the robot and the boxes it
+    pushed are painted again.
+    """
+    model, instructions = parsed
+    model = model.copy() if part == 1 else model.widened()
+    step = model.stepStage1 if part == 1 else model.stepStage2
+    boxChars = [ord("O")] if part == 1 else [ord("["), ord("]")]
+    canvas = gridCanvas(model.grid)
+    for indices, char in model.layers("stage1" if part == 1 else "stage2"):
+        paint(canvas, indices, char)
+    flat, view = canvas.reshape(-1), interior(model.grid, canvas)
+
+    yield 0, view
+    for idx, instruction in enumerate(instructions, 1):
+        robot = model.robot
+        pushed = step(instruction)
+        if pushed is not None:
+            offset = model.robot - robot
+            for box in pushed:
+                flat[box : box + len(boxChars)] = ord(".")
+            for box in pushed:
+                flat[box + offset : box + offset + len(boxChars)] = boxChars
+            flat[robot] = ord(".")
+            flat[model.robot] = ord("@")
+        yield idx, view
+
+
+# Part 1 pushes the boxes of the parsed stage; part 2 works on a widened copy.
+MUTATES = {1}
+
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "small_test.txt": (2028, None),
+    "large_test.txt": (10092, 9021),
+    "data.txt": (None, 1463160),
+}
@@ -1,5 +1,4 @@
 import typing as t
-from pathlib import Path
 from dataclasses import dataclass, field
 
 
@@ -11,31 +10,25 @@ def parse(inputString: str) -> Model:
     return None
 
 
-def solve1(input: str) -> int:
+def solve1(model: Model) -> int:
     return 0
 
 
-def solve2(input: str) -> int:
+def solve2(model: Model) -> int:
     return 0
 
 
-def run(func: t.Callable[[str], int], data: str, expected: t.Optional[int] = None):
-    res = func(data)
-    if expected is None:
-        print(f"{func.__name__} returned: {res}")
-        return
-    if res == expected:
-        print(f"Success! {func.__name__} returned {res}")
-    else:
-        print(f"{func.__name__} returned {res} (expected: {expected})")
+# Parts that modify the model; they get a CopyOnWrite view instead of the
+# model shared between both parts, copied by copyModel(model) if the day
+# defines one (copy.copy otherwise).
+MUTATES: t.Set[int] = set()
 
+# With True, parse gets a memory-mapped aoc.inputs.Input instead of a str.
+STREAMING = False
 
-if __name__ == "__main__":
-    solutionDirectory = Path(__file__).parent
-    testString = solutionDirectory.joinpath("test.txt").read_text()
-    dataString = solutionDirectory.joinpath("data.txt").read_text()
 
-    run(solve1, testString, expected=None)
-    # run(solve1, dataString)
-    # run(solve2, testString, expected=None)
-    # run(solve2, dataString)
+# Answers checked by `python -m aoc run`; None means unknown.
+EXPECTED = {
+    "test.txt": (None, None),
+    "data.txt": (None, None),
+}
@@ -0,0 +1,131 @@
+import glob
+import json
+import os
+import sys
+import time
+import typing as t
+from pathlib import Path
+
+from aoc.runner import jsonAnswer, silenced
+from aoc.solutions import PARTS
+from aoc.sweep import loadSolution
+from aoc.timing import formatDuration, measure
+
+# One day over many inputs (other accounts, generated cases) in one process,
+# so imports, module-level tables and compiled patterns, and caches kept
+# between calls (day 11's stone counts) are paid for once. Each input becomes
+# one JSON line:
+#
+#   {"solution": "2024/03", "input": "inputs/a.txt", "bytes": 17893,
+#    "parse": 0.0011, "answers": [190604937, 82857512],
+#    "solve": [0.0002, 0.0003], "error": null}
+#
+# With several workers the inputs are split over a process pool, each worker
+# loading the day once; lines still come out in input order.
+
+
+def expandInputs(patterns: t.Iterable[str]) -> t.List[Path]:
+    """Files, directories (their *.txt files) and glob patterns, deduplicated."""
+    paths: t.Dict[Path, None] = dict()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(path.glob("*.txt"))
+        elif path.exists():
+            matches = [path]
+        else:
+            matches = [
+                Path(match) for match in sorted(glob.glob(pattern, recursive=True))
+            ]
+        if not matches:
+            raise FileNotFoundError(f"No inputs match {pattern}")
+        paths.update(dict.fromkeys(matches))
+    return list(paths)
+
+
+def solveInput(
+    year: int, day: int, inputPath: Path, parts: t.Sequence[int] = PARTS
+) -> t.Dict[str, t.Any]:
+    record: t.Dict[str, t.Any] = {
+        "solution": f"{year}/{day:02d}",
+        "input": str(inputPath),
+        "bytes": inputPath.stat().st_size,
+        "parse": None,
+        "answers": [None] * len(parts),
+        "solve": [None] * len(parts),
+        "error": None,
+    }
+    try:
+        # A day that fails to import is reported like one failing to solve
+        solution = loadSolution(year, day)
+        # Memos are not cleared here: a worker's inputs share them on purpose
+        with silenced():
+            model, sample = measure(solution.parseFile, inputPath)
+            record["parse"] = sample.wall
+            for idx, part in enumerate(parts):
+                answer, sample = measure(solution.solve, part, model)
+                record["answers"][idx] = jsonAnswer(answer)
+                record["solve"][idx] = sample.wall
+    except Exception as error:
+        record["error"] = repr(error)
+    return record
+
+
+def solveJob(job: t.Tuple[int, int, Path, t.Sequence[int]]) -> t.Dict[str, t.Any]:
+    return solveInput(*job)
+
+
+def batch(
+    year: int,
+    day: int,
+    inputPaths: t.Sequence[Path],
+    parts: t.Sequence[int] = PARTS,
+    workers: int = 1,
+) -> t.Iterator[t.Dict[str, t.Any]]:
+    jobs = [(year, day, path, parts) for path in inputPaths]
+    if workers <= 1 or len(jobs) <= 1:
+        yield from map(solveJob, jobs)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Chunks amortise the pickling round trip of short inputs
+        chunksize = max(1, len(jobs) // (workers * 4))
+        yield from pool.map(solveJob, jobs, chunksize=chunksize)
+
+
+def writeBatch(
+    records: t.Iterable[t.Dict[str, t.Any]], out: t.TextIO
+) -> t.Tuple[int, int]:
+    count = errors = 0
+    for record in records:
+        out.write(json.dumps(record) + "\n")
+        count += 1
+        errors += record["error"] is not None
+    out.flush()
+    return count, errors
+
+
+def runBatch(
+    year: int,
+    day: int,
+    inputPaths: t.Sequence[Path],
+    parts: t.Sequence[int] = PARTS,
+    workers: int = 1,
+    out: t.TextIO = sys.stdout,
+) -> int:
+    """Write one line per input to ``out``; returns the number of errors.
+
+    ``workers=0`` means one worker per CPU.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    count, errors = writeBatch(batch(year, day, inputPaths, parts, workers), out)
+    wall = time.perf_counter() - start
+    print(
+        f"{count} inputs ({errors} errors) on {workers} worker(s) in "
+        f"{formatDuration(wall)}, {count / wall:.1f} inputs/s",
+        file=sys.stderr,
+    )
+    return errors
@@ -0,0 +1,217 @@
+import datetime
+import functools
+import json
+import platform
+import re
+import statistics
+import time
+import tracemalloc
+import typing as t
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc.runner import clearMemos, formatTable, silenced
+from aoc.solutions import PARTS, Solution
+from aoc.sweep import STATE_DIRECTORY
+from aoc.timing import (
+    formatBytes,
+    formatDuration,
+    measure,
+    percentile,
+    rejectOutliers,
+)
+
+BASELINE_DIRECTORY = STATE_DIRECTORY / "baselines"
+
+
+def machineId() -> str:
+    name = f"{platform.node()}-{platform.machine()}-py{platform.python_version()}"
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+
+
+def baselinePath() -> Path:
+    return BASELINE_DIRECTORY / f"{machineId()}.json"
+
+
+# === Measuring =============================================================
+
+
+@dataclass
+class Measurement:
+    median: float
+    min: float
+    p95: float
+    peakMemory: int
+    samples: int
+    rejected: int
+
+
+def tracedCall(func: t.Callable[[t.Any], t.Any], arg: t.Any) -> t.Tuple[float, int]:
+    clearMemos()
+    tracemalloc.start()
+    try:
+        _, sample = measure(func, arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return sample.wall, peak
+
+
+def benchmarkCall(
+    func: t.Callable[[t.Any], t.Any],
+    arg: t.Any,
+    repeat: int = 5,
+    warmup: int = 1,
+    maxTime: float = 10.0,
+) -> Measurement:
+    """Time repeated calls after warming up, within a rough time budget.
+
+    The first warm-up call runs under tracemalloc to get the peak memory, so
+    the timed calls are not slowed down by tracing. Warm-up and repeats stop
+    early once ``maxTime`` is spent, but at least one call is always timed.
+    """
+    spent, peak = tracedCall(func, arg)
+    for _ in range(warmup - 1):
+        if spent >= maxTime:
+            break
+        clearMemos()
+        spent += measure(func, arg)[1].wall
+
+    times: t.List[float] = list()
+    start = time.perf_counter()
+    while len(times) < repeat and (not times or time.perf_counter() - start < maxTime):
+        clearMemos()
+        times.append(measure(func, arg)[1].wall)
+
+    kept = rejectOutliers(times)
+    return Measurement(
+        median=statistics.median(kept),
+        min=min(kept),
+        p95=percentile(kept, 0.95),
+        peakMemory=peak,
+        samples=len(kept),
+        rejected=len(times) - len(kept),
+    )
+
+
+def isBenchmarkInput(name: str) -> bool:
+    return "test" not in name
+
+
+def benchmarkSolution(
+    solution: Solution,
+    parts: t.Sequence[int] = PARTS,
+    inputNames: t.Optional[t.Sequence[str]] = None,
+    parse: t.Optional[t.Callable[[t.Any], t.Any]] = None,
+    **options,
+) -> t.Dict[str, Measurement]:
+    parse = parse or solution.parse
+    results: t.Dict[str, Measurement] = dict()
+    for inputPath in solution.inputs():
+        if inputNames and inputPath.name not in inputNames:
+            continue
+        if not inputNames and not isBenchmarkInput(inputPath.name):
+            continue
+        key = f"{solution.name} {inputPath.name}"
+        with silenced(), solution.opened(inputPath) as source:
+            results[f"{key} parse"] = benchmarkCall(parse, source, **options)
+            model = parse(source)
+            for part in parts:
+                solve = functools.partial(solution.solve, part)
+                results[f"{key} part {part}"] = benchmarkCall(solve, model, **options)
+    return results
+
+
+# === Baselines =============================================================
+
+
+def saveBaseline(results: t.Dict[str, Measurement], path: Path):
+    baseline = loadBaseline(path) if path.exists() else dict()
+    baseline.update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "machine": machineId(),
+        "updated": datetime.datetime.now().isoformat(timespec="seconds"),
+        "results": {key: asdict(value) for key, value in sorted(baseline.items())},
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def loadBaseline(path: Path) -> t.Dict[str, Measurement]:
+    document = json.loads(path.read_text())
+    return {key: Measurement(**value) for key, value in document["results"].items()}
+
+
+class Change(t.NamedTuple):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def compare(
+    baseline: t.Dict[str, Measurement],
+    current: t.Dict[str, Measurement],
+    threshold: float = 0.10,
+    memoryThreshold: float = 0.10,
+) -> t.List[Change]:
+    changes: t.List[Change] = list()
+    for key, measurement in current.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        # A slowdown only counts when even the fastest run is slower than the
+        # baseline median, so a single noisy sample cannot fail the suite.
+        slower = (
+            measurement.median > reference.median * (1 + threshold)
+            and measurement.min > reference.median
+        )
+        changes.append(
+            Change(key, "time", reference.median, measurement.median, slower)
+        )
+        heavier = measurement.peakMemory > reference.peakMemory * (1 + memoryThreshold)
+        changes.append(
+            Change(key, "memory", reference.peakMemory, measurement.peakMemory, heavier)
+        )
+    return changes
+
+
+def formatChanges(changes: t.Sequence[Change]) -> str:
+    rows = list()
+    for change in changes:
+        fmt = formatDuration if change.metric == "time" else formatBytes
+        rows.append(
+            [
+                change.key,
+                change.metric,
+                fmt(change.baseline),
+                fmt(change.current),
+                f"{change.ratio:+.1%}",
+                "REGRESSION" if change.regressed else "",
+            ]
+        )
+    return formatTable(
+        ["benchmark", "metric", "baseline", "current", "change", ""], rows
+    )
+
+
+def formatMeasurements(results: t.Dict[str, Measurement]) -> str:
+    rows = [
+        [
+            key,
+            formatDuration(m.median),
+            formatDuration(m.min),
+            formatDuration(m.p95),
+            formatBytes(m.peakMemory),
+            f"{m.samples} (-{m.rejected})",
+        ]
+        for key, m in results.items()
+    ]
+    return formatTable(
+        ["benchmark", "median", "min", "p95", "peak mem", "samples"], rows
+    )
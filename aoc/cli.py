@@ -0,0 +1,676 @@
+import argparse
+import json
+import itertools
+import os
+import sys
+import typing as t
+from pathlib import Path
+
+from aoc import progress, trace
+from aoc.lazy import lazyImport
+from aoc.runner import formatReport, runSolution
+from aoc.solutions import PARTS, ROOT, Solution, iterDays
+from aoc.timing import formatDuration
+
+# Only the modules of the command being run get imported
+batch = lazyImport("aoc.batch")
+bench = lazyImport("aoc.bench")
+differential = lazyImport("aoc.differential")
+fetch = lazyImport("aoc.fetch")
+generators = lazyImport("aoc.generators")
+memory = lazyImport("aoc.memory")
+modelcache = lazyImport("aoc.modelcache")
+profiling = lazyImport("aoc.profiling")
+render = lazyImport("aoc.render")
+scaling = lazyImport("aoc.scaling")
+startup = lazyImport("aoc.startup")
+sweep = lazyImport("aoc.sweep")
+watch = lazyImport("aoc.watch")
+
+
+def selectedDays(year: int, day: t.Optional[int]) -> t.List[int]:
+    return [day] if day is not None else list(iterDays(year))
+
+
+def profileCommand(args: argparse.Namespace) -> int:
+    directory = Path(args.profile_dir) if args.profile_dir else None
+    for day in selectedDays(args.year, args.day):
+        profiles = profiling.profileSolution(
+            Solution.load(args.year, day),
+            parts=[args.part] if args.part else PARTS,
+            inputNames=args.input,
+            **({"directory": directory} if directory else {}),
+        )
+        for profile in profiles:
+            print(f"=== {profile.solution} {profile.inputName} {profile.phase}")
+            print(profiling.hotFunctions(profile.stats, limit=args.top))
+            print("Wrote " + ", ".join(str(path) for path in profile.files) + "\n")
+    return 0
+
+
+def memoryCommand(args: argparse.Namespace) -> int:
+    for day in selectedDays(args.year, args.day):
+        profiles = memory.memoryProfileSolution(
+            Solution.load(args.year, day),
+            parts=[args.part] if args.part else PARTS,
+            inputNames=args.input,
+            limit=args.top,
+        )
+        print(memory.formatMemoryProfiles(profiles) + "\n")
+    return 0
+
+
+def runCommand(args: argparse.Namespace) -> int:
+    if args.trace or args.trace_file:
+        trace.configure(args.trace, args.trace_file)
+    if args.progress is not None or args.progress_file:
+        progress.configure(args.progress or 1.0, args.progress_file)
+    if args.parse_cache:
+        modelcache.configure(True)
+    if args.persist_memo:
+        from aoc import memo
+
+        memo.configure(True)
+    if args.profile:
+        return profileCommand(args)
+    if args.memory:
+        return memoryCommand(args)
+    results, memoStats = list(), list()
+    for day in selectedDays(args.year, args.day):
+        solution = Solution.load(args.year, day)
+        results += runSolution(
+            solution,
+            parts=[args.part] if args.part else PARTS,
+            inputNames=args.input,
+            repeat=args.repeat,
+            verbose=args.verbose,
+            parse=modelcache.parser(solution) if args.parse_cache else None,
+            checkMutation=args.check_mutation,
+        )
+        # Only days that memoize import aoc.memo; the next day's timed calls
+        # empty the memos, so their counts are taken now
+        memos = sys.modules.get("aoc.memo")
+        if memos is not None:
+            memoStats += memos.snapshot()
+    print(formatReport(results))
+    if memoStats:
+        print("\n" + memos.formatMemos(memoStats))
+    return 1 if any(result.failed for result in results) else 0
+
+
+def sweepCommand(args: argparse.Namespace) -> int:
+    jobs = sweep.collectJobs(
+        args.year,
+        selectedDays(args.year, args.day),
+        parts=[args.part] if args.part else PARTS,
+        inputNames=args.input,
+    )
+    report = sweep.sweep(jobs, workers=args.workers, force=args.force)
+    print(formatReport(report.results))
+    print(
+        f"\n{len(jobs)} jobs ({report.cached} cached) on {report.workers} workers: "
+        f"{formatDuration(report.wall)} wall, {formatDuration(report.serial)} serial"
+    )
+    if args.json:
+        Path(args.json).write_text(json.dumps(report.asDict(), indent=2) + "\n")
+    return 1 if any(result.failed for result in report.results) else 0
+
+
+def batchCommand(args: argparse.Namespace) -> int:
+    parts = [args.part] if args.part else PARTS
+    try:
+        # Before opening the output, so a typo leaves no empty file behind
+        inputPaths = batch.expandInputs(args.inputs)
+    except FileNotFoundError as error:
+        print(error, file=sys.stderr)
+        return 1
+    if args.output is None:
+        errors = batch.runBatch(args.year, args.day, inputPaths, parts, args.workers)
+        return 1 if errors else 0
+    with open(args.output, "w") as file:
+        errors = batch.runBatch(
+            args.year, args.day, inputPaths, parts, args.workers, out=file
+        )
+    return 1 if errors else 0
+
+
+def watchCommand(args: argparse.Namespace) -> int:
+    try:
+        watch.watch(
+            args.year,
+            selectedDays(args.year, args.day),
+            parts=[args.part] if args.part else PARTS,
+            inputNames=args.input,
+            interval=args.interval,
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def benchCommand(args: argparse.Namespace) -> int:
+    if args.parse_cache:
+        modelcache.configure(True)
+    results = dict()
+    for day in selectedDays(args.year, args.day):
+        solution = Solution.load(args.year, day)
+        results.update(
+            bench.benchmarkSolution(
+                solution,
+                parts=[args.part] if args.part else PARTS,
+                inputNames=args.input,
+                parse=modelcache.parser(solution) if args.parse_cache else None,
+                repeat=args.repeat,
+                warmup=args.warmup,
+                maxTime=args.max_time,
+            )
+        )
+    print(bench.formatMeasurements(results))
+
+    path = Path(args.baseline) if args.baseline else bench.baselinePath()
+    if args.save:
+        bench.saveBaseline(results, path)
+        print(f"\nSaved baseline to {path}")
+        return 0
+    if not path.exists():
+        print(f"\nNo baseline at {path}; record one with --save")
+        return 0
+
+    changes = bench.compare(
+        bench.loadBaseline(path), results, args.threshold, args.memory_threshold
+    )
+    print("\n" + bench.formatChanges(changes))
+    regressions = [change for change in changes if change.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {path}")
+        return 1
+    return 0
+
+
+def startupCommand(args: argparse.Namespace) -> int:
+    interpreter = startup.interpreterTime(args.repeat)
+    startups = [
+        startup.measureStartup(
+            Solution.load(args.year, day),
+            inputName=args.input,
+            repeat=args.repeat,
+            interpreter=interpreter,
+            limit=args.top,
+        )
+        for day in selectedDays(args.year, args.day)
+    ]
+    print(startup.formatStartups(startups))
+    return 0
+
+
+def footprintCommand(args: argparse.Namespace) -> int:
+    footprints = [
+        memory.measureFootprint(Solution.load(args.year, day), args.factor)
+        for day in selectedDays(args.year, args.day)
+        if (args.year, day) in scaling.SCALERS
+    ]
+    print(memory.formatFootprints(footprints, memory.loadFootprints()))
+    if args.save:
+        memory.saveFootprints(footprints)
+        print(f"\nSaved bytes per item to {memory.FOOTPRINTS_PATH}")
+    return 0
+
+
+def diffCommand(args: argparse.Namespace) -> int:
+    reports = list()
+    for day in selectedDays(args.year, args.day):
+        reports += differential.checkEngines(
+            Solution.load(args.year, day),
+            engines=args.engine,
+            parts=[args.part] if args.part else PARTS,
+            cases=args.cases,
+            seed=args.seed,
+            maxSize=args.max_size,
+            data=not args.no_data,
+            minimizeSeconds=args.minimize_seconds,
+        )
+    if not reports:
+        print("No engines to check; days list them in ENGINES")
+        return 0
+    print(differential.formatEngineReports(reports))
+    return 1 if any(report.failed for report in reports) else 0
+
+
+def fetchCommand(args: argparse.Namespace) -> int:
+    import asyncio
+
+    try:
+        days = fetch.parseDays(args.days) if args.days else list(iterDays(args.year))
+        sessions = fetch.parseSessions(
+            args.session or (["stub"] if args.stub else None)
+        )
+        destination = args.dest or fetch.defaultDestination(len(sessions))
+        # Stub inputs never land next to the real ones
+        root = fetch.STUB_DIRECTORY / "files" if args.stub else ROOT
+        targets = fetch.buildTargets(args.year, days, sessions, destination, root)
+    except (fetch.FetchError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    options = dict(
+        concurrency=args.concurrency,
+        rate=args.rate,
+        refresh=args.refresh,
+        overwrite=args.overwrite,
+    )
+    if args.stub:
+        stub = fetch.StubServer(latency=args.stub_latency)
+        report = asyncio.run(fetch.fetchFromStub(targets, stub, **options))
+    else:
+        report = asyncio.run(fetch.fetchAll(targets, args.base_url, **options))
+    print(fetch.formatFetch(report))
+    return 1 if any(outcome.error for outcome in report.outcomes) else 0
+
+
+def stubServerCommand(args: argparse.Namespace) -> int:
+    import asyncio
+
+    stub = fetch.StubServer(size=args.size, latency=args.latency)
+    try:
+        asyncio.run(fetch.serve(stub, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def animateCommand(args: argparse.Namespace) -> int:
+    solution = Solution.load(args.year, args.day)
+    frames = getattr(solution.module, "frames", None)
+    if frames is None:
+        print(f"{solution.name} has no frames(model, part)", file=sys.stderr)
+        return 1
+    inputName = args.input or solution.inputs()[0].name
+    model = solution.parseFile(solution.directory / inputName)
+    suffix = "raw" if args.raw else "frames"
+    output = Path(
+        args.output
+        or ROOT / ".aoc" / "frames" / f"{args.year}-{args.day:02d}-{args.part}.{suffix}"
+    )
+    animation = render.animate(
+        frames(model, args.part), output, args.limit, args.every, args.raw
+    )
+    height, width = animation.shape
+    print(
+        f"{animation.frames} frames of {width}x{height} "
+        f"({animation.keyFrames} key frames): "
+        f"{formatDuration(animation.produce)} simulating and painting, "
+        f"{formatDuration(animation.write)} writing, "
+        f"{animation.bytes / 1024:.1f} KiB in {output}"
+    )
+    if args.raw:
+        print(
+            f"ffmpeg -f rawvideo -pix_fmt gray -s {width}x{height} -r 30 "
+            f"-i {output} -vf scale=iw*4:ih*4:flags=neighbor out.mp4"
+        )
+    return 0
+
+
+def playCommand(args: argparse.Namespace) -> int:
+    try:
+        render.play(Path(args.file), fps=args.fps, every=args.every)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def parseParam(text: str) -> t.Tuple[str, t.Union[int, float]]:
+    name, _, value = text.partition("=")
+    try:
+        return name, int(value)
+    except ValueError:
+        return name, float(value)
+
+
+def generateCommand(args: argparse.Namespace) -> int:
+    name = f"{args.year}/{args.day:02d}"
+    if (args.year, args.day) not in generators.GENERATORS:
+        print(f"No input generator for {name}", file=sys.stderr)
+        return 1
+    try:
+        lines = generators.generate(
+            args.year, args.day, args.size, seed=args.seed, **dict(args.param or [])
+        )
+        # Generators check their arguments when the first line is asked for
+        lines = itertools.chain([next(lines)], lines)
+    except StopIteration:
+        lines = iter([])
+    except (TypeError, ValueError) as error:
+        print(f"{name}: {error}", file=sys.stderr)
+        return 1
+    if args.check:
+        # The day has to parse what its generator writes
+        lines = list(lines)
+        try:
+            Solution.load(args.year, args.day).parse("\n".join(lines))
+        except Exception as error:
+            print(f"{name} cannot parse it: {error!r}", file=sys.stderr)
+            return 1
+    if args.output is None:
+        generators.writeInput(lines, sys.stdout)
+        return 0
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as file:
+        generators.writeInput(lines, file)
+    return 0
+
+
+def scaleCommand(args: argparse.Namespace) -> int:
+    points = list()
+    for day in selectedDays(args.year, args.day):
+        points += scaling.measureScaling(
+            Solution.load(args.year, day),
+            factors=args.factors,
+            parts=[args.part] if args.part else PARTS,
+            repeat=args.repeat,
+            budget=args.budget,
+        )
+    fits = scaling.fitPoints(points)
+    print(scaling.formatScaling(points, fits))
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            scaling.writeCsv(points, fits, file)
+    return 0
+
+
+def addSelectionArguments(parser: argparse.ArgumentParser):
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int, nargs="?", help="all days when omitted")
+    parser.add_argument("--part", type=int, choices=PARTS)
+    parser.add_argument(
+        "--input", action="append", help="input file name, e.g. test.txt (repeatable)"
+    )
+
+
+def buildParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run, check and time solutions")
+    addSelectionArguments(run)
+    run.add_argument("--repeat", type=int, default=5, help="calls per phase")
+    run.add_argument("--verbose", action="store_true", help="show solver output")
+    run.add_argument(
+        "--trace",
+        help='trace levels per day, e.g. "debug" or "info,2024/06=debug"',
+    )
+    run.add_argument("--trace-file", help="write traces here instead of stderr")
+    run.add_argument(
+        "--progress",
+        type=float,
+        nargs="?",
+        const=1.0,
+        metavar="SECONDS",
+        help="report progress of long loops to stderr every SECONDS (default 1)",
+    )
+    run.add_argument("--progress-file", help="also append progress as JSON lines")
+    run.add_argument(
+        "--parse-cache",
+        action="store_true",
+        default=bool(os.environ.get("AOC_PARSE_CACHE")),
+        help="load parsed models from .aoc/models when input and code are unchanged",
+    )
+    run.add_argument(
+        "--persist-memo",
+        action="store_true",
+        help="keep memos of functions marked persist=True in .aoc/memo",
+    )
+    run.add_argument(
+        "--check-mutation",
+        action="store_true",
+        help="fail a part that changes the model both parts share",
+    )
+    run.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile each phase once instead of timing it",
+    )
+    run.add_argument(
+        "--profile-dir", help="where to write profiles (default .aoc/profiles)"
+    )
+    run.add_argument(
+        "--memory",
+        action="store_true",
+        help="report peak allocations, peak RSS and top allocation sites",
+    )
+    run.add_argument(
+        "--top", type=int, default=15, help="hot functions / allocation sites to print"
+    )
+    run.set_defaults(handler=runCommand)
+
+    sweepParser = commands.add_parser(
+        "sweep", help="run every day/part in parallel, longest first"
+    )
+    addSelectionArguments(sweepParser)
+    sweepParser.add_argument("--workers", type=int, help="defaults to the CPU count")
+    sweepParser.add_argument("--json", help="also write the report to this file")
+    sweepParser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-run jobs whose input and code are unchanged since the last sweep",
+    )
+    sweepParser.set_defaults(handler=sweepCommand)
+
+    batchParser = commands.add_parser(
+        "batch", help="solve one day for many inputs in one process, as JSON lines"
+    )
+    batchParser.add_argument("year", type=int)
+    batchParser.add_argument("day", type=int)
+    batchParser.add_argument(
+        "inputs", nargs="+", help="input files, directories or glob patterns"
+    )
+    batchParser.add_argument("--part", type=int, choices=PARTS)
+    batchParser.add_argument(
+        "--workers", type=int, default=1, help="processes; 0 for one per CPU"
+    )
+    batchParser.add_argument("-o", "--output", help="defaults to stdout")
+    batchParser.set_defaults(handler=batchCommand)
+
+    watchParser = commands.add_parser(
+        "watch", help="keep days loaded and re-run what each saved file affects"
+    )
+    addSelectionArguments(watchParser)
+    watchParser.add_argument(
+        "--interval", type=float, default=0.05, help="seconds between file checks"
+    )
+    watchParser.set_defaults(handler=watchCommand)
+
+    benchParser = commands.add_parser(
+        "bench", help="benchmark against this machine's stored baseline"
+    )
+    addSelectionArguments(benchParser)
+    benchParser.add_argument("--repeat", type=int, default=5)
+    benchParser.add_argument("--warmup", type=int, default=1)
+    benchParser.add_argument(
+        "--max-time", type=float, default=10.0, help="seconds per benchmark"
+    )
+    benchParser.add_argument(
+        "--threshold", type=float, default=0.10, help="allowed slowdown (0.1 = 10%%)"
+    )
+    benchParser.add_argument(
+        "--memory-threshold", type=float, default=0.10, help="allowed memory growth"
+    )
+    benchParser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        default=bool(os.environ.get("AOC_PARSE_CACHE")),
+        help="time parse as a model cache load",
+    )
+    benchParser.add_argument("--baseline", help="defaults to one file per machine")
+    benchParser.add_argument(
+        "--save", action="store_true", help="record a new baseline"
+    )
+    benchParser.set_defaults(handler=benchCommand)
+
+    startupParser = commands.add_parser(
+        "startup", help="time interpreter, import and first result in fresh processes"
+    )
+    startupParser.add_argument("year", type=int)
+    startupParser.add_argument("day", type=int, nargs="?", help="all days when omitted")
+    startupParser.add_argument(
+        "--input", help="input file name (default: the day's first input)"
+    )
+    startupParser.add_argument("--repeat", type=int, default=5)
+    startupParser.add_argument(
+        "--top", type=int, default=3, help="heaviest imports to list"
+    )
+    startupParser.set_defaults(handler=startupCommand)
+
+    footprintParser = commands.add_parser(
+        "footprint", help="bytes per item the parsed models keep, on tiled inputs"
+    )
+    footprintParser.add_argument("year", type=int)
+    footprintParser.add_argument(
+        "day", type=int, nargs="?", help="all days when omitted"
+    )
+    footprintParser.add_argument(
+        "--factor", type=int, default=20, help="times to tile data.txt"
+    )
+    footprintParser.add_argument(
+        "--save", action="store_true", help="keep these figures to compare against"
+    )
+    footprintParser.set_defaults(handler=footprintCommand)
+
+    diffParser = commands.add_parser(
+        "diff", help="check the days' faster engines against solve1/solve2"
+    )
+    diffParser.add_argument("year", type=int)
+    diffParser.add_argument("day", type=int, nargs="?", help="all days when omitted")
+    diffParser.add_argument("--part", type=int, choices=PARTS)
+    diffParser.add_argument(
+        "--engine", action="append", help="engine name (repeatable; default all)"
+    )
+    diffParser.add_argument(
+        "--cases", type=int, default=200, help="generated inputs per engine and part"
+    )
+    diffParser.add_argument("--seed", type=int, default=0)
+    diffParser.add_argument(
+        "--max-size", type=int, default=8, help="largest generator size to try"
+    )
+    diffParser.add_argument(
+        "--no-data", action="store_true", help="skip the data*.txt inputs"
+    )
+    diffParser.add_argument(
+        "--minimize-seconds",
+        type=float,
+        default=10.0,
+        help="time to spend shrinking each failing input",
+    )
+    diffParser.set_defaults(handler=diffCommand)
+
+    fetchParser = commands.add_parser(
+        "fetch", help="download puzzle inputs concurrently into a local cache"
+    )
+    fetchParser.add_argument("year", type=int)
+    fetchParser.add_argument(
+        "days", nargs="?", help="e.g. 1-15 or 1,3,5-7 (default: the year's days)"
+    )
+    fetchParser.add_argument(
+        "--session",
+        action="append",
+        help="[name=]session cookie (repeatable; default AOC_SESSION or .aoc/session)",
+    )
+    fetchParser.add_argument(
+        "--dest",
+        help="path template with {year}, {day} and {account} "
+        "(default {year}/{day:02d}/data.txt, or inputs/{day:02d}/{account}.txt)",
+    )
+    fetchParser.add_argument("--concurrency", type=int, default=4)
+    fetchParser.add_argument(
+        "--rate", type=float, default=2.0, help="requests per second (0: no limit)"
+    )
+    fetchParser.add_argument(
+        "--refresh", action="store_true", help="revalidate inputs stored on disk"
+    )
+    fetchParser.add_argument(
+        "--overwrite", action="store_true", help="replace files that differ"
+    )
+    fetchParser.add_argument("--base-url", default="https://adventofcode.com")
+    fetchParser.add_argument(
+        "--stub", action="store_true", help="fetch from an in-process stub server"
+    )
+    fetchParser.add_argument("--stub-latency", type=float, default=0.02)
+    fetchParser.set_defaults(handler=fetchCommand)
+
+    stubParser = commands.add_parser(
+        "stub-server", help="serve generated inputs the way the puzzle site does"
+    )
+    stubParser.add_argument("--port", type=int, default=8000)
+    stubParser.add_argument("--size", type=int, default=50, help="generator size")
+    stubParser.add_argument("--latency", type=float, default=0.02)
+    stubParser.set_defaults(handler=stubServerCommand)
+
+    animateParser = commands.add_parser(
+        "animate", help="stream a day's map frames to a file as it solves"
+    )
+    animateParser.add_argument("year", type=int)
+    animateParser.add_argument("day", type=int)
+    animateParser.add_argument("--part", type=int, choices=PARTS, default=1)
+    animateParser.add_argument(
+        "--input", help="input file name (default: the day's first input)"
+    )
+    animateParser.add_argument(
+        "--limit", type=int, default=10000, help="frames to write at most"
+    )
+    animateParser.add_argument("--every", type=int, default=1, help="keep every nth")
+    animateParser.add_argument(
+        "--raw", action="store_true", help="gray frames for ffmpeg instead of a log"
+    )
+    animateParser.add_argument(
+        "-o", "--output", help="default .aoc/frames/YEAR-DAY-PART.frames (.gz works)"
+    )
+    animateParser.set_defaults(handler=animateCommand)
+
+    playParser = commands.add_parser("play", help="replay a frame log in the terminal")
+    playParser.add_argument("file")
+    playParser.add_argument("--fps", type=float, default=30.0)
+    playParser.add_argument("--every", type=int, default=1, help="show every nth")
+    playParser.set_defaults(handler=playCommand)
+
+    generateParser = commands.add_parser(
+        "generate", help="write a seeded synthetic input of any size"
+    )
+    generateParser.add_argument("year", type=int)
+    generateParser.add_argument("day", type=int)
+    generateParser.add_argument(
+        "--size", type=int, required=True, help="lines, grid side, moves, ... per day"
+    )
+    generateParser.add_argument("--seed", type=int, default=0)
+    generateParser.add_argument(
+        "--param",
+        type=parseParam,
+        action="append",
+        help="extra generator argument, e.g. maxOperands=24",
+    )
+    generateParser.add_argument("-o", "--output", help="defaults to stdout")
+    generateParser.add_argument(
+        "--check", action="store_true", help="fail unless the day parses the input"
+    )
+    generateParser.set_defaults(handler=generateCommand)
+
+    scaleParser = commands.add_parser(
+        "scale", help="fit how time and memory grow with the input size"
+    )
+    scaleParser.add_argument("year", type=int)
+    scaleParser.add_argument("day", type=int, nargs="?", help="all days when omitted")
+    scaleParser.add_argument("--part", type=int, choices=PARTS)
+    scaleParser.add_argument("--factors", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    scaleParser.add_argument("--repeat", type=int, default=1)
+    scaleParser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="skip larger inputs once a phase takes this many seconds",
+    )
+    scaleParser.add_argument("--csv", help="also write the measurements here")
+    scaleParser.set_defaults(handler=scaleCommand)
+
+    return parser
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    args = buildParser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,327 @@
+import time
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc import generators
+from aoc.inputs import Input
+from aoc.runner import formatTable, jsonAnswer, silenced
+from aoc.solutions import PARTS, Solution
+from aoc.sweep import Job, jobDigest, loadAnswers, storedResult
+from aoc.timing import formatBytes, formatDuration, measure
+
+# Differential testing of the faster solvers a day lists in ENGINES against
+# its solve1/solve2, which stay the reference:
+#
+#     ENGINES = {"backward": {1: solve1Backward, 2: solve2Backward}}
+#
+# Each engine runs on the day's test*.txt and data*.txt files and on many small
+# generated inputs (aoc.generators, sizes 1..maxSize, one seed per case). Both
+# sides parse the input afresh, so neither sees what the other mutated; a file
+# is parsed under its own path, as days may tell inputs apart by name. An
+# engine raising counts as a disagreement. The reference failing to parse or
+# solve an input is reported as an error, since the day's files and its
+# generator's output are all inputs it has to handle; only cases the generator
+# itself cannot produce (it raises) are skipped.
+#
+# A disagreement is shrunk before it is reported: lines are dropped in
+# halving chunks, then columns of a grid or characters of other lines, for as
+# long as the engine still disagrees and the time budget lasts.
+#
+# Reference answers on files come from the sweep's stored answers when the
+# input and code are unchanged (run `python -m aoc sweep` once for the slow
+# days), so only the engine has to run. Times include parsing.
+
+# Generator arguments that keep the reference solvers quick on random cases
+SMALL_PARAMS: t.Dict[t.Tuple[int, int], t.Dict[str, t.Any]] = {
+    (2024, 7): {"maxOperands": 7},
+}
+
+
+@dataclass
+class Disagreement:
+    source: str
+    reference: t.Any
+    answer: t.Any
+    text: str
+    originalBytes: int
+
+
+@dataclass
+class Failure:
+    source: str
+    error: str
+
+
+@dataclass
+class EngineReport:
+    solution: str
+    engine: str
+    part: int
+    files: int = 0
+    generated: int = 0
+    skipped: int = 0
+    referenceTime: float = 0.0
+    engineTime: float = 0.0
+    disagreements: t.List[Disagreement] = field(default_factory=list)
+    failures: t.List[Failure] = field(default_factory=list)
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.disagreements or self.failures)
+
+
+# === Comparing =============================================================
+
+
+def runSolver(
+    solution: Solution,
+    part: int,
+    engine: t.Optional[str],
+    text: str,
+    path: t.Optional[Path] = None,
+) -> t.Any:
+    """Parse ``text`` as the file at ``path`` (if any) and solve it."""
+    # The Input keeps the file name, which days like 2024/14 parse by
+    source = Input(text.encode(), path)
+    with silenced():
+        return jsonAnswer(solution.solve(part, solution.parse(source), engine))
+
+
+def engineAnswer(
+    solution: Solution,
+    part: int,
+    engine: str,
+    text: str,
+    path: t.Optional[Path] = None,
+) -> t.Any:
+    try:
+        return runSolver(solution, part, engine, text, path)
+    except Exception as error:
+        return f"raised {error!r}"
+
+
+def disagrees(
+    solution: Solution,
+    part: int,
+    engine: str,
+    text: str,
+    path: t.Optional[Path] = None,
+) -> bool:
+    try:
+        reference = runSolver(solution, part, None, text, path)
+    except Exception:
+        return False
+    return engineAnswer(solution, part, engine, text, path) != reference
+
+
+# === Minimizing ============================================================
+
+
+def shrink(items: t.List[str], fails: t.Callable[[t.List[str]], bool]) -> t.List[str]:
+    """Drop chunks of halving size while ``fails`` holds for what is left."""
+    chunk = len(items) // 2
+    while chunk:
+        idx = 0
+        while idx < len(items):
+            candidate = items[:idx] + items[idx + chunk :]
+            if candidate and fails(candidate):
+                items = candidate
+            else:
+                idx += chunk
+        chunk //= 2
+    return items
+
+
+def minimize(text: str, fails: t.Callable[[str], bool], seconds: float) -> str:
+    deadline = time.perf_counter() + seconds
+
+    def check(candidate: str) -> bool:
+        return time.perf_counter() < deadline and fails(candidate)
+
+    lines = shrink(text.split("\n"), lambda lines: check("\n".join(lines)))
+    width = len(lines[0])
+    if len(lines) > 1 and all(len(line) == width for line in lines):
+        # A grid has to stay rectangular: drop whole columns
+        columns = shrink(
+            ["".join(column) for column in zip(*lines)],
+            lambda columns: check("\n".join(map("".join, zip(*columns)))),
+        )
+        return "\n".join(map("".join, zip(*columns)))
+    for idx in range(len(lines)):
+        chars = shrink(
+            list(lines[idx]),
+            lambda chars: check(
+                "\n".join(lines[:idx] + ["".join(chars)] + lines[idx + 1 :])
+            ),
+        )
+        lines[idx] = "".join(chars)
+    return "\n".join(lines)
+
+
+# === Checking engines ======================================================
+
+
+def inputFiles(solution: Solution, data: bool = True) -> t.List[Path]:
+    prefixes = ("test", "data") if data else ("test",)
+    return sorted(
+        path
+        for path in solution.directory.glob("*.txt")
+        if path.name.startswith(prefixes)
+    )
+
+
+def generatedCase(
+    solution: Solution, index: int, seed: int, maxSize: int
+) -> t.Tuple[str, str]:
+    size = 1 + index % maxSize
+    params = SMALL_PARAMS.get((solution.year, solution.day), {})
+    lines = generators.generate(
+        solution.year, solution.day, size, seed + index, **params
+    )
+    return f"seed {seed + index}, size {size}", "\n".join(lines)
+
+
+def checkEngine(
+    solution: Solution,
+    engine: str,
+    part: int,
+    cases: int = 200,
+    seed: int = 0,
+    maxSize: int = 8,
+    data: bool = True,
+    minimizeSeconds: float = 10.0,
+) -> EngineReport:
+    report = EngineReport(solution.name, engine, part)
+    stored = loadAnswers()
+
+    def record(
+        source: str,
+        reference: t.Any,
+        answer: t.Any,
+        text: str,
+        path: t.Optional[Path] = None,
+    ):
+        shrunk = minimize(
+            text,
+            lambda text: disagrees(solution, part, engine, text, path),
+            minimizeSeconds,
+        )
+        report.disagreements.append(
+            Disagreement(source, reference, answer, shrunk, len(text.encode()))
+        )
+
+    for path in inputFiles(solution, data):
+        text = path.read_text()
+        job = Job(solution.year, solution.day, path.name, part)
+        result = storedResult(job, jobDigest(job), stored)
+        if result is not None:
+            reference = result.answer
+            report.referenceTime += result.stats.cold.wall
+        else:
+            try:
+                reference, sample = measure(runSolver, solution, part, None, text, path)
+            except Exception as error:
+                report.failures.append(Failure(path.name, repr(error)))
+                continue
+            report.referenceTime += sample.wall
+        answer, sample = measure(engineAnswer, solution, part, engine, text, path)
+        report.engineTime += sample.wall
+        report.files += 1
+        if answer != reference:
+            record(path.name, reference, answer, text, path)
+
+    if (solution.year, solution.day) not in generators.GENERATORS:
+        return report
+    for index in range(cases):
+        try:
+            source, text = generatedCase(solution, index, seed, maxSize)
+        except Exception:
+            # No valid input for these arguments
+            report.skipped += 1
+            continue
+        try:
+            reference = runSolver(solution, part, None, text)
+        except Exception as error:
+            # Like disagreements, one failing case is enough
+            report.failures.append(Failure(source, repr(error)))
+            break
+        report.generated += 1
+        answer = engineAnswer(solution, part, engine, text)
+        if answer != reference:
+            # One minimized generated case says enough; the rest would repeat it
+            record(source, reference, answer, text)
+            break
+    return report
+
+
+def checkEngines(
+    solution: Solution,
+    engines: t.Optional[t.Sequence[str]] = None,
+    parts: t.Sequence[int] = PARTS,
+    **options,
+) -> t.List[EngineReport]:
+    return [
+        checkEngine(solution, engine, part, **options)
+        for engine, solvers in solution.engines.items()
+        if not engines or engine in engines
+        for part in parts
+        if part in solvers
+    ]
+
+
+# === Reporting =============================================================
+
+
+def formatEngineReports(reports: t.Sequence[EngineReport]) -> str:
+    header = [
+        "day",
+        "engine",
+        "part",
+        "files",
+        "generated",
+        "skipped",
+        "disagree",
+        "errors",
+        "reference",
+        "engine time",
+        "speedup",
+    ]
+    rows = [
+        [
+            report.solution,
+            report.engine,
+            str(report.part),
+            str(report.files),
+            str(report.generated),
+            str(report.skipped),
+            str(len(report.disagreements)),
+            str(len(report.failures)),
+            formatDuration(report.referenceTime),
+            formatDuration(report.engineTime),
+            (
+                f"{report.referenceTime / report.engineTime:.1f}x"
+                if report.engineTime
+                else "-"
+            ),
+        ]
+        for report in reports
+    ]
+    lines = [formatTable(header, rows)]
+    for report in reports:
+        for failure in report.failures:
+            lines += [
+                "",
+                f"{report.solution} part {report.part} on {failure.source}: "
+                f"the reference raised {failure.error}",
+            ]
+        for case in report.disagreements:
+            lines += [
+                "",
+                f"{report.solution} {report.engine} part {report.part} on "
+                f"{case.source}: reference {case.reference}, engine {case.answer}",
+                f"minimized to {formatBytes(len(case.text.encode()))} "
+                f"from {formatBytes(case.originalBytes)}:",
+                *(f"    {line}" for line in case.text.split("\n")),
+            ]
+    return "\n".join(lines)
@@ -0,0 +1,599 @@
+import asyncio
+import hashlib
+import json
+import os
+import ssl
+import time
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from aoc import generators
+from aoc.runner import formatTable
+from aoc.solutions import ROOT
+from aoc.sweep import STATE_DIRECTORY
+from aoc.timing import formatBytes, formatDuration
+
+# Puzzle inputs downloaded in bulk, for the data.txt files and for provisioning
+# many accounts' inputs for `batch`. All requests share one pool of keep-alive
+# HTTP/1.1 connections (at most ``concurrency`` of them) and start no faster
+# than ``rate`` per second; 5xx and 429 answers are retried with backoff.
+#
+# Bodies are stored content-addressed under .aoc/inputs/objects/ with an index
+# of account, day, digest, ETag and Last-Modified. A stored input is served from
+# disk without any request; --refresh revalidates it with If-None-Match /
+# If-Modified-Since, so an unchanged input costs a 304 and no body. Destination
+# files are only written when their content differs, and their mtime and size
+# are kept so that unchanged ones need not be read again.
+#
+# StubServer serves generated inputs the same way (cookie, ETag, 304,
+# keep-alive) on localhost, so all of this runs offline:
+#
+#     python -m aoc fetch 2024 1-15 --stub
+#
+# The client is plain asyncio streams, so there is nothing to install.
+
+STORE_DIRECTORY = STATE_DIRECTORY / "inputs"
+STUB_DIRECTORY = STATE_DIRECTORY / "stub"
+BASE_URL = "https://adventofcode.com"
+USER_AGENT = "python -m aoc fetch (bulk input download, rate limited)"
+
+RETRIES = 3
+
+
+class FetchError(Exception):
+    pass
+
+
+# === HTTP ==================================================================
+
+
+class Response(t.NamedTuple):
+    status: int
+    headers: t.Dict[str, str]
+    body: bytes
+
+
+async def readHeaders(reader: asyncio.StreamReader) -> t.Dict[str, str]:
+    headers: t.Dict[str, str] = dict()
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def readChunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = list()
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip(), 16)
+        if size == 0:
+            await readHeaders(reader)  # trailers
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+async def exchange(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    host: str,
+    path: str,
+    headers: t.Dict[str, str],
+) -> t.Tuple[Response, bool]:
+    """One GET on an open connection; returns the response and keep-alive."""
+    lines = [f"GET {path} HTTP/1.1", f"Host: {host}", "Connection: keep-alive"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    await writer.drain()
+
+    statusLine = await reader.readline()
+    if not statusLine:
+        raise ConnectionResetError("connection closed before the response")
+    version, status, *_ = statusLine.decode("latin-1").split(" ", 2)
+    received = await readHeaders(reader)
+    keepAlive = (
+        version == "HTTP/1.1" and received.get("connection", "").lower() != "close"
+    )
+    if "chunked" in received.get("transfer-encoding", "").lower():
+        body = await readChunked(reader)
+    elif "content-length" in received:
+        body = await reader.readexactly(int(received["content-length"]))
+    elif int(status) in (204, 304):
+        body = b""
+    else:
+        body, keepAlive = await reader.read(), False
+    return Response(int(status), received, body), keepAlive
+
+
+Connection = t.Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class ConnectionPool:
+    """Keep-alive connections to one host, at most ``size`` in use at once."""
+
+    def __init__(self, baseUrl: str, size: int = 4):
+        url = urlsplit(baseUrl)
+        secure = url.scheme == "https"
+        self.host = url.hostname or "localhost"
+        self.port = url.port or (443 if secure else 80)
+        self.hostHeader = url.netloc
+        self.sslContext = ssl.create_default_context() if secure else None
+        self.slots = asyncio.Semaphore(size)
+        self.idle: t.List[Connection] = list()
+        self.opened = 0
+        self.requests = 0
+
+    async def connect(self) -> Connection:
+        connection = await asyncio.open_connection(
+            self.host, self.port, ssl=self.sslContext
+        )
+        self.opened += 1
+        return connection
+
+    async def get(self, path: str, headers: t.Dict[str, str]) -> Response:
+        async with self.slots:
+            while True:
+                reused = bool(self.idle)
+                reader, writer = self.idle.pop() if reused else await self.connect()
+                try:
+                    response, keepAlive = await exchange(
+                        reader, writer, self.hostHeader, path, headers
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        # The server dropped the idle connection; use another
+                        continue
+                    raise
+                self.requests += 1
+                if keepAlive:
+                    self.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return response
+
+    async def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        for _, writer in self.idle:
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.idle.clear()
+
+
+class RateLimiter:
+    """Spaces out request starts to ``rate`` per second (0: no limit)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self.next = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            if self.next > now:
+                await asyncio.sleep(self.next - now)
+            self.next = max(now, self.next) + self.interval
+
+
+async def getWithRetries(
+    pool: ConnectionPool,
+    limiter: RateLimiter,
+    path: str,
+    headers: t.Dict[str, str],
+) -> Response:
+    for attempt in range(RETRIES):
+        await limiter.wait()
+        try:
+            response = await pool.get(path, headers)
+        except (OSError, asyncio.IncompleteReadError):
+            if attempt == RETRIES - 1:
+                raise
+            await asyncio.sleep(2**attempt)
+            continue
+        if response.status != 429 and response.status < 500:
+            return response
+        if attempt < RETRIES - 1:
+            retryAfter = response.headers.get("retry-after", "")
+            await asyncio.sleep(int(retryAfter) if retryAfter.isdigit() else 2**attempt)
+    return response
+
+
+# === Store =================================================================
+
+
+def contentDigest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def writeAtomically(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    partial.write_bytes(data)
+    partial.replace(path)
+
+
+class Store:
+    """Content-addressed input bodies and what is known about each download."""
+
+    def __init__(self, directory: Path = STORE_DIRECTORY):
+        self.directory = directory
+        self.indexPath = directory / "index.json"
+        index = (
+            json.loads(self.indexPath.read_text()) if self.indexPath.exists() else {}
+        )
+        self.entries: t.Dict[str, t.Dict[str, t.Any]] = index.get("entries", {})
+        # Destination path -> [mtime_ns, size, digest] when last written or seen
+        self.files: t.Dict[str, t.List[t.Any]] = index.get("files", {})
+
+    def objectPath(self, digest: str) -> Path:
+        return self.directory / "objects" / f"{digest}.txt"
+
+    def lookup(self, key: str) -> t.Optional[t.Dict[str, t.Any]]:
+        entry = self.entries.get(key)
+        if entry is None or not self.objectPath(entry["digest"]).exists():
+            return None
+        return entry
+
+    def put(self, key: str, response: Response) -> t.Dict[str, t.Any]:
+        digest = contentDigest(response.body)
+        path = self.objectPath(digest)
+        if not path.exists():
+            writeAtomically(path, response.body)
+        entry = self.entries[key] = {
+            "digest": digest,
+            "bytes": len(response.body),
+            "etag": response.headers.get("etag"),
+            "lastModified": response.headers.get("last-modified"),
+            "checked": time.time(),
+        }
+        return entry
+
+    def fileDigest(self, path: Path) -> t.Optional[str]:
+        """Digest of a destination file, read only when mtime or size moved."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        known = self.files.get(str(path))
+        if known is not None and known[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return known[2]
+        digest = contentDigest(path.read_bytes())
+        self.files[str(path)] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def save(self):
+        index = {"entries": self.entries, "files": self.files}
+        writeAtomically(
+            self.indexPath,
+            (json.dumps(index, indent=2, sort_keys=True) + "\n").encode(),
+        )
+
+
+# === Fetching ==============================================================
+
+
+@dataclass
+class Target:
+    year: int
+    day: int
+    account: str
+    session: str
+    destination: Path
+
+    @property
+    def key(self) -> str:
+        return f"{self.account} {self.year}/{self.day:02d}"
+
+    @property
+    def path(self) -> str:
+        return f"/{self.year}/day/{self.day}/input"
+
+
+@dataclass
+class Outcome:
+    target: Target
+    source: str  # disk, download, not modified or error
+    written: str = "-"  # written, unchanged or kept (differs)
+    digest: t.Optional[str] = None
+    size: int = 0
+    seconds: float = 0.0
+    error: t.Optional[str] = None
+
+
+def place(store: Store, target: Target, digest: str, overwrite: bool) -> str:
+    current = store.fileDigest(target.destination)
+    if current == digest:
+        return "unchanged"
+    if current is not None and not overwrite:
+        return "kept (differs)"
+    writeAtomically(target.destination, store.objectPath(digest).read_bytes())
+    store.files.pop(str(target.destination), None)
+    store.fileDigest(target.destination)
+    return "written"
+
+
+async def fetchOne(
+    target: Target,
+    pool: ConnectionPool,
+    limiter: RateLimiter,
+    store: Store,
+    refresh: bool = False,
+    overwrite: bool = False,
+) -> Outcome:
+    start = time.perf_counter()
+    outcome = Outcome(target, "disk")
+    try:
+        # Per host, so a stub or mirror never stands in for the real site
+        key = f"{pool.host} {target.key}"
+        entry = store.lookup(key)
+        if entry is None or refresh:
+            headers = {"Cookie": f"session={target.session}", "User-Agent": USER_AGENT}
+            if entry is not None and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry is not None and entry.get("lastModified"):
+                headers["If-Modified-Since"] = entry["lastModified"]
+            response = await getWithRetries(pool, limiter, target.path, headers)
+            if response.status == 304 and entry is not None:
+                outcome.source = "not modified"
+                entry["checked"] = time.time()
+            elif response.status == 200:
+                outcome.source = "download"
+                entry = store.put(key, response)
+            else:
+                message = response.body[:80].decode("utf-8", "replace").strip()
+                raise FetchError(f"HTTP {response.status}: {message}")
+        outcome.digest, outcome.size = entry["digest"], entry["bytes"]
+        outcome.written = place(store, target, entry["digest"], overwrite)
+    except (FetchError, OSError, asyncio.IncompleteReadError) as error:
+        outcome.source, outcome.error = "error", str(error) or repr(error)
+    outcome.seconds = time.perf_counter() - start
+    return outcome
+
+
+@dataclass
+class FetchReport:
+    outcomes: t.List[Outcome]
+    requests: int
+    connections: int
+    wall: float
+
+
+async def fetchAll(
+    targets: t.Sequence[Target],
+    baseUrl: str = BASE_URL,
+    concurrency: int = 4,
+    rate: float = 2.0,
+    refresh: bool = False,
+    overwrite: bool = False,
+    store: t.Optional[Store] = None,
+) -> FetchReport:
+    store = store or Store()
+    pool, limiter = ConnectionPool(baseUrl, concurrency), RateLimiter(rate)
+    start = time.perf_counter()
+    try:
+        outcomes = await asyncio.gather(
+            *(
+                fetchOne(target, pool, limiter, store, refresh, overwrite)
+                for target in targets
+            )
+        )
+    finally:
+        await pool.close()
+        store.save()
+    return FetchReport(
+        list(outcomes), pool.requests, pool.opened, time.perf_counter() - start
+    )
+
+
+# === Targets ===============================================================
+
+
+def parseDays(text: str) -> t.List[int]:
+    """ "1-5,8,10-12" -> [1, 2, 3, 4, 5, 8, 10, 11, 12]."""
+    days: t.Dict[int, None] = dict()
+    for part in text.split(","):
+        first, _, last = part.partition("-")
+        try:
+            days.update(dict.fromkeys(range(int(first), int(last or first) + 1)))
+        except ValueError:
+            raise ValueError(f"days are numbers and ranges like 1-5,8: {text}")
+    if not all(1 <= day <= 25 for day in days):
+        raise ValueError(f"days have to be within 1-25: {text}")
+    return list(days)
+
+
+def parseSessions(values: t.Optional[t.Sequence[str]]) -> t.Dict[str, str]:
+    """``[name=]token`` values, else AOC_SESSION, else .aoc/session."""
+    if not values:
+        token = os.environ.get("AOC_SESSION")
+        sessionFile = STATE_DIRECTORY / "session"
+        if not token and sessionFile.exists():
+            token = sessionFile.read_text().strip()
+        if not token:
+            raise FetchError(
+                "No session: pass --session, set AOC_SESSION or write .aoc/session"
+            )
+        values = [token]
+    sessions: t.Dict[str, str] = dict()
+    for idx, value in enumerate(values):
+        name, _, token = value.partition("=") if "=" in value else ("", "", value)
+        if not name:
+            name = "default" if len(values) == 1 else f"account{idx + 1}"
+        sessions[name] = token
+    return sessions
+
+
+def defaultDestination(accounts: int) -> str:
+    if accounts == 1:
+        return "{year}/{day:02d}/data.txt"
+    return "inputs/{day:02d}/{account}.txt"
+
+
+def buildTargets(
+    year: int,
+    days: t.Sequence[int],
+    sessions: t.Dict[str, str],
+    destination: str,
+    root: Path = ROOT,
+) -> t.List[Target]:
+    if len(sessions) > 1 and "{account}" not in destination:
+        raise FetchError("With several sessions the destination needs {account}")
+    return [
+        Target(
+            year,
+            day,
+            account,
+            token,
+            root / destination.format(year=year, day=day, account=account),
+        )
+        for day in days
+        for account, token in sessions.items()
+    ]
+
+
+def formatFetch(report: FetchReport) -> str:
+    header = ["day", "account", "source", "file", "size", "digest", "time", "path"]
+    rows = [
+        [
+            f"{outcome.target.year}/{outcome.target.day:02d}",
+            outcome.target.account,
+            outcome.source,
+            outcome.written,
+            formatBytes(outcome.size) if outcome.digest else "-",
+            outcome.digest[:12] if outcome.digest else outcome.error or "-",
+            formatDuration(outcome.seconds),
+            (
+                str(outcome.target.destination.relative_to(ROOT))
+                if outcome.target.destination.is_relative_to(ROOT)
+                else str(outcome.target.destination)
+            ),
+        ]
+        for outcome in report.outcomes
+    ]
+    counts: t.Dict[str, int] = dict()
+    for outcome in report.outcomes:
+        counts[outcome.source] = counts.get(outcome.source, 0) + 1
+    summary = ", ".join(f"{count} {source}" for source, count in counts.items())
+    return (
+        formatTable(header, rows)
+        + f"\n\n{len(report.outcomes)} inputs ({summary}); {report.requests} "
+        f"requests over {report.connections} connection(s) in "
+        f"{formatDuration(report.wall)}"
+    )
+
+
+# === Stub server ===========================================================
+
+
+class StubServer:
+    """Serves generated inputs like the real site, for offline runs.
+
+    Every session gets its own input per day (days without a generator are
+    404); answers carry an ETag and Last-Modified and honour conditional
+    requests. ``latency`` delays each answer to make concurrency visible.
+    """
+
+    LAST_MODIFIED = "Sun, 01 Dec 2024 05:00:00 GMT"
+
+    def __init__(self, size: int = 50, latency: float = 0.02):
+        self.size = size
+        self.latency = latency
+        self.requests = 0
+        self.connections = 0
+        self.server: t.Optional[asyncio.AbstractServer] = None
+
+    def body(self, year: int, day: int, session: str) -> bytes:
+        seed = int(hashlib.blake2b(session.encode(), digest_size=4).hexdigest(), 16)
+        lines = generators.generate(year, day, self.size, seed)
+        return "\n".join(lines).encode()
+
+    def respond(
+        self, path: str, headers: t.Dict[str, str]
+    ) -> t.Tuple[int, t.Dict[str, str], bytes]:
+        parts = path.strip("/").split("/")
+        cookie = headers.get("cookie", "")
+        if len(parts) != 4 or parts[1] != "day" or parts[3] != "input":
+            return 404, {}, b"Not Found"
+        if not cookie.startswith("session="):
+            return (
+                400,
+                {},
+                b"Puzzle inputs differ by user.  Please log in to get your puzzle input.",
+            )
+        try:
+            year, day = int(parts[0]), int(parts[2])
+        except ValueError:
+            return 404, {}, b"Not Found"
+        if (year, day) not in generators.GENERATORS:
+            return (
+                404,
+                {},
+                b"Please don't repeatedly request this endpoint before it unlocks!",
+            )
+        body = self.body(year, day, cookie[len("session=") :])
+        etag = f'"{contentDigest(body)}"'
+        info = {"ETag": etag, "Last-Modified": self.LAST_MODIFIED}
+        if headers.get("if-none-match") == etag:
+            return 304, info, b""
+        return 200, {**info, "Content-Type": "text/plain"}, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    break
+                _, path, *_ = requestLine.decode("latin-1").split(" ")
+                headers = await readHeaders(reader)
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                status, extra, body = self.respond(path, headers)
+                lines = [f"HTTP/1.1 {status} {'OK' if status == 200 else 'Stub'}"]
+                lines += [f"{name}: {value}" for name, value in extra.items()]
+                lines.append(f"Content-Length: {len(body)}")
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Starts listening; returns the base URL."""
+        self.server = await asyncio.start_server(self.handle, host, port)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+
+async def serve(stub: StubServer, port: int):
+    print(f"Stub inputs on {await stub.start(port=port)}; Ctrl-C stops", flush=True)
+    await asyncio.Event().wait()
+
+
+async def fetchFromStub(
+    targets: t.Sequence[Target], stub: StubServer, **options
+) -> FetchReport:
+    baseUrl = await stub.start()
+    try:
+        return await fetchAll(
+            targets, baseUrl, store=Store(STUB_DIRECTORY / "store"), **options
+        )
+    finally:
+        await stub.stop()
@@ -0,0 +1,284 @@
+import typing as t
+
+import numpy as np
+
+# Generators produce valid puzzle inputs of any size from a seed. Each one
+# yields the input line by line so that huge inputs never have to be held in
+# memory; like the real inputs, the result has no trailing newline.
+
+Lines = t.Iterator[str]
+Generator = t.Callable[..., Lines]
+
+GENERATORS: t.Dict[t.Tuple[int, int], Generator] = dict()
+
+
+def generator(year: int, day: int):
+    def register(func: Generator) -> Generator:
+        GENERATORS[year, day] = func
+        return func
+
+    return register
+
+
+def gridLines(grid: np.ndarray) -> Lines:
+    for row in grid:
+        yield row.tobytes().decode("ascii")
+
+
+def chooseChars(rng: np.random.Generator, chars: str, shape, p=None) -> np.ndarray:
+    return rng.choice(np.frombuffer(chars.encode(), dtype=np.uint8), size=shape, p=p)
+
+
+# === 2024 ==================================================================
+
+
+@generator(2024, 1)
+def locationLists(size: int, rng: np.random.Generator) -> Lines:
+    """``size`` pairs of 5-digit location ids; ids repeat like the real lists."""
+    pool = rng.integers(10000, 100000, size=max(1, size // 2))
+    for left, right in rng.choice(pool, size=(size, 2)):
+        yield f"{left}   {right}"
+
+
+@generator(2024, 2)
+def reports(size: int, rng: np.random.Generator) -> Lines:
+    """``size`` reports of 5-8 levels, most of them nearly safe."""
+    for _ in range(size):
+        length = int(rng.integers(5, 9))
+        steps = rng.integers(1, 4, size=length - 1) * rng.choice([-1, 1])
+        # Break a few of the reports with a bad step somewhere
+        if rng.random() < 0.5:
+            steps[rng.integers(0, length - 1)] = rng.integers(-5, 6)
+        levels = int(rng.integers(20, 80)) + np.concatenate([[0], np.cumsum(steps)])
+        yield " ".join(map(str, levels))
+
+
+@generator(2024, 3)
+def corruptedMemory(
+    size: int, rng: np.random.Generator, lineLength: int = 3000
+) -> Lines:
+    """Roughly ``size`` instructions hidden in garbage, split into long lines."""
+    noise = "abcdefghijklmnopqrstuvwxyz!@#$%^&*()[]{}<>,;:'+-_ 0123456789"
+    line: t.List[str] = list()
+    lineSize = 0
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.75:
+            a, b = rng.integers(0, 1000, size=2)
+            token = f"mul({a},{b})"
+        elif kind < 0.85:
+            token = "do()"
+        elif kind < 0.95:
+            token = "don't()"
+        else:
+            # Almost-instructions that must not match
+            token = f"mul[{rng.integers(0, 1000)},{rng.integers(0, 1000)}]"
+        garbage = "".join(rng.choice(list(noise), size=int(rng.integers(0, 12))))
+        line += [garbage, token]
+        lineSize += len(garbage) + len(token)
+        if lineSize >= lineLength:
+            yield "".join(line)
+            line, lineSize = list(), 0
+    if line:
+        yield "".join(line)
+
+
+@generator(2024, 4)
+def wordSearch(size: int, rng: np.random.Generator) -> Lines:
+    """A ``size`` x ``size`` grid of X, M, A and S."""
+    yield from gridLines(chooseChars(rng, "XMAS", (size, size)))
+
+
+@generator(2024, 5)
+def printQueue(size: int, rng: np.random.Generator, pages: int = 49) -> Lines:
+    """Ordering rules for ``pages`` pages and ``size`` updates, about half in order."""
+    # Updates list an odd number of at least 5 distinct pages
+    if pages < 5:
+        raise ValueError(f"printQueue needs at least 5 pages, got {pages}")
+    order = rng.permutation(np.arange(10, 10 + max(pages, 90)))[:pages]
+    # Like the real input, every pair of pages has a rule
+    rules = [
+        (order[first], order[second])
+        for first in range(pages)
+        for second in range(first + 1, pages)
+    ]
+    for idx in rng.permutation(len(rules)):
+        yield f"{rules[idx][0]}|{rules[idx][1]}"
+    yield ""
+    for _ in range(size):
+        length = int(rng.integers(2, (min(pages, 23) - 1) // 2 + 1)) * 2 + 1
+        positions = rng.choice(pages, size=length, replace=False)
+        if rng.random() < 0.5:
+            positions = np.sort(positions)
+        yield ",".join(str(order[position]) for position in positions)
+
+
+def loopingObstacle(
+    obstacles: np.ndarray, start: t.Tuple[int, int]
+) -> t.Optional[t.Tuple[int, int]]:
+    """Walk the guard; returns the obstacle that closes a loop, None if it escapes."""
+    height, width = obstacles.shape
+    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    seen: t.Set[t.Tuple[int, int, int]] = set()
+    (row, col), directionIdx = start, 0
+    while True:
+        dRow, dCol = directions[directionIdx]
+        nextRow, nextCol = row + dRow, col + dCol
+        if not (0 <= nextRow < height and 0 <= nextCol < width):
+            return None
+        if obstacles[nextRow, nextCol]:
+            if (row, col, directionIdx) in seen:
+                return nextRow, nextCol
+            seen.add((row, col, directionIdx))
+            directionIdx = (directionIdx + 1) % 4
+            continue
+        row, col = nextRow, nextCol
+
+
+@generator(2024, 6)
+def guardMap(size: int, rng: np.random.Generator, density: float = 0.02) -> Lines:
+    """A ``size`` x ``size`` lab the guard eventually walks out of."""
+    obstacles = rng.random((size, size)) < density
+    start = tuple(int(v) for v in rng.integers(0, size, size=2))
+    obstacles[start] = False
+    # Remove obstacles that trap the guard until part 1 terminates
+    while (blocker := loopingObstacle(obstacles, start)) is not None:
+        obstacles[blocker] = False
+
+    grid = np.where(obstacles, ord("#"), ord(".")).astype(np.uint8)
+    grid[start] = ord("^")
+    yield from gridLines(grid)
+
+
+@generator(2024, 7)
+def equations(
+    size: int, rng: np.random.Generator, minOperands: int = 2, maxOperands: int = 12
+) -> Lines:
+    """``size`` equations; about half of them can be made true."""
+    for _ in range(size):
+        count = int(rng.integers(minOperands, maxOperands + 1))
+        operands = [int(v) for v in rng.integers(1, 1000, size=count)]
+        total = operands[0]
+        for operand in operands[1:]:
+            op = rng.integers(0, 3)
+            if op == 0:
+                total += operand
+            elif op == 1:
+                total *= operand
+            else:
+                total = int(f"{total}{operand}")
+        if rng.random() < 0.5:
+            total += int(rng.integers(1, 100))
+        yield f"{total}: {' '.join(map(str, operands))}"
+
+
+@generator(2024, 8)
+def antennaMap(size: int, rng: np.random.Generator, density: float = 0.005) -> Lines:
+    """A ``size`` x ``size`` map with antennas on about ``density`` of the cells."""
+    signs = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    grid = np.full((size, size), ord("."), dtype=np.uint8)
+    mask = rng.random((size, size)) < density
+    grid[mask] = chooseChars(rng, signs, int(mask.sum()))
+    yield from gridLines(grid)
+
+
+@generator(2024, 9)
+def diskMap(size: int, rng: np.random.Generator) -> Lines:
+    """A disk map of ``size`` digits (rounded up to odd; it ends with a file)."""
+    digits = rng.integers(0, 10, size=size + (size + 1) % 2)
+    # Files are never empty
+    digits[::2] = rng.integers(1, 10, size=len(digits[::2]))
+    yield (digits + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+
+
+@generator(2024, 10)
+def topographicMap(size: int, rng: np.random.Generator, noise: float = 0.2) -> Lines:
+    """A ``size`` x ``size`` height map of diagonal slopes with random bumps."""
+    rows, cols = np.indices((size, size))
+    heights = (rows + cols) % 10
+    mask = rng.random((size, size)) < noise
+    heights[mask] = rng.integers(0, 10, size=int(mask.sum()))
+    yield from gridLines((heights + ord("0")).astype(np.uint8))
+
+
+@generator(2024, 11)
+def stones(size: int, rng: np.random.Generator) -> Lines:
+    """``size`` stones engraved with numbers below one million."""
+    yield " ".join(map(str, rng.integers(0, 1000000, size=size)))
+
+
+@generator(2024, 12)
+def garden(size: int, rng: np.random.Generator, blockSize: int = 8) -> Lines:
+    """A ``size`` x ``size`` garden of blocky regions with ragged edges."""
+    blocks = size // blockSize + 1
+    letters = chooseChars(rng, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", (blocks, blocks))
+    grid = np.repeat(np.repeat(letters, blockSize, axis=0), blockSize, axis=1)
+    grid = grid[:size, :size]
+    mask = rng.random((size, size)) < 0.1
+    grid[mask] = np.roll(grid, 1, axis=1)[mask]
+    yield from gridLines(grid)
+
+
+@generator(2024, 13)
+def clawMachines(size: int, rng: np.random.Generator) -> Lines:
+    """``size`` claw machines, about half of them winnable."""
+    for idx in range(size):
+        while True:
+            a = rng.integers(10, 100, size=2)
+            b = rng.integers(10, 100, size=2)
+            if a[0] * b[1] != a[1] * b[0]:
+                break
+        presses = rng.integers(0, 101, size=2)
+        prize = presses[0] * a + presses[1] * b
+        if rng.random() < 0.5:
+            prize += rng.integers(1, 50, size=2)
+        if idx:
+            yield ""
+        yield f"Button A: X+{a[0]}, Y+{a[1]}"
+        yield f"Button B: X+{b[0]}, Y+{b[1]}"
+        yield f"Prize: X={prize[0]}, Y={prize[1]}"
+
+
+@generator(2024, 14)
+def robots(
+    size: int, rng: np.random.Generator, width: int = 101, height: int = 103
+) -> Lines:
+    """``size`` robots in a ``width`` x ``height`` room."""
+    # The day parses inputs that are not test files as 101x103; other rooms
+    # need the size passed to parse.
+    positions = rng.integers(0, [width, height], size=(size, 2))
+    velocities = rng.integers(-99, 100, size=(size, 2))
+    for (x, y), (dx, dy) in zip(positions, velocities):
+        yield f"p={x},{y} v={dx},{dy}"
+
+
+@generator(2024, 15)
+def warehouse(
+    size: int, rng: np.random.Generator, side: int = 50, lineLength: int = 1000
+) -> Lines:
+    """A ``side`` x ``side`` warehouse and ``size`` robot moves."""
+    grid = chooseChars(rng, ".O#", (side, side), p=[0.7, 0.25, 0.05])
+    grid[[0, -1], :] = ord("#")
+    grid[:, [0, -1]] = ord("#")
+    grid[rng.integers(1, side - 1), rng.integers(1, side - 1)] = ord("@")
+    yield from gridLines(grid)
+    yield ""
+    moves = chooseChars(rng, "<>^v", size)
+    for start in range(0, size, lineLength):
+        yield moves[start : start + lineLength].tobytes().decode("ascii")
+
+
+# === Writing ===============================================================
+
+
+def generate(year: int, day: int, size: int, seed: int = 0, **params) -> Lines:
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No input generator for {year}/{day:02d}")
+    return GENERATORS[year, day](size, np.random.default_rng(seed), **params)
+
+
+def writeInput(lines: Lines, file: t.TextIO):
+    for idx, line in enumerate(lines):
+        if idx:
+            file.write("\n")
+        file.write(line)
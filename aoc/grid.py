@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import typing as t
+
+from aoc.lazy import lazyImport
+from aoc.render import Indices, gridCanvas, interior, paint, text
+
+np = lazyImport("numpy")
+
+# A character grid stored row by row in one flat bytearray. Cells are plain
+# integer indices, a step is adding an offset from ``directions`` and the map
+# is surrounded by ``pad`` cells of OUTSIDE, so walking off the map is noticed
+# by looking at the cell instead of checking bounds:
+#
+#     grid = Grid.fromString(inputString)
+#     pos = grid.find("^")
+#     while grid[pos] != OUTSIDE:
+#         pos += grid.directions[UP]
+#
+# Offsets wrap from the end of one row to the start of the next, so a walk
+# may only take steps up to ``pad`` cells long before it checks for OUTSIDE.
+#
+# Maps are loaded with numpy in one pass (``loadArray``) and special cells are
+# pulled out with masks (``locate``) rather than by looping over characters.
+
+OUTSIDE = 0
+
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTION_NAMES = ["Up", "Right", "Down", "Left"]
+
+
+def loadArray(text: t.Union[str, bytes]) -> np.ndarray:
+    """The map as a (height, width) uint8 array, without looking at each cell."""
+    data = (text.encode() if isinstance(text, str) else text).strip(b"\n")
+    width = data.find(b"\n")
+    if width < 0:
+        width = len(data)
+    if (len(data) + 1) % (width + 1):
+        raise ValueError("map rows differ in length")
+    # Keep the newline column while reshaping, then slice it off
+    array = np.frombuffer(data + b"\n", dtype=np.uint8).reshape(-1, width + 1)
+    # A fitting total length can still hide ragged rows ("ab\n\nabcd")
+    if not (array[:, width] == ord("\n")).all():
+        raise ValueError("map rows differ in length")
+    return array[:, :width]
+
+
+class Grid:
+    __slots__ = ("cells", "height", "width", "pad", "stride", "directions")
+
+    def __init__(self, cells: bytearray, height: int, width: int, pad: int = 1):
+        self.cells = cells
+        self.height = height
+        self.width = width
+        self.pad = pad
+        self.stride = width + 2 * pad
+        # Clockwise, starting up; indexed by UP, RIGHT, DOWN and LEFT
+        self.directions = (-self.stride, 1, self.stride, -1)
+
+    @classmethod
+    def fromString(cls, text: t.Union[str, bytes], pad: int = 1) -> "Grid":
+        return cls.fromArray(loadArray(text), pad)
+
+    @classmethod
+    def fromArray(cls, array: np.ndarray, pad: int = 1) -> "Grid":
+        height, width = array.shape
+        padded = np.pad(array.astype(np.uint8), pad, constant_values=OUTSIDE)
+        return cls(bytearray(padded.tobytes()), height, width, pad)
+
+    @classmethod
+    def filled(cls, height: int, width: int, char: str = ".", pad: int = 1) -> "Grid":
+        return cls.fromArray(np.full((height, width), ord(char), np.uint8), pad)
+
+    def copy(self) -> "Grid":
+        return Grid(bytearray(self.cells), self.height, self.width, self.pad)
+
+    # === Indices and positions ===
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.pad) * self.stride + col + self.pad
+
+    def position(self, index: int) -> t.Tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - self.pad, col - self.pad
+
+    def contains(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def indices(self) -> t.Iterator[int]:
+        """All cells inside the map, row by row."""
+        for row in range(self.pad, self.pad + self.height):
+            start = row * self.stride + self.pad
+            yield from range(start, start + self.width)
+
+    def neighbours(self, index: int) -> t.List[int]:
+        return [index + offset for offset in self.directions]
+
+    # === Cells ===
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        self.cells[index] = value
+
+    def char(self, index: int) -> str:
+        return chr(self.cells[index])
+
+    def find(self, char: str) -> int:
+        return self.cells.index(ord(char))
+
+    def findAll(self, char: str) -> t.List[int]:
+        return np.flatnonzero(self.array() == ord(char)).tolist()
+
+    def locate(
+        self, chars: t.Optional[str] = None, background: str = "."
+    ) -> t.Dict[str, np.ndarray]:
+        """Indices of the cells holding each of ``chars``, in one masked pass.
+
+        Without ``chars`` every cell that is neither background nor padding is
+        located, e.g. all antenna letters.
+        """
+        cells = np.frombuffer(self.cells, dtype=np.uint8)
+        if chars is None:
+            mask = (cells != ord(background)) & (cells != OUTSIDE)
+        else:
+            mask = np.isin(cells, np.frombuffer(chars.encode(), dtype=np.uint8))
+        indices = np.flatnonzero(mask)
+        values = cells[indices]
+        return {chr(value): indices[values == value] for value in np.unique(values)}
+
+    def array(self) -> np.ndarray:
+        """The padded cells as a (rows, stride) uint8 view; edits show in the grid."""
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(-1, self.stride)
+
+    def interior(self) -> np.ndarray:
+        """Like ``array`` without the padding: a (height, width) view."""
+        pad = self.pad
+        return self.array()[pad : pad + self.height, pad : pad + self.width]
+
+    # === Rendering ===
+
+    def draw(self, *layers: t.Tuple[Indices, str]) -> np.ndarray:
+        """The map with each ``(indices, char)`` layer painted over a copy."""
+        canvas = gridCanvas(self)
+        for indices, char in layers:
+            paint(canvas, indices, char)
+        return interior(self, canvas)
+
+    def asString(self, overlay: t.Optional[t.Mapping[int, str]] = None) -> str:
+        if not overlay:
+            return text(interior(self, self.array()))
+        canvas = gridCanvas(self)
+        indices = np.fromiter(overlay.keys(), dtype=np.intp, count=len(overlay))
+        chars = "".join(overlay.values()).encode("latin-1")
+        paint(canvas, indices, np.frombuffer(chars, dtype=np.uint8))
+        return text(interior(self, canvas))
+
+    def __str__(self) -> str:
+        return self.asString()
+
+    def __repr__(self) -> str:
+        return f"Grid(height={self.height}, width={self.width}, pad={self.pad})"
@@ -0,0 +1,83 @@
+import mmap
+import typing as t
+from pathlib import Path
+
+# Puzzle inputs without the read_text() copies. A file is memory-mapped, so
+# ``view`` hands out its bytes without copying and the page cache is the only
+# copy in memory; ``lines`` and ``chunks`` walk it lazily. Days that set
+# ``STREAMING = True`` get an Input in ``parse`` instead of a str:
+#
+#     def parse(source: Input) -> ...:
+#         return extractRows(source.view())
+#
+# Strings (generated or scaled inputs) are wrapped with ``Input.fromString``.
+# An Input is a context manager that unmaps the file on exit; models must not
+# keep views of it past that (copy what they keep, as np.frombuffer does not).
+
+Buffer = t.Union[bytes, bytearray, mmap.mmap]
+
+
+class Input:
+    def __init__(self, buffer: Buffer, path: t.Optional[Path] = None):
+        self.buffer = buffer
+        self.path = path
+
+    @classmethod
+    def open(cls, path: Path) -> "Input":
+        with open(path, "rb") as file:
+            if file.seek(0, 2) == 0:
+                # Empty files cannot be mapped
+                return cls(b"", path)
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+    @classmethod
+    def fromString(cls, text: str) -> "Input":
+        return cls(text.encode())
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def view(self) -> memoryview:
+        """All bytes, without copying."""
+        return memoryview(self.buffer)
+
+    def text(self) -> str:
+        return str(self.view(), "utf-8")
+
+    def lines(self) -> t.Iterator[bytes]:
+        """Lines without their newline; a trailing newline adds no empty line."""
+        buffer, start, end = self.buffer, 0, len(self.buffer)
+        while start < end:
+            stop = buffer.find(b"\n", start)
+            if stop < 0:
+                stop = end
+            yield bytes(buffer[start:stop])
+            start = stop + 1
+
+    def chunks(self, size: int = 1 << 20) -> t.Iterator[memoryview]:
+        """Views of about ``size`` bytes, each ending after a newline if possible."""
+        view, start, end = self.view(), 0, len(self.buffer)
+        while start < end:
+            stop = min(start + size, end)
+            if stop < end:
+                newline = self.buffer.rfind(b"\n", start, stop)
+                stop = newline + 1 if newline >= 0 else stop
+            yield view[start:stop]
+            start = stop
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.close()
+            except BufferError:
+                # A view is still alive; the map goes when that does
+                pass
+
+    def __enter__(self) -> "Input":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Input({self.path or 'string'}, {len(self)} bytes)"
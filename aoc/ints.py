@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import typing as t
+
+from aoc.lazy import lazyImport
+
+np = lazyImport("numpy")
+
+# Integer extraction for the numeric days. Every run of digits in the input
+# becomes one int64, with a directly preceding "-" making it negative, so
+# "p=0,4 v=3,-3", "75|13" and "Button A: X+94" need no per-format parsing:
+#
+#     rows = extractRows(inputString)
+#     rows.matrix(4)          # one robot per row
+#     rows.rows()             # ragged lines as lists of ints
+#
+# Digits are found with masks over the raw bytes and summed per run with
+# ``np.add.reduceat``, so no Python object is made per number until asked for.
+# Large buffers are scanned in line-aligned chunks to keep the temporaries
+# small next to the result. A chunk holding an integer of more than MAX_DIGITS
+# digits gives an object array of Python ints instead, so day 07's long totals
+# still parse, just without the speed.
+
+Text = t.Union[str, bytes, memoryview]
+
+MAX_DIGITS = 18
+CHUNK_SIZE = 1 << 18  # bytes scanned at once; bounds the temporaries
+
+POWERS = tuple(10**exponent for exponent in range(MAX_DIGITS))
+NEWLINE = ord("\n")
+MINUS = ord("-")
+
+
+def asBuffer(text: Text) -> np.ndarray:
+    # Byte buffers (including memory-mapped inputs) are used without copying
+    data = text.encode() if isinstance(text, str) else text
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def lineChunks(buffer: np.ndarray, size: int) -> t.Iterator[np.ndarray]:
+    """Views of about ``size`` bytes, each ending after a newline if there is one.
+
+    Numbers never span lines, so every chunk can be scanned on its own.
+    """
+    start = 0
+    while start < len(buffer):
+        stop = min(start + size, len(buffer))
+        if stop < len(buffer):
+            newlines = np.flatnonzero(buffer[start:stop] == NEWLINE)
+            if len(newlines):
+                stop = start + newlines[-1] + 1
+            else:
+                # One long line; take all of it
+                rest = np.flatnonzero(buffer[stop:] == NEWLINE)
+                stop = stop + rest[0] + 1 if len(rest) else len(buffer)
+        yield buffer[start:stop]
+        start = stop
+
+
+def findIntegers(
+    buffer: np.ndarray, signed: bool = True
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Values of all integers in ``buffer`` and the offset each one starts at."""
+    isDigit = (buffer >= ord("0")) & (buffer <= ord("9"))
+    if not isDigit.any():
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.intp)
+
+    # Runs of digits start and end where the mask flips
+    padded = np.concatenate(([False], isDigit, [False]))
+    flips = np.flatnonzero(padded[1:] != padded[:-1])
+    starts, ends = flips[::2], flips[1::2]
+    lengths = ends - starts
+    if lengths.max() > MAX_DIGITS:
+        # Too long for int64: one Python int per run
+        data = buffer.tobytes()
+        values = np.empty(len(starts), dtype=object)
+        values[:] = [int(data[start:end]) for start, end in zip(starts, ends)]
+    else:
+        values = digitValues(buffer, isDigit, lengths)
+
+    if signed:
+        before = starts - 1
+        negative = (before >= 0) & (buffer[np.maximum(before, 0)] == MINUS)
+        values[negative] *= -1
+    return values, starts
+
+
+def digitValues(
+    buffer: np.ndarray, isDigit: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    # Each digit times 10 to the number of digits after it in its run
+    digits = (buffer[isDigit] - ord("0")).astype(np.int64)
+    runStarts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    runEnds = np.repeat(runStarts + lengths, lengths)
+    exponents = runEnds - np.arange(len(digits)) - 1
+    powers = np.array(POWERS, dtype=np.int64)
+    return np.add.reduceat(digits * powers[exponents], runStarts)
+
+
+def extractIntegers(text: Text, signed: bool = True) -> np.ndarray:
+    """All integers in ``text`` as one flat int64 (or object) array."""
+    chunks = lineChunks(asBuffer(text), CHUNK_SIZE)
+    values = [findIntegers(chunk, signed)[0] for chunk in chunks]
+    return np.concatenate(values) if values else np.zeros(0, dtype=np.int64)
+
+
+class IntRows(t.NamedTuple):
+    """Integers per line: line ``i`` is ``values[offsets[i]:offsets[i + 1]]``."""
+
+    values: np.ndarray
+    offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, index: int) -> np.ndarray:
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def rows(self) -> t.List[t.List[int]]:
+        """Lines as lists of Python ints, for the solvers that walk them."""
+        values, offsets = self.values.tolist(), self.offsets.tolist()
+        return [values[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    def matrix(self, width: int) -> np.ndarray:
+        """A (lines, width) view; every line has to hold ``width`` integers."""
+        if len(self) and (self.lengths() != width).any():
+            raise ValueError(f"not every line has {width} integers")
+        return self.values.reshape(-1, width)
+
+
+def extractRows(text: Text, signed: bool = True) -> IntRows:
+    """The integers of each line; a trailing newline does not add a line."""
+    values, counts = list(), list()
+    for chunk in lineChunks(asBuffer(text), CHUNK_SIZE):
+        chunkValues, starts = findIntegers(chunk, signed)
+        newlines = np.flatnonzero(chunk == NEWLINE)
+        lines = len(newlines) + (chunk[-1] != NEWLINE)
+        # Line of each integer within the chunk, then integers per line
+        lineOf = np.searchsorted(newlines, starts)
+        values.append(chunkValues)
+        counts.append(np.bincount(lineOf, minlength=lines))
+    if not values:
+        return IntRows(np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.intp))
+    offsets = np.concatenate(([0], np.cumsum(np.concatenate(counts))))
+    return IntRows(np.concatenate(values), offsets)
@@ -0,0 +1,37 @@
+import importlib.util
+import sys
+import types
+
+# Deferred imports for the harness. ``python -m aoc`` used to import every
+# command's module (and numpy, multiprocessing, tracemalloc with them) before
+# parsing its arguments; a module from ``lazyImport`` only executes when one of
+# its attributes is first used:
+#
+#     bench = lazyImport("aoc.bench")
+#     ...
+#     bench.benchmarkSolution(...)  # aoc.bench is imported here
+#
+# ``from x import y`` defeats this, so callers keep the module and use dotted
+# names. The grid, ints, render and search helpers and the days using numpy
+# take it as ``np = lazyImport("numpy")``, with ``from __future__ import
+# annotations`` so that ``np.ndarray`` annotations do not load it either;
+# numpy then costs nothing until a day first solves something (hashing or
+# listing days does not). `python -m aoc startup` shows where the time goes.
+
+
+def lazyImport(name: str) -> types.ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent in sys.modules:
+        setattr(sys.modules[parent], child, module)
+    return module
@@ -0,0 +1,298 @@
+import atexit
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import typing as t
+from collections import OrderedDict
+from pathlib import Path
+
+from aoc.runner import formatTable
+from aoc.solutions import ROOT
+
+# Memoization shared by the solvers. A memoized function gets a named, bounded
+# cache with counters the runner prints after its report:
+#
+#     @memoize("2024/11 stones", maxSize=1 << 20)
+#     def stonesAfterBlinks(value: int, blinks: int) -> int:
+#         ...
+#
+# Full caches evict the least recently used entry. Arguments are positional
+# and hashable; ``key`` picks the part of them that identifies a result (for
+# instance leaving out a model that stays the same during a solve, in which
+# case the solve clears the memo first).
+#
+# Recursion can be written as a generator that yields the arguments of each
+# sub-call and receives its result, so deep recursions run on an explicit
+# stack instead of Python's:
+#
+#     @memoize("2024/11 stones")
+#     def stonesAfterBlinks(value, blinks):
+#         if blinks == 0:
+#             return 1
+#         return (yield value * 2024, blinks - 1)
+#
+# With ``persist=True`` a memo is also kept in .aoc/memo/ between runs while
+# persistence is enabled (--persist-memo or AOC_PERSIST_MEMO); the file name
+# includes a hash of the function's source, so an edit starts it afresh.
+
+MEMO_DIRECTORY = ROOT / ".aoc" / "memo"
+
+persistent = bool(os.environ.get("AOC_PERSIST_MEMO"))
+
+
+def configure(persist: bool = True):
+    global persistent
+    persistent = persist
+
+
+MISSING = object()
+
+
+class Memo:
+    def __init__(
+        self,
+        name: str,
+        maxSize: t.Optional[int] = None,
+        path: t.Optional[Path] = None,
+    ):
+        self.name = name
+        self.maxSize = maxSize
+        self.path = path
+        self.entries: "OrderedDict[t.Hashable, t.Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(self, key: t.Hashable) -> t.Any:
+        """The stored value (now the most recent) or MISSING."""
+        if not self.loaded:
+            self.load()
+        value = self.entries.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if self.maxSize is not None:
+                self.entries.move_to_end(key)
+        return value
+
+    def store(self, key: t.Hashable, value: t.Any):
+        self.entries[key] = value
+        if self.maxSize is not None and len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    @property
+    def hitRate(self) -> t.Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    # === Persistence =======================================================
+
+    def load(self):
+        self.loaded = True
+        if self.path is None or not persistent or not self.path.exists():
+            return
+        try:
+            stored = pickle.loads(self.path.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return
+        # In place, as memoized functions hold on to ``entries``
+        stored.update(self.entries)
+        self.entries.clear()
+        self.entries.update(stored)
+
+    def save(self):
+        if self.path is None or not persistent or not self.entries:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_suffix(".partial")
+        partial.write_bytes(pickle.dumps(self.entries))
+        partial.replace(self.path)
+
+
+registry: t.Dict[str, Memo] = dict()
+
+
+def clearAll():
+    """Empty the memos before a timed call, so it does not reuse earlier work.
+
+    Memos kept in .aoc/memo/ stay filled while persistence is enabled; those
+    calls are meant to be warm.
+    """
+    for memo in registry.values():
+        if memo.path is None or not persistent:
+            memo.clear()
+
+
+@atexit.register
+def saveAll():
+    for memo in registry.values():
+        memo.save()
+
+
+def sourcePath(name: str, func: t.Callable[..., t.Any]) -> Path:
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__qualname__
+    digest = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+    fileName = "".join(c if c.isalnum() else "-" for c in name)
+    return MEMO_DIRECTORY / f"{fileName}-{digest}.pickle"
+
+
+# === Memoized functions ====================================================
+
+
+def evaluate(
+    memo: Memo,
+    func: t.Callable[..., t.Generator[t.Any, t.Any, t.Any]],
+    key: t.Optional[t.Callable[..., t.Hashable]],
+    args: t.Tuple[t.Any, ...],
+) -> t.Any:
+    """Run a generator-style recursion on an explicit stack.
+
+    The loop runs once per sub-call, so Memo.lookup and Memo.store are inlined
+    and the counters are added up at the end.
+    """
+    entries, maxSize = memo.entries, memo.maxSize
+    hits = misses = evictions = 0
+    stack = [(args if key is None else key(*args), func(*args))]
+    push, pop = stack.append, stack.pop
+    sent = None
+    try:
+        while stack:
+            callKey, generator = stack[-1]
+            try:
+                subArgs = generator.send(sent)
+            except StopIteration as stop:
+                pop()
+                sent = entries[callKey] = stop.value
+                if maxSize is not None and len(entries) > maxSize:
+                    entries.popitem(last=False)
+                    evictions += 1
+                continue
+            if type(subArgs) is not tuple:
+                subArgs = (subArgs,)
+            subKey = subArgs if key is None else key(*subArgs)
+            sent = entries.get(subKey, MISSING)
+            if sent is MISSING:
+                misses += 1
+                push((subKey, func(*subArgs)))
+                sent = None
+            else:
+                hits += 1
+                if maxSize is not None:
+                    entries.move_to_end(subKey)
+    finally:
+        memo.hits += hits
+        memo.misses += misses
+        memo.evictions += evictions
+    return sent
+
+
+def memoize(
+    name: str,
+    maxSize: t.Optional[int] = None,
+    key: t.Optional[t.Callable[..., t.Hashable]] = None,
+    persist: bool = False,
+):
+    def decorate(func: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        memo = Memo(name, maxSize, sourcePath(name, func) if persist else None)
+        registry[name] = memo
+        recursive = inspect.isgeneratorfunction(func)
+        entries, get = memo.entries, memo.entries.get
+
+        def memoized(*args):
+            # Memo.lookup and Memo.store inlined: this runs on every call
+            if not memo.loaded:
+                memo.load()
+            callKey = args if key is None else key(*args)
+            value = get(callKey, MISSING)
+            if value is not MISSING:
+                memo.hits += 1
+                if maxSize is not None:
+                    entries.move_to_end(callKey)
+                return value
+            memo.misses += 1
+            if recursive:
+                return evaluate(memo, func, key, args)
+            value = entries[callKey] = func(*args)
+            if maxSize is not None and len(entries) > maxSize:
+                entries.popitem(last=False)
+                memo.evictions += 1
+            return value
+
+        functools.update_wrapper(memoized, func)
+        memoized.memo = memo
+        return memoized
+
+    return decorate
+
+
+# === Reporting =============================================================
+
+
+class MemoStats(t.NamedTuple):
+    name: str
+    entries: int
+    maxSize: t.Optional[int]
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hitRate(self) -> t.Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+def usedMemos() -> t.List[Memo]:
+    return [memo for memo in registry.values() if memo.hits or memo.misses]
+
+
+def snapshot() -> t.List[MemoStats]:
+    """Counts of the memos used since the last snapshot, which start again at 0.
+
+    Taken after each day of a run, before the next day's timed calls clear
+    the memos.
+    """
+    stats = [
+        MemoStats(
+            memo.name, len(memo), memo.maxSize, memo.hits, memo.misses, memo.evictions
+        )
+        for memo in usedMemos()
+    ]
+    for memo in registry.values():
+        memo.hits = memo.misses = memo.evictions = 0
+    return stats
+
+
+MEMO_COLUMNS = ["memo", "entries", "max", "hits", "misses", "evictions", "hit rate"]
+
+
+def formatMemos(memos: t.Sequence[MemoStats]) -> str:
+    rows = list()
+    for memo in memos:
+        hitRate = memo.hitRate
+        rows.append(
+            [
+                memo.name,
+                str(memo.entries),
+                "-" if memo.maxSize is None else str(memo.maxSize),
+                str(memo.hits),
+                str(memo.misses),
+                str(memo.evictions),
+                "-" if hitRate is None else f"{hitRate:.1%}",
+            ]
+        )
+    return formatTable(MEMO_COLUMNS, rows)
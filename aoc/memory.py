@@ -0,0 +1,254 @@
+import dataclasses
+import functools
+import gc
+import json
+import resource
+import sys
+import tracemalloc
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from aoc.inputs import Input
+from aoc.runner import formatTable, silenced
+from aoc.solutions import PARTS, Solution
+from aoc.sweep import STATE_DIRECTORY
+from aoc.timing import formatBytes
+
+FOOTPRINTS_PATH = STATE_DIRECTORY / "footprints.json"
+
+# === Resident set size =====================================================
+
+
+def resetPeakRss() -> bool:
+    """Reset the kernel's high-water mark (VmHWM); only possible on Linux."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def peakRss() -> int:
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+# === Traced allocations ====================================================
+
+
+class PeakSnapshots:
+    """Profile hook that snapshots the traced heap whenever it reaches a new high.
+
+    A snapshot is taken each time traced memory grows by ``growth`` over the
+    last one, so the final snapshot shows the allocation sites close to the
+    peak rather than whatever survived until the end of the phase.
+    """
+
+    def __init__(self, growth: float = 1.1, minimum: int = 64 * 1024):
+        self.growth = growth
+        self.threshold = minimum
+        self.snapshot: t.Optional[tracemalloc.Snapshot] = None
+
+    def __call__(self, frame, event, arg):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.threshold:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.threshold = current * self.growth
+
+
+IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryProfile:
+    solution: str
+    inputName: str
+    phase: str
+    peakTraced: int
+    peakRss: int
+    rssIsPhasePeak: bool
+    sites: t.List[AllocationSite] = field(default_factory=list)
+
+
+def topSites(snapshot: tracemalloc.Snapshot, limit: int) -> t.List[AllocationSite]:
+    sites = list()
+    for stat in snapshot.filter_traces(IGNORED).statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        location = f"{Path(frame.filename).name}:{frame.lineno}"
+        sites.append(AllocationSite(location, stat.size, stat.count))
+    return sites
+
+
+def profilePhase(
+    func: t.Callable[[t.Any], t.Any], arg: t.Any, limit: int
+) -> t.Tuple[t.Any, int, int, bool, t.List[AllocationSite]]:
+    # RSS comes from a plain run, as tracing adds its own memory on top
+    isPhasePeak = resetPeakRss()
+    result = func(arg)
+    rss = peakRss()
+
+    hook = PeakSnapshots()
+    tracemalloc.start()
+    sys.setprofile(hook)
+    try:
+        func(arg)
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = hook.snapshot or tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    return result, peak, rss, isPhasePeak, topSites(snapshot, limit)
+
+
+def memoryProfileSolution(
+    solution: Solution,
+    parts: t.Sequence[int] = PARTS,
+    inputNames: t.Optional[t.Sequence[str]] = None,
+    limit: int = 10,
+) -> t.List[MemoryProfile]:
+    profiles: t.List[MemoryProfile] = list()
+    for inputPath in solution.inputs():
+        if inputNames and inputPath.name not in inputNames:
+            continue
+        with silenced(), solution.opened(inputPath) as source:
+            model, *measurements = profilePhase(solution.parse, source, limit)
+            profiles.append(
+                MemoryProfile(solution.name, inputPath.name, "parse", *measurements)
+            )
+            for part in parts:
+                solve = functools.partial(solution.solve, part)
+                _, *measurements = profilePhase(solve, model, limit)
+                profiles.append(
+                    MemoryProfile(
+                        solution.name, inputPath.name, f"part {part}", *measurements
+                    )
+                )
+    return profiles
+
+
+def formatMemoryProfiles(profiles: t.Sequence[MemoryProfile]) -> str:
+    sections = list()
+    for profile in profiles:
+        rss = formatBytes(profile.peakRss)
+        if not profile.rssIsPhasePeak:
+            rss += " (process peak)"
+        header = (
+            f"=== {profile.solution} {profile.inputName} {profile.phase}: "
+            f"peak traced {formatBytes(profile.peakTraced)}, peak RSS {rss}"
+        )
+        rows = [
+            [site.location, formatBytes(site.size), str(site.count)]
+            for site in profile.sites
+        ]
+        sections.append(header + "\n" + formatTable(["site", "size", "blocks"], rows))
+    return "\n\n".join(sections)
+
+
+# === Model footprint =======================================================
+
+# Bytes the parsed model keeps alive per item, on the data input tiled
+# ``factor`` times (see aoc.scaling). Items are counted in the model's largest
+# collection (robots, blocks, machines, grid cells), so the figure shows
+# per-object overhead rather than input size.
+
+
+def itemCount(model: t.Any, depth: int = 3) -> int:
+    """Length of the largest list, array or buffer in the model."""
+    if depth == 0:
+        return 0
+    if isinstance(model, np.ndarray):
+        return len(model) if model.ndim else 0
+    counts = [0]
+    children: t.Iterable[t.Any] = ()
+    if isinstance(model, (list, set, dict, bytes, bytearray)):
+        counts.append(len(model))
+    elif isinstance(model, tuple):
+        counts.append(len(model))
+        children = model
+    if dataclasses.is_dataclass(model) and not isinstance(model, type):
+        children = [getattr(model, f.name) for f in dataclasses.fields(model)]
+    elif getattr(type(model), "__slots__", None) and not isinstance(model, tuple):
+        children = [getattr(model, name) for name in type(model).__slots__]
+    counts += [itemCount(child, depth - 1) for child in children]
+    return max(counts)
+
+
+@dataclass
+class Footprint:
+    solution: str
+    inputBytes: int
+    items: int
+    retained: int
+
+    @property
+    def bytesPerItem(self) -> float:
+        return self.retained / max(1, self.items)
+
+
+def measureFootprint(solution: Solution, factor: int = 20) -> Footprint:
+    from aoc.bench import isBenchmarkInput
+    from aoc.scaling import SCALERS
+
+    base = next(p for p in solution.inputs() if isBenchmarkInput(p.name))
+    text = SCALERS[solution.year, solution.day](base.read_text(), factor)
+    source = Input.fromString(text) if solution.streams else text
+    gc.collect()
+    with silenced():
+        tracemalloc.start()
+        try:
+            model = solution.parse(source)
+            retained, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return Footprint(solution.name, len(text), itemCount(model), retained)
+
+
+def loadFootprints(path: Path = FOOTPRINTS_PATH) -> t.Dict[str, float]:
+    return json.loads(path.read_text()) if path.exists() else dict()
+
+
+def saveFootprints(footprints: t.Sequence[Footprint], path: Path = FOOTPRINTS_PATH):
+    stored = loadFootprints(path)
+    stored.update({fp.solution: fp.bytesPerItem for fp in footprints})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+
+
+def formatFootprints(
+    footprints: t.Sequence[Footprint], baseline: t.Mapping[str, float]
+) -> str:
+    header = ["day", "input", "items", "retained", "bytes/item", "saved", "change"]
+    rows = list()
+    for fp in footprints:
+        before = baseline.get(fp.solution)
+        rows.append(
+            [
+                fp.solution,
+                formatBytes(fp.inputBytes),
+                str(fp.items),
+                formatBytes(fp.retained),
+                f"{fp.bytesPerItem:.1f}",
+                "" if before is None else f"{before:.1f}",
+                "" if not before else f"{fp.bytesPerItem / before - 1:+.0%}",
+            ]
+        )
+    return formatTable(header, rows)
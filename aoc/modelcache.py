@@ -0,0 +1,300 @@
+import dataclasses
+import hashlib
+import importlib
+import json
+import os
+import sys
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+from aoc.inputs import Input
+from aoc.solutions import Solution
+from aoc.sweep import STATE_DIRECTORY
+
+# Opt-in cache of parsed models, so repeated runs on a big input skip parse.
+# Entries live in .aoc/models/<year>-<day>/<key>.npz, where the key hashes the
+# input bytes and the day's source (Solution.sourceDigest), so editing the
+# parser or its aoc imports invalidates them.
+#
+# Models are stored column-wise rather than pickled: numbers, lists of int
+# lists, sets of ints and equal-shaped arrays become numpy arrays, and lists
+# of dataclasses or NamedTuples become one array per field. A small JSON tree
+# records how to put the model back together. Models holding anything else
+# (functions, open files) are not cached.
+
+MODEL_DIRECTORY = STATE_DIRECTORY / "models"
+
+enabled = bool(os.environ.get("AOC_PARSE_CACHE"))
+
+
+def configure(enable: bool = True):
+    global enabled
+    enabled = enable
+
+
+class Unsupported(TypeError):
+    pass
+
+
+# === Encoding ==============================================================
+
+INT64 = np.iinfo(np.int64)
+
+SEQUENCES: t.Dict[str, t.Callable[[t.Iterable[t.Any]], t.Any]] = {
+    "list": list,
+    "tuple": tuple,
+    "set": set,
+    "frozenset": frozenset,
+}
+
+
+def classPath(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def resolveClass(path: str) -> type:
+    moduleName, qualname = path.split(":")
+    module = sys.modules.get(moduleName) or importlib.import_module(moduleName)
+    value: t.Any = module
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def isRecord(value: t.Any) -> bool:
+    """Dataclass instances and NamedTuples, stored field by field."""
+    if isinstance(value, type):
+        return False
+    return dataclasses.is_dataclass(value) or hasattr(type(value), "_fields")
+
+
+def recordFields(cls: type) -> t.List[str]:
+    if hasattr(cls, "_fields"):
+        return list(cls._fields)
+    return [f.name for f in dataclasses.fields(cls)]
+
+
+def isInt(value: t.Any) -> bool:
+    return type(value) is int and INT64.min <= value <= INT64.max
+
+
+class Encoder:
+    def __init__(self):
+        self.arrays: t.Dict[str, np.ndarray] = dict()
+
+    def store(self, array: np.ndarray) -> str:
+        name = f"a{len(self.arrays)}"
+        self.arrays[name] = array
+        return name
+
+    def encode(self, value: t.Any) -> t.Any:
+        if value is None or type(value) in (bool, int, float, str):
+            return value
+        if isinstance(value, np.generic):
+            return {"scalar": self.store(np.asarray(value))}
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise Unsupported("object arrays")
+            return {"array": self.store(value)}
+        if isinstance(value, (bytes, bytearray)):
+            kind = type(value).__name__
+            return {kind: self.store(np.frombuffer(value, dtype=np.uint8))}
+        if isRecord(value):
+            cls = type(value)
+            fields = {
+                name: self.encode(getattr(value, name)) for name in recordFields(cls)
+            }
+            return {"record": classPath(cls), "fields": fields}
+        if type(value) in (list, tuple, set, frozenset):
+            return self.encodeSequence(list(value), type(value).__name__)
+        if isinstance(value, dict) and type(value) is dict:
+            return {
+                "dict": {
+                    "keys": self.encodeSequence(list(value.keys()), "list"),
+                    "values": self.encodeSequence(list(value.values()), "list"),
+                }
+            }
+        slots = getattr(type(value), "__slots__", None)
+        if slots and not hasattr(value, "__dict__"):
+            state = {name: self.encode(getattr(value, name)) for name in slots}
+            return {"object": classPath(type(value)), "state": state}
+        raise Unsupported(f"cannot cache {type(value).__name__}")
+
+    def encodeSequence(self, items: t.List[t.Any], kind: str) -> t.Any:
+        node: t.Dict[str, t.Any] = {"kind": kind}
+        if items and all(isInt(item) for item in items):
+            node["ints"] = self.store(np.array(items, dtype=np.int64))
+        elif items and all(type(item) is bool for item in items):
+            node["bools"] = self.store(np.array(items, dtype=bool))
+        elif (
+            items
+            and len({type(item) for item in items}) == 1
+            and type(items[0]) in (list, tuple)
+            and all(isInt(v) for item in items for v in item)
+        ):
+            # Ragged int lists: one flat array plus where each list starts
+            lengths = [len(item) for item in items]
+            values = [v for item in items for v in item]
+            node["ragged"] = self.store(np.array(values, dtype=np.int64))
+            node["offsets"] = self.store(np.cumsum([0] + lengths, dtype=np.int64))
+            node["inner"] = type(items[0]).__name__
+        elif items and isRecord(items[0]) and len({type(i) for i in items}) == 1:
+            cls = type(items[0])
+            node["records"] = classPath(cls)
+            node["columns"] = {
+                name: self.encodeSequence([getattr(i, name) for i in items], "list")
+                for name in recordFields(cls)
+            }
+        elif (
+            items
+            and all(type(item) is np.ndarray for item in items)
+            and len({(item.shape, item.dtype) for item in items}) == 1
+            and not items[0].dtype.hasobject
+        ):
+            node["stacked"] = self.store(np.stack(items))
+        elif (
+            items
+            and all(type(item) is tuple for item in items)
+            and len({len(item) for item in items}) == 1
+        ):
+            # Plain tuples of one length are stored as columns too
+            node["tuples"] = [
+                self.encodeSequence(list(column), "list") for column in zip(*items)
+            ]
+        else:
+            node["items"] = [self.encode(item) for item in items]
+        return node
+
+
+# === Decoding ==============================================================
+
+
+def newRecords(
+    cls: type, names: t.List[str], rows: t.Iterable[t.Sequence[t.Any]]
+) -> t.List[t.Any]:
+    if hasattr(cls, "_fields"):
+        return [cls._make(row) for row in rows]
+    if all(f.init for f in dataclasses.fields(cls)):
+        # The generated __init__ is by far the quickest way to fill a dataclass
+        return [cls(*row) for row in rows]
+    records = list()
+    for row in rows:
+        record = cls.__new__(cls)
+        for name, value in zip(names, row):
+            object.__setattr__(record, name, value)
+        records.append(record)
+    return records
+
+
+class Decoder:
+    def __init__(self, arrays: t.Mapping[str, np.ndarray]):
+        self.arrays = arrays
+
+    def decode(self, node: t.Any) -> t.Any:
+        if not isinstance(node, dict):
+            return node
+        if "scalar" in node:
+            return self.arrays[node["scalar"]][()]
+        if "array" in node:
+            return self.arrays[node["array"]]
+        if "bytes" in node:
+            return self.arrays[node["bytes"]].tobytes()
+        if "bytearray" in node:
+            return bytearray(self.arrays[node["bytearray"]].tobytes())
+        if "record" in node:
+            names = list(node["fields"])
+            row = [self.decode(value) for value in node["fields"].values()]
+            return newRecords(resolveClass(node["record"]), names, [row])[0]
+        if "dict" in node:
+            keys = self.decode(node["dict"]["keys"])
+            values = self.decode(node["dict"]["values"])
+            return dict(zip(keys, values))
+        if "object" in node:
+            cls = resolveClass(node["object"])
+            instance = cls.__new__(cls)
+            for name, value in node["state"].items():
+                setattr(instance, name, self.decode(value))
+            return instance
+        return SEQUENCES[node["kind"]](self.decodeItems(node))
+
+    def decodeItems(self, node: t.Dict[str, t.Any]) -> t.Iterable[t.Any]:
+        if "ints" in node:
+            return self.arrays[node["ints"]].tolist()
+        if "bools" in node:
+            return self.arrays[node["bools"]].tolist()
+        if "ragged" in node:
+            values = self.arrays[node["ragged"]].tolist()
+            offsets = self.arrays[node["offsets"]].tolist()
+            inner = SEQUENCES[node["inner"]]
+            return [inner(values[a:b]) for a, b in zip(offsets, offsets[1:])]
+        if "records" in node:
+            cls = resolveClass(node["records"])
+            names = list(node["columns"])
+            columns = [self.decode(column) for column in node["columns"].values()]
+            return newRecords(cls, names, zip(*columns))
+        if "stacked" in node:
+            return list(self.arrays[node["stacked"]])
+        if "tuples" in node:
+            return list(zip(*[self.decode(column) for column in node["tuples"]]))
+        return [self.decode(item) for item in node["items"]]
+
+
+def dumpModel(model: t.Any, path: Path):
+    encoder = Encoder()
+    tree = encoder.encode(model)
+    structure = np.frombuffer(json.dumps(tree).encode(), dtype=np.uint8)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write under another name first so a reader never sees half a file
+    partial = path.with_name(path.stem + ".partial.npz")
+    np.savez(partial, structure=structure, **encoder.arrays)
+    partial.replace(path)
+
+
+def loadModel(path: Path) -> t.Any:
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+    tree = json.loads(arrays.pop("structure").tobytes())
+    return Decoder(arrays).decode(tree)
+
+
+# === Cache =================================================================
+
+
+def inputDigest(source: t.Union[str, Input]) -> str:
+    data = source.encode() if isinstance(source, str) else source.view()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def cachePath(
+    solution: Solution, source: t.Union[str, Input], directory: Path = MODEL_DIRECTORY
+) -> Path:
+    key = hashlib.blake2b(digest_size=16)
+    key.update(inputDigest(source).encode())
+    key.update(solution.sourceDigest().encode())
+    return directory / f"{solution.year}-{solution.day:02d}" / f"{key.hexdigest()}.npz"
+
+
+def cachedParse(
+    solution: Solution, source: t.Union[str, Input], directory: Path = MODEL_DIRECTORY
+) -> t.Any:
+    path = cachePath(solution, source, directory)
+    if path.exists():
+        try:
+            return loadModel(path)
+        except (OSError, ValueError, KeyError, AttributeError):
+            path.unlink(missing_ok=True)
+    model = solution.parse(source)
+    try:
+        dumpModel(model, path)
+    except Unsupported:
+        pass
+    return model
+
+
+def parser(solution: Solution) -> t.Callable[[t.Union[str, Input]], t.Any]:
+    """``solution.parse``, going through the cache while it is enabled."""
+    if not enabled:
+        return solution.parse
+    return lambda source: cachedParse(solution, source)
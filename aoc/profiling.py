@@ -0,0 +1,121 @@
+import cProfile
+import functools
+import io
+import pstats
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.runner import silenced
+from aoc.solutions import PARTS, Solution
+from aoc.sweep import STATE_DIRECTORY
+
+PROFILE_DIRECTORY = STATE_DIRECTORY / "profiles"
+
+Function = t.Tuple[str, int, str]
+
+
+def profileCall(
+    func: t.Callable[[t.Any], t.Any], arg: t.Any
+) -> t.Tuple[t.Any, pstats.Stats]:
+    profile = cProfile.Profile()
+    result = profile.runcall(func, arg)
+    return result, pstats.Stats(profile)
+
+
+def hotFunctions(stats: pstats.Stats, limit: int = 20, sort: str = "tottime") -> str:
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(sort).print_stats(limit)
+    return stream.getvalue().strip("\n")
+
+
+def functionName(function: Function) -> str:
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{Path(filename).name}:{name}:{line}"
+
+
+def collapsedStacks(stats: pstats.Stats) -> t.Dict[str, int]:
+    """Stacks in the collapsed format read by flamegraph.pl, inferno and speedscope.
+
+    cProfile only records caller -> callee edges, so time is pushed down the
+    call tree in proportion to each edge's cumulative time. Stacks are exact
+    for tree-shaped call graphs and an approximation where a function is
+    reached from several places.
+    """
+    entries = stats.stats
+    callees: t.Dict[Function, t.Dict[Function, float]] = dict()
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees.setdefault(caller, dict())[function] = cumulative
+
+    stacks: t.Dict[str, int] = dict()
+
+    def walk(function: Function, path: t.Tuple[str, ...], seconds: float):
+        _, _, ownTime, cumulative, _ = entries[function]
+        share = seconds / cumulative if cumulative else 0.0
+        path = path + (functionName(function),)
+        key = ";".join(path)
+        stacks[key] = stacks.get(key, 0) + round(ownTime * share * 1e6)
+        for callee, edgeTime in callees.get(function, dict()).items():
+            if functionName(callee) in path or callee not in entries:
+                continue
+            walk(callee, path, edgeTime * share)
+
+    roots = [f for f, (_, _, _, _, callers) in entries.items() if not callers]
+    for root in roots:
+        walk(root, (), entries[root][3])
+    return {stack: micros for stack, micros in stacks.items() if micros > 0}
+
+
+@dataclass
+class PhaseProfile:
+    solution: str
+    inputName: str
+    phase: str
+    stats: pstats.Stats
+    files: t.List[Path]
+
+
+def writeProfile(stats: pstats.Stats, directory: Path, stem: str) -> t.List[Path]:
+    """Raw stats (for snakeviz/pstats), the hot table and collapsed stacks."""
+    directory.mkdir(parents=True, exist_ok=True)
+    raw = directory / f"{stem}.prof"
+    stats.dump_stats(raw)
+
+    table = directory / f"{stem}.txt"
+    table.write_text(hotFunctions(stats, limit=100) + "\n")
+
+    collapsed = directory / f"{stem}.collapsed"
+    lines = [f"{stack} {micros}" for stack, micros in collapsedStacks(stats).items()]
+    collapsed.write_text("\n".join(sorted(lines)) + "\n")
+    return [raw, table, collapsed]
+
+
+def profileSolution(
+    solution: Solution,
+    parts: t.Sequence[int] = PARTS,
+    inputNames: t.Optional[t.Sequence[str]] = None,
+    directory: Path = PROFILE_DIRECTORY,
+) -> t.List[PhaseProfile]:
+    directory = directory / f"{solution.year}-{solution.day:02d}"
+    profiles: t.List[PhaseProfile] = list()
+    for inputPath in solution.inputs():
+        if inputNames and inputPath.name not in inputNames:
+            continue
+        with silenced(), solution.opened(inputPath) as source:
+            model, stats = profileCall(solution.parse, source)
+            phases = [("parse", stats)]
+            for part in parts:
+                solve = functools.partial(solution.solve, part)
+                phases.append((f"part {part}", profileCall(solve, model)[1]))
+
+        for phase, stats in phases:
+            stem = f"{inputPath.stem}-{phase.replace(' ', '')}"
+            files = writeProfile(stats, directory, stem)
+            profiles.append(
+                PhaseProfile(solution.name, inputPath.name, phase, stats, files)
+            )
+    return profiles
@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import time
+import typing as t
+
+# Progress reporting for long-running loops:
+#
+#     progress = track("2024/07 part 2", total=len(data), unit="eqs")
+#     for eq in data:
+#         ...
+#         progress.advance()
+#     progress.finish()
+#
+# ``advance`` is an add and a compare; the clock is only read every so many
+# items, tuned so that it happens a few times per reporting interval. While
+# reporting is disabled (the default) the compare never succeeds. Loops with
+# a cache can count ``progress.hits`` and ``progress.misses`` to get a hit rate.
+#
+# Reports go to stderr every ``interval`` seconds and, with a JSON lines file
+# configured, to that file as well. Enable with --progress or AOC_PROGRESS
+# (the interval in seconds) and AOC_PROGRESS_FILE.
+
+interval: t.Optional[float] = None
+jsonPath: t.Optional[str] = None
+
+
+def configure(seconds: t.Optional[float] = 1.0, path: t.Optional[str] = None):
+    global interval, jsonPath
+    interval = seconds
+    jsonPath = path
+
+
+def formatCount(value: float) -> str:
+    for suffix in ["", "k", "M", "G"]:
+        if abs(value) < 1000:
+            return f"{value:.0f}{suffix}" if not suffix else f"{value:.1f}{suffix}"
+        value /= 1000
+    return f"{value:.1f}T"
+
+
+def formatEta(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+class Progress:
+    def __init__(
+        self,
+        name: str,
+        total: t.Optional[float] = None,
+        unit: str = "items",
+        interval: t.Optional[float] = None,
+        jsonPath: t.Optional[str] = None,
+    ):
+        self.name = name
+        self.total = total
+        self.unit = unit
+        self.interval = interval
+        self.jsonPath = jsonPath
+        self.done = 0
+        self.hits = 0
+        self.misses = 0
+        self.start = self.lastReport = time.perf_counter()
+        self.lastDone = 0
+        # Items between clock reads; adapted to the observed rate
+        self.stride = 1
+        self.checkAt = 1 if interval is not None else float("inf")
+
+    def advance(self, n: float = 1):
+        self.done += n
+        if self.done >= self.checkAt:
+            self.check()
+
+    def check(self):
+        now = time.perf_counter()
+        since = now - self.lastReport
+        if since >= self.interval:
+            self.report(now)
+        # Aim for about ten clock reads per interval
+        rate = (self.done - self.lastDone) / since if since > 0 else 0.0
+        self.stride = (
+            max(1, int(rate * self.interval / 10)) if rate else self.stride * 2
+        )
+        self.checkAt = self.done + self.stride
+
+    @property
+    def hitRate(self) -> t.Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def snapshot(self, now: float) -> t.Dict[str, t.Any]:
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total and rate:
+            eta = max(0.0, (self.total - self.done) / rate)
+        return {
+            "name": self.name,
+            "time": time.time(),
+            "elapsed": elapsed,
+            "done": self.done,
+            "total": self.total,
+            "unit": self.unit,
+            "rate": rate,
+            "eta": eta,
+            "hitRate": self.hitRate,
+        }
+
+    def report(self, now: float, final: bool = False):
+        status = self.snapshot(now)
+        line = f"[{self.name}] {formatCount(self.done)}"
+        if self.total:
+            line += f"/{formatCount(self.total)} ({self.done / self.total:.1%})"
+        line += f" {self.unit}, {formatCount(status['rate'])}/s"
+        if status["eta"] is not None and not final:
+            line += f", ETA {formatEta(status['eta'])}"
+        if self.hitRate is not None:
+            line += f", cache {self.hitRate:.1%} hit"
+        if final:
+            line += f", done in {formatEta(status['elapsed'])}"
+        print(line, file=sys.stderr, flush=True)
+
+        if self.jsonPath:
+            status["final"] = final
+            with open(self.jsonPath, "a") as file:
+                file.write(json.dumps(status) + "\n")
+        self.lastReport, self.lastDone = now, self.done
+
+    def finish(self):
+        if self.interval is not None:
+            self.report(time.perf_counter(), final=True)
+
+
+def track(name: str, total: t.Optional[float] = None, unit: str = "items") -> Progress:
+    return Progress(name, total, unit, interval, jsonPath)
+
+
+if "AOC_PROGRESS" in os.environ:
+    configure(
+        float(os.environ["AOC_PROGRESS"] or 1.0), os.environ.get("AOC_PROGRESS_FILE")
+    )
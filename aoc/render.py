@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import gzip
+import struct
+import sys
+import time
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.lazy import lazyImport
+
+np = lazyImport("numpy")
+
+if t.TYPE_CHECKING:
+    from aoc.grid import Grid
+
+# Maps are drawn on a uint8 canvas, one byte per cell, and every layer (the
+# robots, the boxes, the visited cells) is painted with a single fancy-indexed
+# assignment from an array of cell indices:
+#
+#     canvas = gridCanvas(grid)                    # a copy of the padded cells
+#     paint(canvas, boxes, "O")                   # flat Grid indices
+#     paint(canvas, [robot], "@")
+#     text(interior(grid, canvas))                 # one copy and one decode
+#
+# For animations a day defines ``frames(model, part)`` yielding (step, canvas)
+# pairs; FrameWriter streams them to a file as they come, either raw (every
+# frame's bytes through a gray palette, for ffmpeg's rawvideo) or as a compact
+# log of the cells that changed since the previous frame with a full key frame
+# now and then. A day may hand out the same canvas again after changing it.
+
+NEWLINE = ord("\n")
+
+Indices = t.Union[t.Sequence[int], "np.ndarray"]
+
+
+# === Painting ==============================================================
+
+
+def gridCanvas(grid: "Grid") -> np.ndarray:
+    """A writable copy of the grid's padded cells, shaped (rows, stride)."""
+    return grid.array().copy()
+
+
+def interior(grid: "Grid", canvas: np.ndarray) -> np.ndarray:
+    pad = grid.pad
+    return canvas[pad : pad + grid.height, pad : pad + grid.width]
+
+
+def paint(
+    canvas: np.ndarray, indices: Indices, values: t.Union[str, np.ndarray]
+) -> np.ndarray:
+    """Set the cells at flat ``indices`` to one char or to per-cell bytes."""
+    flat = canvas.reshape(-1)
+    if isinstance(values, str):
+        values = ord(values)
+    flat[np.asarray(indices, dtype=np.intp)] = values
+    return canvas
+
+
+def text(canvas: np.ndarray) -> str:
+    """A (height, width) canvas as lines of text."""
+    height, width = canvas.shape
+    lines = np.empty((height, width + 1), dtype=np.uint8)
+    lines[:, :width] = canvas
+    lines[:, width] = NEWLINE
+    return lines.tobytes()[:-1].decode("latin-1")
+
+
+DIGITS = b" 123456789"
+
+
+def heatmap(height: int, width: int, cells: Indices) -> np.ndarray:
+    """How many items are on each cell, as ' ' and digits capped at 9."""
+    counts = np.bincount(np.asarray(cells, dtype=np.intp), minlength=height * width)
+    digits = np.frombuffer(DIGITS, dtype=np.uint8)
+    return digits[np.minimum(counts, 9)].reshape(height, width)
+
+
+# === Frame streams =========================================================
+
+MAGIC = b"AOCFRAMES1\n"
+HEADER = struct.Struct("<II")  # height, width
+RECORD = struct.Struct("<IBI")  # step, kind, changed cells
+KEY, DELTA = 0, 1
+
+
+def grayPalette(background: str = ". ", walls: str = "#") -> np.ndarray:
+    """Byte -> gray level for raw frames: background black, walls gray."""
+    palette = np.full(256, 255, dtype=np.uint8)
+    palette[np.frombuffer(background.encode(), dtype=np.uint8)] = 0
+    palette[np.frombuffer(walls.encode(), dtype=np.uint8)] = 128
+    return palette
+
+
+def openStream(path: Path, mode: str) -> t.BinaryIO:
+    if path.suffix == ".gz":
+        # Frames repeat a lot; the fastest level already shrinks them well
+        return t.cast(t.BinaryIO, gzip.open(path, mode, compresslevel=1))
+    return open(path, mode)
+
+
+class FrameWriter:
+    """Streams frames of one shape to ``path`` (gzipped when it ends in .gz)."""
+
+    def __init__(
+        self,
+        path: Path,
+        height: int,
+        width: int,
+        raw: bool = False,
+        keyEvery: int = 256,
+        palette: t.Optional[np.ndarray] = None,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = openStream(path, "wb")
+        self.shape = (height, width)
+        self.raw = raw
+        self.keyEvery = keyEvery
+        self.palette = grayPalette() if palette is None else palette
+        self.previous: t.Optional[np.ndarray] = None
+        self.frames = 0
+        self.keyFrames = 0
+        if not raw:
+            self.file.write(MAGIC + HEADER.pack(height, width))
+
+    def write(self, canvas: np.ndarray, step: t.Optional[int] = None):
+        if canvas.shape != self.shape:
+            raise ValueError(f"frame is {canvas.shape}, the stream {self.shape}")
+        step = self.frames if step is None else step
+        self.frames += 1
+        if self.raw:
+            self.file.write(self.palette[canvas].tobytes())
+            return
+        flat = np.ascontiguousarray(canvas).reshape(-1)
+        changed = None
+        if self.previous is not None and self.frames % self.keyEvery:
+            changed = np.flatnonzero(flat != self.previous)
+            # A delta costs 5 bytes per cell; past a fifth of the map a key
+            # frame is smaller
+            if len(changed) * 5 > len(flat):
+                changed = None
+        if changed is None:
+            self.keyFrames += 1
+            self.file.write(RECORD.pack(step, KEY, len(flat)) + flat.tobytes())
+        else:
+            self.file.write(RECORD.pack(step, DELTA, len(changed)))
+            self.file.write(changed.astype("<u4").tobytes() + flat[changed].tobytes())
+        if self.previous is None:
+            self.previous = flat.copy()
+        else:
+            self.previous[:] = flat
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def readFrames(path: Path) -> t.Iterator[t.Tuple[int, np.ndarray]]:
+    """(step, canvas) per frame of a log; the canvas is reused between frames."""
+    with openStream(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a frame log")
+        height, width = HEADER.unpack(file.read(HEADER.size))
+        canvas = np.zeros(height * width, dtype=np.uint8)
+        while record := file.read(RECORD.size):
+            step, kind, count = RECORD.unpack(record)
+            if kind == KEY:
+                canvas[:] = np.frombuffer(file.read(count), dtype=np.uint8)
+            else:
+                cells = np.frombuffer(file.read(4 * count), dtype="<u4")
+                canvas[cells] = np.frombuffer(file.read(count), dtype=np.uint8)
+            yield step, canvas.reshape(height, width)
+
+
+# === Animating =============================================================
+
+
+Frames = t.Iterator[t.Tuple[int, "np.ndarray"]]
+
+
+@dataclass
+class Animation:
+    path: Path
+    shape: t.Tuple[int, int]
+    frames: int
+    keyFrames: int
+    produce: float  # simulating and painting
+    write: float
+    bytes: int
+
+
+def animate(
+    frames: Frames,
+    path: Path,
+    limit: t.Optional[int] = None,
+    every: int = 1,
+    raw: bool = False,
+) -> Animation:
+    """Write every ``every``-th frame, up to ``limit`` written, to ``path``."""
+    writer: t.Optional[FrameWriter] = None
+    produce = write = 0.0
+    start = time.perf_counter()
+    try:
+        for idx, (step, canvas) in enumerate(frames):
+            produced = time.perf_counter()
+            produce += produced - start
+            if idx % every == 0:
+                if writer is None:
+                    writer = FrameWriter(path, *canvas.shape, raw=raw)
+                writer.write(canvas, step)
+            start = time.perf_counter()
+            write += start - produced
+            if limit is not None and writer is not None and writer.frames >= limit:
+                break
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError("no frames to write")
+    return Animation(
+        path,
+        writer.shape,
+        writer.frames,
+        writer.keyFrames,
+        produce,
+        write,
+        path.stat().st_size,
+    )
+
+
+def play(path: Path, fps: float = 30.0, every: int = 1, out: t.TextIO = sys.stdout):
+    """Replay a frame log in the terminal."""
+    delay = 1 / fps if fps > 0 else 0.0
+    for idx, (step, canvas) in enumerate(readFrames(path)):
+        if idx % every:
+            continue
+        # Home the cursor and clear, then draw the frame in one write
+        out.write(f"\x1b[H\x1b[2J{text(canvas)}\nstep {step}\n")
+        out.flush()
+        time.sleep(delay)
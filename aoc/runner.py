@@ -0,0 +1,205 @@
+import contextlib
+import functools
+import numbers
+import os
+import sys
+import typing as t
+from dataclasses import dataclass
+
+from aoc.shared import checkUnchanged, fingerprint
+from aoc.solutions import PARTS, Solution
+from aoc.timing import Sample, Stats, formatDuration, measure
+
+
+def jsonAnswer(answer: t.Any) -> t.Union[int, str, None]:
+    if isinstance(answer, numbers.Integral):
+        return int(answer)
+    return None if answer is None else str(answer)
+
+
+@dataclass
+class PhaseResult:
+    solution: str
+    inputName: str
+    phase: str
+    answer: t.Any
+    expected: t.Optional[int]
+    stats: Stats
+    error: t.Optional[str] = None
+    # Answer and timing restored from an earlier run instead of measured
+    cached: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return "ERROR"
+        if self.expected is None:
+            return ""
+        return "ok" if self.answer == self.expected else "FAIL"
+
+    @property
+    def failed(self) -> bool:
+        return self.status in ("FAIL", "ERROR")
+
+    def asDict(self) -> t.Dict[str, t.Any]:
+        return {
+            "solution": self.solution,
+            "input": self.inputName,
+            "phase": self.phase,
+            "answer": jsonAnswer(self.answer),
+            "expected": self.expected,
+            "status": self.status,
+            "error": self.error,
+            "cold": self.stats.cold.wall,
+            "min": self.stats.min,
+            "median": self.stats.median,
+            "p95": self.stats.p95,
+            "cpu": self.stats.cpu,
+            "cached": self.cached,
+        }
+
+
+@contextlib.contextmanager
+def silenced(enabled: bool = True):
+    """Send the solvers' own print output to /dev/null while timing them."""
+    if not enabled:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def clearMemos():
+    """Start a timed call from empty memos, not the previous call's results."""
+    # Only days that memoize import aoc.memo (which imports this module)
+    memos = sys.modules.get("aoc.memo")
+    if memos is not None:
+        memos.clearAll()
+
+
+def timeCalls(func: t.Callable[..., t.Any], arg: t.Any, repeat: int):
+    samples = list()
+    for _ in range(max(1, repeat)):
+        clearMemos()
+        answer, sample = measure(func, arg)
+        samples.append(sample)
+    return answer, Stats(samples)
+
+
+def runSolution(
+    solution: Solution,
+    parts: t.Sequence[int] = PARTS,
+    inputNames: t.Optional[t.Sequence[str]] = None,
+    repeat: int = 5,
+    verbose: bool = False,
+    parse: t.Optional[t.Callable[[t.Any], t.Any]] = None,
+    checkMutation: bool = False,
+) -> t.List[PhaseResult]:
+    """Time each phase; one that raises is reported as an error, not re-raised."""
+    parse = parse or solution.parse
+    results: t.List[PhaseResult] = list()
+    for inputPath in solution.inputs():
+        if inputNames and inputPath.name not in inputNames:
+            continue
+
+        with silenced(not verbose):
+            # Parsed once per input; both parts share the same model.
+            error = None
+            try:
+                with solution.opened(inputPath) as source:
+                    model, stats = timeCalls(parse, source, repeat)
+            except Exception as exception:
+                stats, error = Stats([Sample(0.0, 0.0)]), repr(exception)
+            results.append(
+                PhaseResult(
+                    solution.name, inputPath.name, "parse", None, None, stats, error
+                )
+            )
+            if error is not None:
+                continue
+            # Pickling a large model costs more than some solves
+            before = fingerprint(model) if checkMutation else None
+            for part in parts:
+                solve = functools.partial(solution.solve, part)
+                answer, error = None, None
+                try:
+                    answer, stats = timeCalls(solve, model, repeat)
+                    if before is not None:
+                        checkUnchanged(model, before, f"{solution.name} part {part}")
+                except Exception as exception:
+                    stats, error = Stats([Sample(0.0, 0.0)]), repr(exception)
+                results.append(
+                    PhaseResult(
+                        solution.name,
+                        inputPath.name,
+                        f"part {part}",
+                        answer,
+                        solution.expected(inputPath.name, part),
+                        stats,
+                        error,
+                    )
+                )
+    return results
+
+
+# === Reporting =============================================================
+
+
+COLUMNS = [
+    "day",
+    "input",
+    "phase",
+    "answer",
+    "check",
+    "cold",
+    "min",
+    "median",
+    "p95",
+    "cpu",
+]
+
+
+def checkCell(result: PhaseResult) -> str:
+    if result.status == "FAIL":
+        return f"FAIL (expected {result.expected})"
+    if result.status == "ERROR":
+        return f"ERROR ({result.error})"
+    if result.cached:
+        return f"{result.status} (cached)".lstrip()
+    return result.status
+
+
+def reportRows(results: t.Iterable[PhaseResult]) -> t.List[t.List[str]]:
+    rows = list()
+    for result in results:
+        stats = result.stats
+        rows.append(
+            [
+                result.solution,
+                result.inputName,
+                result.phase,
+                "" if result.answer is None else str(result.answer),
+                checkCell(result),
+                formatDuration(stats.cold.wall),
+                formatDuration(stats.min),
+                formatDuration(stats.median),
+                formatDuration(stats.p95),
+                formatDuration(stats.cpu),
+            ]
+        )
+    return rows
+
+
+def formatTable(header: t.Sequence[str], rows: t.Sequence[t.Sequence[str]]) -> str:
+    widths = [
+        max(len(row[idx]) for row in [header, *rows]) for idx in range(len(header))
+    ]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(header, widths))]
+    lines.append("  ".join("-" * width for width in widths))
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def formatReport(results: t.Sequence[PhaseResult]) -> str:
+    return formatTable(COLUMNS, reportRows(results))
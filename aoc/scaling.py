@@ -0,0 +1,261 @@
+import csv
+import functools
+import math
+import statistics
+import typing as t
+from dataclasses import dataclass
+
+import numpy as np
+
+from aoc.bench import isBenchmarkInput, tracedCall
+from aoc.generators import loopingObstacle
+from aoc.runner import clearMemos, formatTable, silenced
+from aoc.solutions import PARTS, Solution
+from aoc.timing import formatBytes, formatDuration, measure
+
+# === Growing inputs ========================================================
+#
+# Every scaler turns the real input into one about ``factor`` times as large
+# by tiling it, while keeping whatever the solver relies on intact.
+
+Scaler = t.Callable[[str, int], str]
+
+
+def gridShape(factor: int) -> t.Tuple[int, int]:
+    rows = math.isqrt(factor)
+    return rows, factor // rows
+
+
+def tileLines(text: str, factor: int) -> str:
+    return "\n".join([text.strip("\n")] * factor)
+
+
+def tileWords(text: str, factor: int) -> str:
+    return " ".join([text.strip()] * factor)
+
+
+def tileBlocks(text: str, factor: int) -> str:
+    return "\n\n".join([text.strip("\n")] * factor)
+
+
+def tileGrid(text: str, factor: int) -> str:
+    rows, cols = gridShape(factor)
+    lines = [line * cols for line in text.strip("\n").splitlines()]
+    return "\n".join(lines * rows)
+
+
+def tileSecondSection(text: str, factor: int) -> str:
+    """Keep the first section (rules, map) and tile the second one."""
+    first, second = text.strip("\n").split("\n\n")
+    return first + "\n\n" + tileLines(second, factor)
+
+
+def tileDiskMap(text: str, factor: int) -> str:
+    # Copies are joined by an empty free block so files stay on even indices
+    return "0".join([text.strip()] * factor)
+
+
+def tileGuardMap(text: str, factor: int) -> str:
+    grid = np.array(
+        [list(line.encode()) for line in tileGrid(text, factor).splitlines()]
+    )
+    # Keep the guard of the middle tile so its walk can cross into the others
+    starts = np.argwhere(grid == ord("^"))
+    grid[grid == ord("^")] = ord(".")
+    start = tuple(int(v) for v in starts[len(starts) // 2])
+    grid[start] = ord("^")
+    # Tiles are connected now, so the guard may get stuck walking in a loop
+    obstacles = grid == ord("#")
+    while (blocker := loopingObstacle(obstacles, start)) is not None:
+        obstacles[blocker] = False
+        grid[blocker] = ord(".")
+    return "\n".join(row.astype(np.uint8).tobytes().decode("ascii") for row in grid)
+
+
+SCALERS: t.Dict[t.Tuple[int, int], Scaler] = {
+    (2024, 1): tileLines,
+    (2024, 2): tileLines,
+    (2024, 3): tileLines,
+    (2024, 4): tileGrid,
+    (2024, 5): tileSecondSection,
+    (2024, 6): tileGuardMap,
+    (2024, 7): tileLines,
+    (2024, 8): tileGrid,
+    (2024, 9): tileDiskMap,
+    (2024, 10): tileGrid,
+    (2024, 11): tileWords,
+    (2024, 12): tileGrid,
+    (2024, 13): tileBlocks,
+    (2024, 14): tileLines,
+    (2024, 15): tileSecondSection,
+}
+
+
+# === Measuring =============================================================
+
+
+@dataclass
+class Point:
+    solution: str
+    phase: str
+    factor: int
+    inputBytes: int
+    seconds: float
+    peakMemory: int
+
+
+def timePhase(
+    func: t.Callable[[t.Any], t.Any], arg: t.Any, repeat: int
+) -> t.Tuple[float, int]:
+    """Fastest of ``repeat`` calls, and the peak memory of a separate traced call."""
+    _, peak = tracedCall(func, arg)
+    times = list()
+    for _ in range(max(1, repeat)):
+        clearMemos()
+        times.append(measure(func, arg)[1].wall)
+    return min(times), peak
+
+
+def measureScaling(
+    solution: Solution,
+    factors: t.Sequence[int],
+    parts: t.Sequence[int] = PARTS,
+    repeat: int = 1,
+    budget: float = 30.0,
+) -> t.List[Point]:
+    """Time each phase on growing inputs.
+
+    Once a phase takes longer than ``budget`` seconds it is skipped for the
+    larger inputs.
+    """
+    scaler = SCALERS[solution.year, solution.day]
+    base = next(p for p in solution.inputs() if isBenchmarkInput(p.name)).read_text()
+
+    points: t.List[Point] = list()
+    exhausted: t.Set[str] = set()
+    for factor in sorted(factors):
+        inputString = scaler(base, factor)
+        size = len(inputString.encode())
+        phases: t.List[t.Tuple[str, t.Callable[[t.Any], t.Any]]] = [
+            ("parse", solution.parse)
+        ] + [
+            (f"part {part}", functools.partial(solution.solve, part)) for part in parts
+        ]
+
+        with silenced():
+            model = solution.parse(inputString)
+            for phase, func in phases:
+                if phase in exhausted:
+                    continue
+                arg = inputString if phase == "parse" else model
+                seconds, peak = timePhase(func, arg, repeat)
+                points.append(Point(solution.name, phase, factor, size, seconds, peak))
+                if seconds > budget:
+                    exhausted.add(phase)
+    return points
+
+
+def exponent(sizes: t.Sequence[float], values: t.Sequence[float]) -> t.Optional[float]:
+    """Slope of the log-log fit, i.e. k in value ~ size^k."""
+    pairs = [
+        (math.log(s), math.log(v)) for s, v in zip(sizes, values) if s > 0 and v > 0
+    ]
+    if len(pairs) < 2 or len({x for x, _ in pairs}) < 2:
+        return None
+    return statistics.linear_regression(*zip(*pairs)).slope
+
+
+@dataclass
+class Fit:
+    solution: str
+    phase: str
+    timeExponent: t.Optional[float]
+    memoryExponent: t.Optional[float]
+
+
+def fitPoints(points: t.Sequence[Point]) -> t.List[Fit]:
+    groups: t.Dict[t.Tuple[str, str], t.List[Point]] = dict()
+    for point in points:
+        groups.setdefault((point.solution, point.phase), list()).append(point)
+
+    fits = list()
+    for (solution, phase), group in groups.items():
+        sizes = [p.inputBytes for p in group]
+        fits.append(
+            Fit(
+                solution,
+                phase,
+                exponent(sizes, [p.seconds for p in group]),
+                exponent(sizes, [p.peakMemory for p in group]),
+            )
+        )
+    return fits
+
+
+# === Reporting =============================================================
+
+
+def formatExponent(value: t.Optional[float]) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def formatScaling(points: t.Sequence[Point], fits: t.Sequence[Fit]) -> str:
+    pointRows = [
+        [
+            p.solution,
+            p.phase,
+            f"x{p.factor}",
+            formatBytes(p.inputBytes),
+            formatDuration(p.seconds),
+            formatBytes(p.peakMemory),
+        ]
+        for p in points
+    ]
+    fitRows = [
+        [
+            f.solution,
+            f.phase,
+            formatExponent(f.timeExponent),
+            formatExponent(f.memoryExponent),
+        ]
+        for f in fits
+    ]
+    return "\n\n".join(
+        [
+            formatTable(
+                ["day", "phase", "factor", "input", "time", "peak mem"], pointRows
+            ),
+            formatTable(["day", "phase", "time ~ n^k", "memory ~ n^k"], fitRows),
+        ]
+    )
+
+
+def writeCsv(points: t.Sequence[Point], fits: t.Sequence[Fit], file: t.TextIO):
+    byPhase = {(f.solution, f.phase): f for f in fits}
+    writer = csv.writer(file)
+    writer.writerow(
+        [
+            "day",
+            "phase",
+            "factor",
+            "inputBytes",
+            "seconds",
+            "peakMemory",
+            "timeExponent",
+            "memoryExponent",
+        ]
+    )
+    for p in points:
+        fit = byPhase[p.solution, p.phase]
+        writer.writerow(
+            [
+                p.solution,
+                p.phase,
+                p.factor,
+                p.inputBytes,
+                f"{p.seconds:.6g}",
+                p.peakMemory,
+                formatExponent(fit.timeExponent),
+                formatExponent(fit.memoryExponent),
+            ]
+        )
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import heapq
+import typing as t
+from array import array
+from collections import deque
+
+from aoc.grid import OUTSIDE, Grid
+from aoc.lazy import lazyImport
+
+np = lazyImport("numpy")
+
+# Graph searches over a Grid's flat cells. Cells are the grid's integer
+# indices and neighbours are the four ``grid.directions`` offsets; the OUTSIDE
+# padding and ``walls`` cells are never entered. Distances, parents and counts
+# live in preallocated ``array`` buffers (fast to index one cell at a time from
+# Python) and come back as numpy views of them, ready for masks:
+#
+#     search = bfs(grid, grid.findAll("S"))
+#     search.distance[grid.find("E")]           # -1 when unreachable
+#     search.path(grid.find("E"))               # [start, ..., end]
+#     heights[search.order]                     # cells in the order reached
+#
+# Every search takes several sources. Which edges exist is narrowed with
+# ``step(src, dst) -> bool``; weighted searches take ``cost(src, dst)``
+# returning the edge weight, or None for no edge.
+
+UNREACHED = -1
+
+Step = t.Callable[[int, int], bool]
+Cost = t.Callable[[int, int], t.Optional[int]]
+
+
+class Search(t.NamedTuple):
+    distance: np.ndarray
+    parent: np.ndarray
+    order: np.ndarray
+
+    def reached(self, cell: int) -> bool:
+        return self.distance[cell] != UNREACHED
+
+    def path(self, target: int) -> t.List[int]:
+        """Cells from a source to ``target``; empty when it was not reached."""
+        if self.distance[target] == UNREACHED:
+            return []
+        path = [target]
+        while self.parent[path[-1]] != UNREACHED:
+            path.append(int(self.parent[path[-1]]))
+        path.reverse()
+        return path
+
+
+def blockedCells(grid: Grid, walls: str = "#") -> bytes:
+    """1 for every cell a search may not enter."""
+    table = bytearray(256)
+    table[OUTSIDE] = 1
+    for wall in walls.encode():
+        table[wall] = 1
+    # One C-level pass; searches on small grids run often enough for it to matter
+    return grid.cells.translate(table)
+
+
+def buffer(size: int, value: int = UNREACHED) -> array:
+    return array("q", [value]) * size
+
+
+def view(values: array) -> np.ndarray:
+    return np.frombuffer(values, dtype=np.int64)
+
+
+def result(distance: array, parent: array, order: array) -> Search:
+    return Search(view(distance), view(parent), view(order))
+
+
+# === Unweighted ============================================================
+
+
+def bfs(
+    grid: Grid,
+    sources: t.Iterable[int],
+    step: t.Optional[Step] = None,
+    walls: str = "#",
+) -> Search:
+    size, offsets = len(grid.cells), grid.directions
+    blocked = blockedCells(grid, walls)
+    distance, parent = buffer(size), buffer(size)
+    # The visit order doubles as the queue
+    order = array("q")
+    for source in sources:
+        if distance[source] == UNREACHED:
+            distance[source] = 0
+            order.append(source)
+
+    head = 0
+    while head < len(order):
+        cell = order[head]
+        head += 1
+        nextDistance = distance[cell] + 1
+        for offset in offsets:
+            nextCell = cell + offset
+            if blocked[nextCell] or distance[nextCell] != UNREACHED:
+                continue
+            if step is not None and not step(cell, nextCell):
+                continue
+            distance[nextCell] = nextDistance
+            parent[nextCell] = cell
+            order.append(nextCell)
+    return result(distance, parent, order)
+
+
+def components(
+    grid: Grid, step: t.Optional[Step] = None, walls: str = ""
+) -> t.Tuple[np.ndarray, int]:
+    """Label connected cells; by default neighbours connect when they are equal.
+
+    Returns the labels (UNREACHED for padding and walls) and their number.
+    """
+    cells, size, offsets = grid.cells, len(grid.cells), grid.directions
+    blocked = blockedCells(grid, walls)
+    labels = buffer(size)
+    queue = array("q")
+    count = 0
+    for start in range(size):
+        if blocked[start] or labels[start] != UNREACHED:
+            continue
+        labels[start] = count
+        del queue[:]
+        queue.append(start)
+        head = 0
+        while head < len(queue):
+            cell = queue[head]
+            head += 1
+            value = cells[cell]
+            for offset in offsets:
+                nextCell = cell + offset
+                if blocked[nextCell] or labels[nextCell] != UNREACHED:
+                    continue
+                if step is None:
+                    if cells[nextCell] != value:
+                        continue
+                elif not step(cell, nextCell):
+                    continue
+                labels[nextCell] = count
+                queue.append(nextCell)
+        count += 1
+    return view(labels), count
+
+
+# === Weighted ==============================================================
+
+
+def zeroOneBfs(
+    grid: Grid, sources: t.Iterable[int], cost: Cost, walls: str = "#"
+) -> Search:
+    """Shortest paths when every edge costs 0 or 1."""
+    size, offsets = len(grid.cells), grid.directions
+    blocked = blockedCells(grid, walls)
+    distance, parent = buffer(size), buffer(size)
+    order = array("q")
+    done = bytearray(size)
+    queue: t.Deque[int] = deque()
+    for source in sources:
+        distance[source] = 0
+        queue.append(source)
+
+    while queue:
+        cell = queue.popleft()
+        if done[cell]:
+            continue
+        done[cell] = 1
+        order.append(cell)
+        for offset in offsets:
+            nextCell = cell + offset
+            if blocked[nextCell] or done[nextCell]:
+                continue
+            weight = cost(cell, nextCell)
+            if weight is None:
+                continue
+            nextDistance = distance[cell] + weight
+            known = distance[nextCell]
+            if known != UNREACHED and known <= nextDistance:
+                continue
+            distance[nextCell] = nextDistance
+            parent[nextCell] = cell
+            if weight:
+                queue.append(nextCell)
+            else:
+                queue.appendleft(nextCell)
+    return result(distance, parent, order)
+
+
+def manhattan(grid: Grid, goal: int) -> t.Callable[[int], int]:
+    goalRow, goalCol = divmod(goal, grid.stride)
+
+    def distance(cell: int) -> int:
+        row, col = divmod(cell, grid.stride)
+        return abs(row - goalRow) + abs(col - goalCol)
+
+    return distance
+
+
+def dijkstra(
+    grid: Grid,
+    sources: t.Iterable[int],
+    cost: Cost,
+    walls: str = "#",
+    goal: t.Optional[int] = None,
+    heuristic: t.Optional[t.Callable[[int], int]] = None,
+) -> Search:
+    """Shortest paths for non-negative weights.
+
+    With a ``goal`` the search stops once it is settled, and a ``heuristic``
+    (a lower bound of the remaining cost) turns this into A*.
+    """
+    size, offsets = len(grid.cells), grid.directions
+    blocked = blockedCells(grid, walls)
+    distance, parent = buffer(size), buffer(size)
+    order = array("q")
+    done = bytearray(size)
+    estimate = heuristic or (lambda cell: 0)
+    heap: t.List[t.Tuple[int, int, int]] = list()
+    for source in sources:
+        distance[source] = 0
+        heap.append((estimate(source), 0, source))
+    heapq.heapify(heap)
+
+    while heap:
+        _, cellDistance, cell = heapq.heappop(heap)
+        if done[cell] or cellDistance != distance[cell]:
+            continue
+        done[cell] = 1
+        order.append(cell)
+        if cell == goal:
+            break
+        for offset in offsets:
+            nextCell = cell + offset
+            if blocked[nextCell] or done[nextCell]:
+                continue
+            weight = cost(cell, nextCell)
+            if weight is None:
+                continue
+            nextDistance = cellDistance + weight
+            known = distance[nextCell]
+            if known != UNREACHED and known <= nextDistance:
+                continue
+            distance[nextCell] = nextDistance
+            parent[nextCell] = cell
+            heapq.heappush(
+                heap, (nextDistance + estimate(nextCell), nextDistance, nextCell)
+            )
+    return result(distance, parent, order)
+
+
+def astar(
+    grid: Grid,
+    sources: t.Iterable[int],
+    goal: int,
+    cost: Cost,
+    walls: str = "#",
+    heuristic: t.Optional[t.Callable[[int], int]] = None,
+) -> Search:
+    """Dijkstra towards one goal, guided by the Manhattan distance by default.
+
+    The default heuristic assumes every step costs at least 1.
+    """
+    heuristic = heuristic or manhattan(grid, goal)
+    return dijkstra(grid, sources, cost, walls, goal, heuristic)
+
+
+# === Path counting =========================================================
+
+
+def countPaths(
+    grid: Grid, sources: t.Iterable[int], step: Step, walls: str = "#"
+) -> np.ndarray:
+    """Number of distinct paths from any source to each cell.
+
+    ``step`` has to describe a DAG (such as "one higher"); a cycle among the
+    reachable cells raises ValueError.
+    """
+    size, offsets = len(grid.cells), grid.directions
+    blocked = blockedCells(grid, walls)
+    sources = list(dict.fromkeys(sources))
+
+    # The reachable part of the DAG, with each cell's incoming edge count
+    inDegree = array("q", bytes(8 * size))
+    edges: t.Dict[int, t.List[int]] = dict()
+    seen = bytearray(size)
+    pending = list(sources)
+    for source in sources:
+        seen[source] = 1
+    while pending:
+        cell = pending.pop()
+        targets = [
+            cell + offset
+            for offset in offsets
+            if not blocked[cell + offset] and step(cell, cell + offset)
+        ]
+        edges[cell] = targets
+        for target in targets:
+            inDegree[target] += 1
+            if not seen[target]:
+                seen[target] = 1
+                pending.append(target)
+
+    counts = array("q", bytes(8 * size))
+    for source in sources:
+        counts[source] += 1
+    # Kahn's algorithm: a cell is final once all its incoming edges are in
+    ready = [cell for cell in edges if inDegree[cell] == 0]
+    settled = 0
+    while ready:
+        cell = ready.pop()
+        settled += 1
+        for target in edges[cell]:
+            counts[target] += counts[cell]
+            inDegree[target] -= 1
+            if inDegree[target] == 0:
+                ready.append(target)
+    if settled != len(edges):
+        raise ValueError("step does not describe a DAG: the paths form a cycle")
+    return view(counts)
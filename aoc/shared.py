@@ -0,0 +1,63 @@
+import copy
+import hashlib
+import pickle
+import typing as t
+
+# Both parts of a day are solved on the one model parse returns, so a solver
+# must not change it. Parts that do (day 15 pushing boxes around) are listed
+# in the day's MUTATES and get a CopyOnWrite view instead of the model:
+#
+#     MUTATES = {1}
+#
+#     def copyModel(parsed):          # optional; copy.copy otherwise
+#         stage, instructions = parsed
+#         return stage.copy(), instructions
+#
+#     def solve1(view: CopyOnWrite[Parsed]) -> int:
+#         stage, instructions = view.write()
+#
+# ``copyModel`` copies only what the part writes and shares the rest (the
+# walls, the instruction list). ``run --check-mutation`` checks that the
+# other parts leave the model alone by comparing a fingerprint of it before
+# and after each part.
+
+T = t.TypeVar("T")
+
+
+class CopyOnWrite(t.Generic[T]):
+    """View of a shared model that is only copied once a part asks to write.
+
+    ``read`` is free; the first ``write`` pays for one copy made by ``copier``.
+    """
+
+    __slots__ = ("_shared", "_private", "_copier")
+
+    def __init__(self, shared: T, copier: t.Callable[[T], T] = copy.copy):
+        self._shared = shared
+        self._private: t.Optional[T] = None
+        self._copier = copier
+
+    @property
+    def read(self) -> T:
+        return self._shared if self._private is None else self._private
+
+    def write(self) -> T:
+        if self._private is None:
+            self._private = self._copier(self._shared)
+        return self._private
+
+
+class SharedModelMutated(RuntimeError):
+    pass
+
+
+def fingerprint(model: t.Any) -> str:
+    return hashlib.blake2b(pickle.dumps(model), digest_size=16).hexdigest()
+
+
+def checkUnchanged(model: t.Any, before: str, who: str):
+    if fingerprint(model) != before:
+        raise SharedModelMutated(
+            f"{who} modified the shared model; list the part in MUTATES "
+            "and write through CopyOnWrite.write() instead"
+        )
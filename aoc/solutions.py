@@ -0,0 +1,205 @@
+import ast
+import contextlib
+import copy
+import hashlib
+import importlib.util
+import re
+import sys
+import types
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.inputs import Input
+from aoc.shared import CopyOnWrite
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / "aoc"
+
+PARTS = (1, 2)
+
+Expected = t.Tuple[t.Optional[int], t.Optional[int]]
+
+
+# === Discovery =============================================================
+
+
+def dayDirectory(year: int, day: int) -> Path:
+    return ROOT / str(year) / f"{day:02d}"
+
+
+def iterDays(year: int) -> t.Iterator[int]:
+    for directory in sorted((ROOT / str(year)).iterdir()):
+        if (
+            re.fullmatch(r"\d\d", directory.name)
+            and (directory / "solution.py").exists()
+        ):
+            yield int(directory.name)
+
+
+# === Source files ==========================================================
+
+
+# path -> (mtime_ns, aoc modules it imports); watch asks on every poll
+importCache: t.Dict[Path, t.Tuple[int, t.FrozenSet[Path]]] = dict()
+
+
+def modulePath(name: str) -> t.Optional[Path]:
+    """The file of aoc module ``name`` (e.g. "aoc.grid"), if it is one."""
+    parts = name.split(".")
+    if parts[0] != "aoc" or len(parts) < 2:
+        return None
+    path = PACKAGE.joinpath(*parts[1:])
+    for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def aocImports(path: Path) -> t.FrozenSet[Path]:
+    """Files of the aoc modules ``path`` imports anywhere, even in functions."""
+    mtime = path.stat().st_mtime_ns
+    cached = importCache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    names = list()
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+            # from aoc import memo
+            names += [f"{node.module}.{alias.name}" for alias in node.names]
+    found = {modulePath(name) for name in names}
+    imports = frozenset(found - {None, path})
+    importCache[path] = (mtime, imports)
+    return imports
+
+
+def importClosure(paths: t.Iterable[Path]) -> t.Set[Path]:
+    """``paths`` and every aoc module they import, directly or not."""
+    seen: t.Set[Path] = set()
+    pending = list(paths)
+    while pending:
+        path = pending.pop()
+        if path not in seen:
+            seen.add(path)
+            pending += aocImports(path)
+    return seen
+
+
+# === Loading ===============================================================
+
+
+def loadModule(directory: Path) -> types.ModuleType:
+    # Days import their helpers (such as utils.py) as top-level modules, so a
+    # helper cached by another day has to be dropped before importing this one.
+    for helper in directory.glob("*.py"):
+        loaded = sys.modules.get(helper.stem)
+        loadedFile = getattr(loaded, "__file__", None)
+        if loadedFile is not None and Path(loadedFile).parent != directory:
+            del sys.modules[helper.stem]
+
+    name = f"aoc_{directory.parent.name}_{directory.name}"
+    spec = importlib.util.spec_from_file_location(name, directory / "solution.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(directory))
+    try:
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(directory))
+    return module
+
+
+@dataclass
+class Solution:
+    year: int
+    day: int
+    directory: Path
+    module: types.ModuleType
+
+    @classmethod
+    def load(cls, year: int, day: int) -> "Solution":
+        directory = dayDirectory(year, day)
+        if not (directory / "solution.py").exists():
+            raise FileNotFoundError(f"No solution.py in {directory}")
+        return cls(year, day, directory, loadModule(directory))
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day:02d}"
+
+    @property
+    def expectedAnswers(self) -> t.Dict[str, Expected]:
+        return getattr(self.module, "EXPECTED", {})
+
+    def inputs(self) -> t.List[Path]:
+        if self.expectedAnswers:
+            return [self.directory / name for name in self.expectedAnswers]
+        return sorted(self.directory.glob("*.txt"))
+
+    def expected(self, inputName: str, part: int) -> t.Optional[int]:
+        answers = self.expectedAnswers.get(inputName)
+        return None if answers is None else answers[part - 1]
+
+    @property
+    def mutates(self) -> t.Collection[int]:
+        return getattr(self.module, "MUTATES", ())
+
+    def sourceFiles(self) -> t.List[Path]:
+        """The day's own .py files and the aoc modules they import, transitively."""
+        return sorted(importClosure(self.directory.glob("*.py")))
+
+    def sourceDigest(self) -> str:
+        """Changes whenever code the day runs, down to the aoc modules, changes."""
+        digest = hashlib.blake2b(digest_size=16)
+        for path in self.sourceFiles():
+            digest.update(path.name.encode() + b"\0" + path.read_bytes())
+        return digest.hexdigest()
+
+    @property
+    def streams(self) -> bool:
+        """Whether ``parse`` takes an Input rather than a str."""
+        return getattr(self.module, "STREAMING", False)
+
+    def read(self, inputPath: Path) -> t.Union[str, Input]:
+        """The input in the form ``parse`` takes, memory-mapped where possible."""
+        return Input.open(inputPath) if self.streams else inputPath.read_text()
+
+    def opened(self, inputPath: Path) -> t.ContextManager[t.Union[str, Input]]:
+        """``read`` for a with block, which closes a memory-mapped input."""
+        source = self.read(inputPath)
+        if isinstance(source, Input):
+            return source
+        return contextlib.nullcontext(source)
+
+    def parseFile(self, inputPath: Path) -> t.Any:
+        with self.opened(inputPath) as source:
+            return self.parse(source)
+
+    def parse(self, source: t.Union[str, Input]) -> t.Any:
+        if self.streams and isinstance(source, str):
+            source = Input.fromString(source)
+        elif not self.streams and isinstance(source, Input):
+            source = source.text()
+        return self.module.parse(source)
+
+    @property
+    def engines(self) -> t.Dict[str, t.Dict[int, t.Callable[[t.Any], int]]]:
+        """Alternative solvers per part, checked against solve1/solve2."""
+        return getattr(self.module, "ENGINES", {})
+
+    def solver(
+        self, part: int, engine: t.Optional[str] = None
+    ) -> t.Callable[[t.Any], int]:
+        if engine is not None:
+            return self.engines[engine][part]
+        return getattr(self.module, f"solve{part}")
+
+    def solve(self, part: int, model: t.Any, engine: t.Optional[str] = None) -> int:
+        """Solve one part on a model shared between parts."""
+        if part in self.mutates:
+            copier = getattr(self.module, "copyModel", copy.copy)
+            return self.solver(part, engine)(CopyOnWrite(model, copier))
+        return self.solver(part, engine)(model)
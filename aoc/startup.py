@@ -0,0 +1,126 @@
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+import typing as t
+from dataclasses import dataclass
+
+from aoc.runner import formatTable
+from aoc.solutions import ROOT, Solution
+from aoc.timing import formatDuration
+
+# Startup latency of a day, each run in a fresh interpreter:
+#
+#   interpreter   a bare `python -c pass`
+#   harness       importing aoc.solutions
+#   import        Solution.load, i.e. the day's module and everything it imports
+#   first result  reading one input, parse and part 1
+#
+# The child times its own phases and prints them as JSON; ``total`` is the wall
+# time the parent saw for the whole child. One more run under -X importtime
+# names the packages that cost the most to import.
+
+CHILD = """
+import time
+start = time.perf_counter()
+import contextlib, json, os, sys
+import aoc.solutions
+harness = time.perf_counter()
+solution = aoc.solutions.Solution.load(int(sys.argv[1]), int(sys.argv[2]))
+loaded = time.perf_counter()
+with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+    model = solution.parse(solution.read(solution.directory / sys.argv[3]))
+    solution.solve(1, model)
+done = time.perf_counter()
+print(json.dumps([harness - start, loaded - harness, done - loaded]))
+"""
+
+PHASES = ("harness", "import", "first result")
+
+
+@dataclass
+class Startup:
+    solution: str
+    inputName: str
+    interpreter: float
+    phases: t.Dict[str, float]
+    total: float
+    heaviest: t.List[t.Tuple[str, float]]
+
+
+def runChild(args: t.Sequence[str]) -> t.Tuple[float, subprocess.CompletedProcess]:
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return time.perf_counter() - start, process
+
+
+def interpreterTime(repeat: int = 5) -> float:
+    return statistics.median(runChild(["-c", "pass"])[0] for _ in range(repeat))
+
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \| *(\S+)")
+
+
+def heaviestImports(stderr: str, limit: int) -> t.List[t.Tuple[str, float]]:
+    """Packages by the summed self time of their modules, from -X importtime.
+
+    Self times do not include nested imports, so numpy counts as numpy even
+    when aoc.grid is what pulled it in.
+    """
+    totals: t.Dict[str, float] = dict()
+    for match in IMPORT_LINE.finditer(stderr):
+        own, name = match.groups()
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0.0) + int(own) * 1e-6
+    ranked = sorted(totals.items(), key=lambda item: -item[1])
+    return ranked[:limit]
+
+
+def measureStartup(
+    solution: Solution,
+    inputName: t.Optional[str] = None,
+    repeat: int = 5,
+    interpreter: t.Optional[float] = None,
+    limit: int = 3,
+) -> Startup:
+    inputName = inputName or solution.inputs()[0].name
+    args = ["-c", CHILD, str(solution.year), str(solution.day), inputName]
+    # The first run compiles bytecode and warms the page cache
+    runChild(args)
+    totals, phases = list(), list()
+    for _ in range(repeat):
+        total, process = runChild(args)
+        totals.append(total)
+        phases.append(json.loads(process.stdout))
+    _, traced = runChild(["-X", "importtime", *args])
+    return Startup(
+        solution.name,
+        inputName,
+        interpreterTime(repeat) if interpreter is None else interpreter,
+        {phase: statistics.median(times) for phase, times in zip(PHASES, zip(*phases))},
+        statistics.median(totals),
+        heaviestImports(traced.stderr, limit),
+    )
+
+
+def formatStartups(startups: t.Sequence[Startup]) -> str:
+    header = ["day", "input", "interpreter", *PHASES, "total", "heaviest imports"]
+    rows = [
+        [
+            startup.solution,
+            startup.inputName,
+            formatDuration(startup.interpreter),
+            *(formatDuration(startup.phases[phase]) for phase in PHASES),
+            formatDuration(startup.total),
+            ", ".join(
+                f"{name} {formatDuration(seconds)}"
+                for name, seconds in startup.heaviest
+            ),
+        ]
+        for startup in startups
+    ]
+    return formatTable(header, rows)
@@ -0,0 +1,228 @@
+import hashlib
+import json
+import math
+import os
+import time
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.runner import PhaseResult, clearMemos, jsonAnswer, silenced
+from aoc.solutions import PARTS, ROOT, Solution
+from aoc.timing import Sample, Stats, measure
+
+STATE_DIRECTORY = ROOT / ".aoc"
+TIMINGS_PATH = STATE_DIRECTORY / "timings.json"
+ANSWERS_PATH = STATE_DIRECTORY / "answers.json"
+
+
+class Job(t.NamedTuple):
+    year: int
+    day: int
+    inputName: str
+    part: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/{self.day:02d} {self.inputName} part {self.part}"
+
+
+def collectJobs(
+    year: int,
+    days: t.Iterable[int],
+    parts: t.Sequence[int] = PARTS,
+    inputNames: t.Optional[t.Sequence[str]] = None,
+) -> t.List[Job]:
+    jobs: t.List[Job] = list()
+    for day in days:
+        for inputPath in Solution.load(year, day).inputs():
+            if inputNames and inputPath.name not in inputNames:
+                continue
+            jobs += [Job(year, day, inputPath.name, part) for part in parts]
+    return jobs
+
+
+# === Recorded timings ======================================================
+
+
+def loadTimings(path: Path = TIMINGS_PATH) -> t.Dict[str, float]:
+    if not path.exists():
+        return dict()
+    return json.loads(path.read_text())
+
+
+def saveTimings(timings: t.Dict[str, float], path: Path = TIMINGS_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(timings, indent=2, sort_keys=True) + "\n")
+
+
+def schedule(jobs: t.Iterable[Job], timings: t.Dict[str, float]) -> t.List[Job]:
+    """Longest first, so slow parts start early instead of becoming the tail.
+
+    Jobs without a recorded timing go first as they might be the slow ones.
+    """
+    return sorted(jobs, key=lambda job: -timings.get(job.key, math.inf))
+
+
+# === Stored answers ========================================================
+
+# A job's answer and timing are reused while neither its input nor the code it
+# runs changes: the digest covers the input bytes, the day's .py files (utils.py
+# and friends included) and the aoc modules the day imports.
+
+_solutions: t.Dict[t.Tuple[int, int], Solution] = dict()
+
+
+def loadSolution(year: int, day: int) -> Solution:
+    # Kept per process; workers keep their loaded days for later jobs.
+    solution = _solutions.get((year, day))
+    if solution is None:
+        solution = _solutions[year, day] = Solution.load(year, day)
+    return solution
+
+
+def jobDigest(job: Job) -> str:
+    solution = loadSolution(job.year, job.day)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((solution.directory / job.inputName).read_bytes())
+    digest.update(solution.sourceDigest().encode())
+    return digest.hexdigest()
+
+
+def loadAnswers(path: Path = ANSWERS_PATH) -> t.Dict[str, t.Dict[str, t.Any]]:
+    if not path.exists():
+        return dict()
+    return json.loads(path.read_text())
+
+
+def storedResult(
+    job: Job, digest: str, answers: t.Dict[str, t.Dict[str, t.Any]]
+) -> t.Optional[PhaseResult]:
+    entry = answers.get(job.key)
+    if entry is None or entry["digest"] != digest:
+        return None
+    solution = loadSolution(job.year, job.day)
+    return PhaseResult(
+        solution.name,
+        job.inputName,
+        f"part {job.part}",
+        entry["answer"],
+        solution.expected(job.inputName, job.part),
+        Stats([Sample(entry["wall"], entry["cpu"])]),
+        cached=True,
+    )
+
+
+def answerEntry(result: PhaseResult, digest: str) -> t.Dict[str, t.Any]:
+    return {
+        "digest": digest,
+        "answer": jsonAnswer(result.answer),
+        "wall": result.stats.cold.wall,
+        "cpu": result.stats.cold.cpu,
+    }
+
+
+def saveAnswers(answers: t.Dict[str, t.Dict[str, t.Any]], path: Path = ANSWERS_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(answers, indent=2, sort_keys=True) + "\n")
+
+
+# === Workers ===============================================================
+
+
+def runJob(job: Job) -> PhaseResult:
+    # Executed in a worker process
+    solution = loadSolution(job.year, job.day)
+
+    expected = solution.expected(job.inputName, job.part)
+    phase = f"part {job.part}"
+    try:
+        with silenced():
+            model = solution.parseFile(solution.directory / job.inputName)
+            # A worker's earlier jobs must not make this one warm
+            clearMemos()
+            answer, sample = measure(solution.solve, job.part, model)
+    except Exception as error:
+        return PhaseResult(
+            solution.name,
+            job.inputName,
+            phase,
+            None,
+            expected,
+            Stats([Sample(0.0, 0.0)]),
+            error=repr(error),
+        )
+    return PhaseResult(
+        solution.name, job.inputName, phase, answer, expected, Stats([sample])
+    )
+
+
+@dataclass
+class SweepReport:
+    results: t.List[PhaseResult]
+    wall: float
+    workers: int
+    cached: int = 0
+
+    @property
+    def serial(self) -> float:
+        return sum(result.stats.cold.wall for result in self.results)
+
+    def asDict(self) -> t.Dict[str, t.Any]:
+        return {
+            "wall": self.wall,
+            "serial": self.serial,
+            "workers": self.workers,
+            "cached": self.cached,
+            "results": [result.asDict() for result in self.results],
+        }
+
+
+def sweep(
+    jobs: t.Sequence[Job],
+    workers: t.Optional[int] = None,
+    timingsPath: Path = TIMINGS_PATH,
+    answersPath: t.Optional[Path] = ANSWERS_PATH,
+    force: bool = False,
+) -> SweepReport:
+    """Run the jobs; with an answers file, unchanged jobs are not run again
+    unless ``force`` is set."""
+    workers = workers or os.cpu_count() or 1
+    timings = loadTimings(timingsPath)
+    answers = loadAnswers(answersPath) if answersPath else dict()
+
+    start = time.perf_counter()
+    byJob: t.Dict[Job, PhaseResult] = dict()
+    digests = {job: jobDigest(job) for job in jobs} if answersPath else dict()
+    if not force:
+        for job, digest in digests.items():
+            result = storedResult(job, digest, answers)
+            if result is not None:
+                byJob[job] = result
+    pending = schedule([job for job in jobs if job not in byJob], timings)
+
+    if pending:
+        # Imported here: multiprocessing is slow to import and a sweep that is
+        # answered from the store never needs it
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            # Workers take submitted jobs in order, so submitting longest-first
+            # is enough to get longest-first execution.
+            futures = {pool.submit(runJob, job): job for job in pending}
+            for future in as_completed(futures):
+                byJob[futures[future]] = future.result()
+    wall = time.perf_counter() - start
+
+    for job in pending:
+        result = byJob[job]
+        if result.error is None:
+            timings[job.key] = result.stats.cold.wall
+            if answersPath:
+                answers[job.key] = answerEntry(result, digests[job])
+    saveTimings(timings, timingsPath)
+    if answersPath:
+        saveAnswers(answers, answersPath)
+
+    cached = len(jobs) - len(pending)
+    return SweepReport([byJob[job] for job in jobs], wall, workers, cached)
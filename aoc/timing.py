@@ -0,0 +1,81 @@
+import math
+import statistics
+import time
+import typing as t
+from dataclasses import dataclass
+
+
+@dataclass
+class Sample:
+    wall: float
+    cpu: float
+
+
+def measure(func: t.Callable[..., t.Any], *args) -> t.Tuple[t.Any, Sample]:
+    wallStart, cpuStart = time.perf_counter(), time.process_time()
+    result = func(*args)
+    sample = Sample(time.perf_counter() - wallStart, time.process_time() - cpuStart)
+    return result, sample
+
+
+def percentile(values: t.Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    low, high = math.floor(position), math.ceil(position)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+@dataclass
+class Stats:
+    """Timings for repeated calls; the first call is cold, the rest are warm."""
+
+    samples: t.List[Sample]
+
+    @property
+    def cold(self) -> Sample:
+        return self.samples[0]
+
+    @property
+    def warm(self) -> t.List[Sample]:
+        return self.samples[1:] or self.samples
+
+    @property
+    def min(self) -> float:
+        return min(s.wall for s in self.warm)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(s.wall for s in self.warm)
+
+    @property
+    def p95(self) -> float:
+        return percentile([s.wall for s in self.warm], 0.95)
+
+    @property
+    def cpu(self) -> float:
+        return statistics.median(s.cpu for s in self.warm)
+
+
+def formatBytes(size: float) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def formatDuration(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.0f} us"
+
+
+def rejectOutliers(values: t.Sequence[float]) -> t.List[float]:
+    """Drop values outside Tukey's fences (1.5 IQR beyond the quartiles)."""
+    if len(values) < 4:
+        return list(values)
+    q1, q3 = percentile(values, 0.25), percentile(values, 0.75)
+    spread = 1.5 * (q3 - q1)
+    return [value for value in values if q1 - spread <= value <= q3 + spread]
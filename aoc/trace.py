@@ -0,0 +1,122 @@
+import atexit
+import os
+import sys
+import typing as t
+
+# Trace points for the solvers. A tracer's level methods are swapped for a
+# no-op while the level is disabled, so a disabled trace point costs one call
+# and never formats its message. Messages use lazy %-formatting:
+#
+#     trace = getTracer("2024/02")
+#     trace.debug("line %d: %s", lineNr, level)
+#
+# Building an expensive message (rendering a map) should be guarded with
+# ``if trace.enabled(DEBUG):``. Enabled output goes to a buffered sink, not
+# stdout. Levels are configured per category with a spec such as
+# "info,2024/06=debug", from --trace or the AOC_TRACE environment variable.
+
+DEBUG = 10
+INFO = 20
+OFF = 100
+
+LEVELS = {"debug": DEBUG, "info": INFO, "off": OFF}
+
+
+def ignore(*args):
+    pass
+
+
+class Sink:
+    """Collects trace lines and writes them out in large chunks."""
+
+    def __init__(self, path: t.Optional[str] = None, bufferLines: int = 10000):
+        self.path = path
+        self.bufferLines = bufferLines
+        self.lines: t.List[str] = list()
+        self.file: t.Optional[t.TextIO] = None
+
+    def write(self, line: str):
+        self.lines.append(line)
+        if len(self.lines) >= self.bufferLines:
+            self.flush()
+
+    def flush(self):
+        if not self.lines:
+            return
+        if self.file is None:
+            self.file = open(self.path, "a") if self.path else sys.stderr
+        self.file.write("\n".join(self.lines) + "\n")
+        self.file.flush()
+        self.lines.clear()
+
+    def close(self):
+        self.flush()
+        if self.file is not None and self.file is not sys.stderr:
+            self.file.close()
+        self.file = None
+
+
+def parseSpec(spec: str) -> t.Dict[str, int]:
+    """ "info,2024/06=debug" -> {"": INFO, "2024/06": DEBUG}"""
+    levels: t.Dict[str, int] = dict()
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        category, _, level = item.rpartition("=")
+        levels[category] = LEVELS[level.lower()]
+    return levels
+
+
+class Tracer:
+    def __init__(self, category: str):
+        self.category = category
+        self.level = OFF
+        self.refresh()
+
+    def refresh(self):
+        self.level = levelFor(self.category)
+        self.debug = self.emitter("DEBUG") if self.level <= DEBUG else ignore
+        self.info = self.emitter("INFO") if self.level <= INFO else ignore
+
+    def enabled(self, level: int) -> bool:
+        return self.level <= level
+
+    def emitter(self, levelName: str) -> t.Callable[..., None]:
+        prefix = f"[{self.category}] {levelName}: "
+
+        def emit(message: str, *args):
+            sink.write(prefix + (message % args if args else str(message)))
+
+        return emit
+
+
+levels: t.Dict[str, int] = parseSpec(os.environ.get("AOC_TRACE", ""))
+sink = Sink(os.environ.get("AOC_TRACE_FILE"))
+tracers: t.Dict[str, Tracer] = dict()
+
+
+@atexit.register
+def closeSink():
+    sink.close()
+
+
+def levelFor(category: str) -> int:
+    # The longest configured prefix wins; "" is the default for everything
+    matches = [prefix for prefix in levels if category.startswith(prefix)]
+    return levels[max(matches, key=len)] if matches else OFF
+
+
+def getTracer(category: str) -> Tracer:
+    if category not in tracers:
+        tracers[category] = Tracer(category)
+    return tracers[category]
+
+
+def configure(spec: t.Optional[str] = None, path: t.Optional[str] = None):
+    global sink
+    if spec is not None:
+        levels.clear()
+        levels.update(parseSpec(spec))
+    if path is not None:
+        sink.close()
+        sink = Sink(path)
+    for tracer in tracers.values():
+        tracer.refresh()
@@ -0,0 +1,290 @@
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import sys
+import time
+import traceback
+import types
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.runner import PhaseResult, formatReport, silenced
+from aoc.solutions import PACKAGE, PARTS, Solution, aocImports, importClosure
+from aoc.timing import Sample, Stats, measure
+
+# A long-lived process for the edit-run cycle. It keeps the interpreter, numpy,
+# the day modules and their parsed models loaded, polls the files they depend
+# on and, when one is saved, re-runs only what the change can affect:
+#
+#   an input file           parse that input again, then both parts on it
+#   solution.py             reload the day, re-run the parts whose code changed
+#                           and parse again only if parse's code changed
+#   a helper or aoc module  reload it and the aoc modules importing it, each
+#                           after what it imports, then the day; parse again
+#
+# "Code" of a function is its source plus the source of the module-level
+# functions, classes and constants it reaches by name, so editing solve2 does
+# not re-run part 1 and editing a dataclass used by parse does parse again.
+# Reused models keep the instances of the previous load, whose classes have
+# the same source.
+
+Stamp = t.Tuple[int, int]
+
+
+def stamp(path: Path) -> t.Optional[Stamp]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def codeNames(code: types.CodeType) -> t.Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from codeNames(const)
+
+
+SIMPLE = (int, float, str, bytes, bool, type(None), tuple, frozenset)
+
+
+def codeDigest(module: types.ModuleType, name: str) -> str:
+    """Digest of a module-level object and everything it reaches by name."""
+    digest = hashlib.blake2b(digest_size=16)
+    seen: t.Set[str] = set()
+    pending = [name]
+    while pending:
+        name = pending.pop()
+        if name in seen or name not in vars(module):
+            continue
+        seen.add(name)
+        value = vars(module)[name]
+        if isinstance(value, SIMPLE):
+            digest.update(f"{name}={value!r}\n".encode())
+            continue
+        if getattr(value, "__module__", None) != module.__name__:
+            continue
+        try:
+            digest.update(inspect.getsource(value).encode())
+        except (OSError, TypeError):
+            continue
+        if isinstance(value, types.FunctionType):
+            pending += codeNames(value.__code__)
+        elif isinstance(value, type):
+            for member in vars(value).values():
+                member = getattr(member, "__func__", member)
+                if isinstance(member, types.FunctionType):
+                    pending += codeNames(member.__code__)
+    return digest.hexdigest()
+
+
+def dropBytecode(path: Path):
+    # A save within the same second and with the same size would otherwise
+    # load the stale .pyc
+    if path.suffix == ".py":
+        Path(importlib.util.cache_from_source(str(path))).unlink(missing_ok=True)
+
+
+# === Days ==================================================================
+
+
+@dataclass
+class WatchedDay:
+    solution: Solution
+    parts: t.Sequence[int]
+    inputNames: t.Optional[t.Sequence[str]]
+    digests: t.Dict[str, str] = field(default_factory=dict)
+    stamps: t.Dict[Path, t.Optional[Stamp]] = field(default_factory=dict)
+    models: t.Dict[str, t.Any] = field(default_factory=dict)
+
+    @property
+    def functions(self) -> t.List[str]:
+        return ["parse", *(f"solve{part}" for part in self.parts)]
+
+    def inputs(self) -> t.List[Path]:
+        return [
+            path
+            for path in self.solution.inputs()
+            if not self.inputNames or path.name in self.inputNames
+        ]
+
+    def watchedFiles(self) -> t.List[Path]:
+        return self.solution.sourceFiles() + self.inputs()
+
+    def refresh(self):
+        self.digests = {
+            name: codeDigest(self.solution.module, name) for name in self.functions
+        }
+        self.stamps = {path: stamp(path) for path in self.watchedFiles()}
+
+    def changedFiles(self) -> t.List[Path]:
+        return [path for path, old in self.stamps.items() if stamp(path) != old]
+
+    def reload(self) -> t.Set[str]:
+        """Load the day again; returns the functions whose code changed."""
+        for path in self.solution.directory.glob("*.py"):
+            dropBytecode(path)
+        solution = Solution.load(self.solution.year, self.solution.day)
+        before, self.solution = self.digests, solution
+        self.refresh()
+        return {
+            name for name in self.functions if before.get(name) != self.digests[name]
+        }
+
+
+def runPhase(
+    day: WatchedDay, inputPath: Path, phase: str, func: t.Callable[[], t.Any]
+) -> t.Tuple[t.Any, PhaseResult]:
+    solution = day.solution
+    part = int(phase.split()[-1]) if phase.startswith("part") else None
+    expected = solution.expected(inputPath.name, part) if part else None
+    try:
+        with silenced():
+            answer, sample = measure(func)
+    except Exception as error:
+        traceback.print_exc()
+        stats = Stats([Sample(0.0, 0.0)])
+        return None, PhaseResult(
+            solution.name, inputPath.name, phase, None, expected, stats, repr(error)
+        )
+    shown = None if part is None else answer
+    return answer, PhaseResult(
+        solution.name, inputPath.name, phase, shown, expected, Stats([sample])
+    )
+
+
+def runDay(
+    day: WatchedDay,
+    parts: t.Collection[int],
+    inputNames: t.Optional[t.Collection[str]] = None,
+) -> t.List[PhaseResult]:
+    """Run ``parts`` on the given inputs (default all), parsing where needed."""
+    results: t.List[PhaseResult] = list()
+    solution = day.solution
+    for inputPath in day.inputs():
+        name = inputPath.name
+        if inputNames is not None and name not in inputNames:
+            continue
+        if name not in day.models:
+            model, result = runPhase(
+                day,
+                inputPath,
+                "parse",
+                lambda: solution.parseFile(inputPath),
+            )
+            results.append(result)
+            if result.error is not None:
+                continue
+            day.models[name] = model
+        for part in sorted(parts):
+            model = day.models[name]
+            _, result = runPhase(
+                day, inputPath, f"part {part}", lambda: solution.solve(part, model)
+            )
+            results.append(result)
+    return results
+
+
+# === Watching ==============================================================
+
+
+def reloadAocModule(path: Path):
+    for name, module in list(sys.modules.items()):
+        if name.startswith("aoc.") and getattr(module, "__file__", None) == str(path):
+            dropBytecode(path)
+            importlib.reload(module)
+
+
+def reloadOrder(changed: t.Iterable[Path], files: t.Iterable[Path]) -> t.List[Path]:
+    """``changed`` and the ``files`` importing them, each after what it imports."""
+    changed = set(changed)
+    affected = {path for path in files if importClosure([path]) & changed}
+    order: t.List[Path] = list()
+    seen: t.Set[Path] = set()
+
+    def visit(path: Path):
+        if path in seen:
+            return
+        seen.add(path)
+        # Import cycles (aoc.render names aoc.grid for type checking only)
+        # are cut where they are met again
+        for imported in sorted(aocImports(path) & affected):
+            visit(imported)
+        order.append(path)
+
+    for path in sorted(affected):
+        visit(path)
+    return order
+
+
+def reloadAocModules(changed: t.Iterable[Path], files: t.Iterable[Path]):
+    """Reload the changed aoc modules and those among ``files`` that import
+    them, so that none keeps names bound to a stale module."""
+    aocFiles = [path for path in files if path.is_relative_to(PACKAGE)]
+    for path in reloadOrder(changed, aocFiles):
+        reloadAocModule(path)
+
+
+def update(day: WatchedDay) -> t.Optional[t.List[PhaseResult]]:
+    """Re-run what the changed files affect; None when nothing changed."""
+    changed = day.changedFiles()
+    if not changed:
+        return None
+    day.stamps.update({path: stamp(path) for path in changed})
+    sources = [path for path in changed if path.suffix == ".py"]
+    inputs = {path.name for path in changed if path.suffix != ".py"}
+    for name in inputs:
+        day.models.pop(name, None)
+    if not sources:
+        return runDay(day, day.parts, inputs)
+
+    helpers = [path for path in sources if path.parent != day.solution.directory]
+    reloadAocModules(helpers, day.solution.sourceFiles())
+    try:
+        functions = day.reload()
+    except Exception:
+        traceback.print_exc()
+        print(f"{day.solution.name}: keeping the previous version", file=sys.stderr)
+        return None
+    if "parse" in functions or any(path.name != "solution.py" for path in sources):
+        day.models.clear()
+        return runDay(day, day.parts)
+    parts = {int(name[len("solve") :]) for name in functions if name != "parse"}
+    results = runDay(day, parts)
+    # Parts whose code is unchanged still run on changed inputs
+    return results + runDay(day, set(day.parts) - parts, inputs)
+
+
+def watch(
+    year: int,
+    days: t.Iterable[int],
+    parts: t.Sequence[int] = PARTS,
+    inputNames: t.Optional[t.Sequence[str]] = None,
+    interval: float = 0.05,
+    out: t.TextIO = sys.stdout,
+):
+    watched = list()
+    for day in days:
+        state = WatchedDay(Solution.load(year, day), parts, inputNames)
+        state.refresh()
+        watched.append(state)
+        print(formatReport(runDay(state, parts)), file=out, flush=True)
+    print(f"\nWatching {len(watched)} day(s); Ctrl-C stops", file=out, flush=True)
+
+    while True:
+        time.sleep(interval)
+        for state in watched:
+            start = time.perf_counter()
+            results = update(state)
+            if results is None:
+                continue
+            if results:
+                print("\n" + formatReport(results), file=out)
+            else:
+                print(f"\n{state.solution.name}: nothing to re-run", file=out)
+            elapsed = (time.perf_counter() - start) * 1e3
+            print(f"{state.solution.name} updated in {elapsed:.1f} ms", file=out)
+            out.flush()
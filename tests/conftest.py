@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# The aoc package is used from the checkout, not installed
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,55 @@
+import pytest
+
+from aoc.bench import Measurement, compare
+from aoc.timing import rejectOutliers
+
+
+def test_fewValuesAreAllKept():
+    assert rejectOutliers([1.0, 100.0, 1000.0]) == [1.0, 100.0, 1000.0]
+
+
+def test_valuesBeyondTheFencesAreDropped():
+    values = [1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 10.0]
+    assert rejectOutliers(values) == values[:-1]
+
+
+def test_valuesOnTheFencesAreKept():
+    # Quartiles 1 and 2: the fences are at -0.5 and 3.5
+    assert rejectOutliers([1.0, 1.0, 2.0, 2.0, 3.5]) == [1.0, 1.0, 2.0, 2.0, 3.5]
+
+
+def measurement(median, low=None, memory=1000):
+    return Measurement(median, median if low is None else low, median, memory, 5, 0)
+
+
+def regressions(current, **thresholds):
+    changes = compare({"day": measurement(1.0)}, {"day": current}, **thresholds)
+    return {change.metric: change.regressed for change in changes}
+
+
+@pytest.mark.parametrize(
+    "current, slower",
+    [
+        (measurement(1.05), False),  # within 10%
+        (measurement(1.2, low=1.01), True),
+        # The fastest run still beat the baseline: noise, not a regression
+        (measurement(1.2, low=0.99), False),
+        (measurement(0.5), False),
+    ],
+)
+def test_timeThreshold(current, slower):
+    assert regressions(current)["time"] is slower
+
+
+def test_timeThresholdIsConfigurable():
+    assert regressions(measurement(1.2), threshold=0.25)["time"] is False
+    assert regressions(measurement(1.2), threshold=0.15)["time"] is True
+
+
+@pytest.mark.parametrize("memory, heavier", [(1100, False), (1101, True), (10, False)])
+def test_memoryThreshold(memory, heavier):
+    assert regressions(measurement(1.0, memory=memory))["memory"] is heavier
+
+
+def test_newKeysAreNotCompared():
+    assert compare({}, {"day": measurement(2.0)}) == []
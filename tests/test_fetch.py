@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from aoc import fetch
+from aoc.fetch import StubServer, parseDays
+
+
+def test_parseDays():
+    assert parseDays("1-5,8,10-12") == [1, 2, 3, 4, 5, 8, 10, 11, 12]
+    assert parseDays("25") == [25]
+    # Repeats are dropped, the first order kept
+    assert parseDays("3,1-4") == [3, 1, 2, 4]
+
+
+@pytest.mark.parametrize("text", ["0", "24-26", "x", "1,,2"])
+def test_parseDaysRejects(text):
+    with pytest.raises(ValueError):
+        parseDays(text)
+
+
+def test_stubAnswersBadPathsWith404():
+    stub = StubServer(size=3, latency=0)
+    session = {"cookie": "session=test"}
+    assert stub.respond("/2024/day/x/input", session)[0] == 404
+    assert stub.respond("/2024/days/1/input", session)[0] == 404
+    assert stub.respond("/2024/day/20/input", session)[0] == 404
+    assert stub.respond("/2024/day/1/input", {})[0] == 400
+    assert stub.respond("/2024/day/1/input", session)[0] == 200
+
+
+def fetchDays(tmp_path, days, **options):
+    targets = fetch.buildTargets(
+        2024, days, {"default": "test"}, "{day:02d}.txt", tmp_path / "files"
+    )
+
+    async def run():
+        stub = StubServer(size=3, latency=0)
+        baseUrl = await stub.start()
+        try:
+            store = fetch.Store(tmp_path / "store")
+            report = await fetch.fetchAll(
+                targets, baseUrl, concurrency=1, rate=0, store=store, **options
+            )
+        finally:
+            await stub.stop()
+        return report, stub
+
+    return asyncio.run(run())
+
+
+def test_fetchReusesTheConnection(tmp_path):
+    report, stub = fetchDays(tmp_path, [1, 2, 3])
+    assert [outcome.source for outcome in report.outcomes] == ["download"] * 3
+    assert [outcome.written for outcome in report.outcomes] == ["written"] * 3
+    assert report.requests == 3
+    # Keep-alive: one connection for all three with a pool of one
+    assert report.connections == stub.connections == 1
+    assert (tmp_path / "files" / "02.txt").read_bytes() == stub.body(2024, 2, "test")
+
+
+def test_refreshIsNotModified(tmp_path):
+    fetchDays(tmp_path, [1, 2])
+    report, _ = fetchDays(tmp_path, [1, 2])
+    # Stored and on disk: no request at all
+    assert report.requests == 0
+    assert [outcome.source for outcome in report.outcomes] == ["disk"] * 2
+
+    report, _ = fetchDays(tmp_path, [1, 2], refresh=True)
+    assert report.requests == 2
+    assert [outcome.source for outcome in report.outcomes] == ["not modified"] * 2
+    assert [outcome.written for outcome in report.outcomes] == ["unchanged"] * 2
+
+
+def test_fetchReportsMissingDays(tmp_path):
+    report, _ = fetchDays(tmp_path, [20])
+    (outcome,) = report.outcomes
+    assert outcome.source == "error"
+    assert outcome.error.startswith("HTTP 404")
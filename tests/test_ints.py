@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from aoc import ints
+from aoc.ints import extractIntegers, extractRows
+
+
+def test_minusDirectlyBeforeDigitsIsASign():
+    assert extractRows("p=0,4 v=3,-3").rows() == [[0, 4, 3, -3]]
+    assert extractRows("75|13\n5-3\na--5").rows() == [[75, 13], [5, -3], [-5]]
+
+
+def test_unsignedIgnoresMinus():
+    assert extractRows("p=0,4 v=3,-3", signed=False).rows() == [[0, 4, 3, 3]]
+
+
+def test_linesWithoutIntegersAreEmptyRows():
+    rows = extractRows("-7\n\n8 9\n")
+    assert rows.rows() == [[-7], [], [8, 9]]
+    assert len(rows) == 3
+
+
+def test_emptyInput():
+    assert len(extractRows("")) == 0
+    assert extractIntegers("").tolist() == []
+
+
+def test_longIntegersStayExact():
+    assert extractIntegers("1234567890123456789012 5").tolist() == [
+        1234567890123456789012,
+        5,
+    ]
+
+
+def test_matrixNeedsEqualRows():
+    assert extractRows("1 2\n3 4").matrix(2).tolist() == [[1, 2], [3, 4]]
+    with pytest.raises(ValueError):
+        extractRows("1 2\n3").matrix(2)
+
+
+@pytest.mark.parametrize("chunkSize", [1, 2, 3, 5, 8, 13])
+def test_chunkEdgesDoNotSplitNumbers(monkeypatch, chunkSize):
+    rng = random.Random(chunkSize)
+    lines = [
+        " ".join(str(rng.randint(-(10**6), 10**6)) for _ in range(rng.randint(0, 6)))
+        for _ in range(200)
+    ]
+    # A line longer than a chunk has to end up in one chunk too
+    lines.append("-" + "9" * 17 + " 12345678901234567890")
+    text = "\n".join(lines) + "\n"
+    expected = [[int(word) for word in line.split()] for line in lines]
+
+    monkeypatch.setattr(ints, "CHUNK_SIZE", chunkSize)
+    assert extractRows(text).rows() == expected
@@ -0,0 +1,87 @@
+import sys
+
+import pytest
+
+from aoc import memo
+from aoc.memo import Memo, memoize
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # Memos made by a test are not reported or saved with the real ones
+    monkeypatch.setattr(memo, "registry", dict())
+    return memo.registry
+
+
+def test_fullMemoEvictsLeastRecentlyUsed():
+    cache = Memo("test lru", maxSize=2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    assert cache.lookup("a") == 1  # now b is the oldest
+    cache.store("c", 3)
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.lookup("b") is memo.MISSING
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+
+def test_memoizedCallsEvict(registry):
+    calls = list()
+
+    @memoize("test calls", maxSize=2)
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    assert [square(v) for v in (1, 2, 1, 3, 2)] == [1, 4, 1, 9, 4]
+    # 2 was the least recently used when 3 came in
+    assert calls == [1, 2, 3, 2]
+    assert square.memo.evictions == 2
+    assert list(square.memo.entries) == [(3,), (2,)]
+
+
+def test_keyPicksTheCachedArguments(registry):
+    @memoize("test key", key=lambda value, model: value)
+    def lookup(value, model):
+        return model[value]
+
+    assert lookup(1, {1: "a"}) == "a"
+    assert lookup(1, {1: "b"}) == "a"
+
+
+def test_generatorRecursionRunsOnAnExplicitStack(registry):
+    @memoize("test depth")
+    def depth(n):
+        if n == 0:
+            return 0
+        return (yield n - 1) + 1
+
+    # Far deeper than Python's own recursion would go
+    n = sys.getrecursionlimit() * 20
+    assert depth(n) == n
+    assert depth.memo.misses == n + 1
+    assert depth(n - 1) == n - 1
+    assert depth.memo.hits == 1
+
+
+def test_generatorRecursionSharesSubResults(registry):
+    @memoize("test fibonacci")
+    def fibonacci(n):
+        if n < 2:
+            return n
+        return (yield n - 1) + (yield n - 2)
+
+    assert fibonacci(90) == 2880067194370816120
+    assert fibonacci.memo.misses == 91
+    assert fibonacci.memo.hits == 88
+
+
+def test_generatorRecursionEvictsToo(registry):
+    @memoize("test bounded", maxSize=4)
+    def total(n):
+        if n == 0:
+            return 0
+        return (yield n - 1) + n
+
+    assert total(100) == 5050
+    assert len(total.memo) == 4
+    assert total.memo.evictions == 101 - 4
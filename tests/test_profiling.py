@@ -0,0 +1,67 @@
+import re
+import types
+
+from aoc.profiling import collapsedStacks, profileCall
+
+MAIN, A, B, C = (
+    ("m.py", 1, "main"),
+    ("m.py", 2, "a"),
+    ("m.py", 3, "b"),
+    ("m.py", 4, "c"),
+)
+
+
+def stats(entries):
+    # Only the ``stats`` table of pstats.Stats is read:
+    # function -> (calls, primitive calls, own time, cumulative, callers)
+    return types.SimpleNamespace(stats=entries)
+
+
+def test_timeIsPushedDownByEdge():
+    # main calls a and b, both of which call c
+    collapsed = collapsedStacks(
+        stats(
+            {
+                MAIN: (1, 1, 1.0, 10.0, {}),
+                A: (1, 1, 2.0, 6.0, {MAIN: (1, 1, 2.0, 6.0)}),
+                B: (1, 1, 1.0, 3.0, {MAIN: (1, 1, 1.0, 3.0)}),
+                C: (2, 2, 6.0, 6.0, {A: (1, 1, 4.0, 4.0), B: (1, 1, 2.0, 2.0)}),
+            }
+        )
+    )
+    assert collapsed == {
+        "m.py:main:1": 1_000_000,
+        "m.py:main:1;m.py:a:2": 2_000_000,
+        "m.py:main:1;m.py:a:2;m.py:c:4": 4_000_000,
+        "m.py:main:1;m.py:b:3": 1_000_000,
+        "m.py:main:1;m.py:b:3;m.py:c:4": 2_000_000,
+    }
+
+
+def test_recursionIsNotFollowedAgain():
+    collapsed = collapsedStacks(
+        stats(
+            {
+                MAIN: (1, 1, 1.0, 4.0, {}),
+                A: (5, 1, 3.0, 3.0, {MAIN: (1, 1, 3.0, 3.0), A: (4, 0, 2.0, 2.0)}),
+            }
+        )
+    )
+    assert collapsed == {"m.py:main:1": 1_000_000, "m.py:main:1;m.py:a:2": 3_000_000}
+
+
+def inner(n):
+    return sum(i * i for i in range(n))
+
+
+def outer(n):
+    return inner(n) + inner(n // 2)
+
+
+def test_profiledCallNestsCallees():
+    result, profile = profileCall(outer, 200_000)
+    assert result == outer(200_000)
+    collapsed = collapsedStacks(profile)
+    assert any(re.search(r":outer:\d+;.*:inner:", stack) for stack in collapsed)
+    assert not any(re.search(r":inner:.*:outer:", stack) for stack in collapsed)
+    assert all(micros > 0 for micros in collapsed.values())